@@ -40,12 +40,18 @@ from .iofunc import (
     read,
     read_output,
     read_output_model,
+    read_output_models,
     read_output_state,
+    iter_output_states,
+    read_output_failure_summary,
     write,
     convert,
     read_load_csv,
     add_cell_dict_data_to_mesh,
     add_point_dict_data_to_mesh,
+    add_cell_array_data_to_mesh,
+    add_point_array_data_to_mesh,
+    add_state_data_to_mesh,
     # write_points_cells,
     # register_format,
     # deregister_format,
@@ -72,12 +78,18 @@ __all__ = [
     "read",
     "read_output",
     "read_output_model",
+    "read_output_models",
     "read_output_state",
+    "iter_output_states",
+    "read_output_failure_summary",
     "write",
     "convert",
     "read_load_csv",
     "add_cell_dict_data_to_mesh",
     "add_point_dict_data_to_mesh",
+    "add_cell_array_data_to_mesh",
+    "add_point_array_data_to_mesh",
+    "add_state_data_to_mesh",
     # Execution
     "run",
     # Core functions and classes
@@ -110,6 +122,7 @@ __all__ = [
     "ReissnerMindlinPlateShellModel",
     "EulerBernoulliBeamModel",
     "TimoshenkoBeamModel",
+    "ModelTable",
     # Exception classes
     "SwiftCompLicenseError",
     "VABSLicenseError",
@@ -1,9 +1,20 @@
 from .builder import build_sg_1d
+from .topology import (
+    CellAdjacency,
+    MeshTopology,
+    NodeCellAdjacency,
+)
 from .mesh import (
     SGMesh,
     check_isolated_nodes,
     renumber_elements,
 )
+from .quality import (
+    QUALITY_METRICS,
+    cell_quality,
+    mesh_quality,
+    quality_summary,
+)
 from .numbering import (
     validate_node_ids,
     validate_element_ids,
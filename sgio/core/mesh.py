@@ -84,6 +84,12 @@ from meshio import Mesh, CellBlock
 from typing import Dict, Tuple, Union
 import numpy as np
 
+from .topology import (
+    CELL_FAMILY_DIM, CELL_FAMILY_FACES, MeshTopology, NodeCellAdjacency,
+    _build_node_cell_adjacency, cell_family,
+)
+
+
 class SGMesh(Mesh):
     """Extended mesh class that inherits from meshio.Mesh.
 
@@ -145,6 +151,36 @@ class SGMesh(Mesh):
                     )
 
 
+    @property
+    def topology(self) -> MeshTopology:
+        """Topology of the cells (adjacency, edges, faces, boundary).
+
+        The topology is built when first used and cached. It is rebuilt
+        when the points or the connectivity arrays of the cell blocks are
+        replaced; connectivity arrays modified in place are not detected.
+
+        Returns
+        -------
+        MeshTopology
+        """
+        key = (len(self.points), tuple(_cb.data for _cb in self.cells))
+        cache = getattr(self, '_topology', None)
+        if cache is None or not _same_cache_key(cache[0], key):
+            cache = (key, MeshTopology(self.cells, len(self.points)))
+            self._topology = cache
+        return cache[1]
+
+    def get_node_cell_adjacency(self) -> NodeCellAdjacency:
+        """Get the node to cell adjacency of the mesh in CSR format.
+
+        The adjacency is cached with :attr:`topology`.
+
+        Returns
+        -------
+        NodeCellAdjacency
+        """
+        return self.topology.node_cells
+
     def get_cell_block_by_type(self, cell_type):
         """
         """
@@ -201,89 +237,262 @@ class SGMesh(Mesh):
 
 
 
-def check_isolated_nodes(mesh: Union[SGMesh, Mesh]):
+def _same_cache_key(key1: tuple, key2: tuple) -> bool:
+    """Check that two (npoints, connectivity arrays) keys hold the same arrays."""
+    return (
+        key1[0] == key2[0] and len(key1[1]) == len(key2[1])
+        and all(_a is _b for _a, _b in zip(key1[1], key2[1]))
+    )
+
+
+def check_isolated_nodes(mesh: Union[SGMesh, Mesh], return_adjacency: bool = False):
     """
     Check if there are isolated/unconnected nodes in the mesh.
 
-    Go through all cells and check if every node is used at least once.
+    Count the cells of every node over the concatenated connectivity of all
+    cell blocks, and check that every node is used at least once.
+
+    Parameters
+    ----------
+    mesh : SGMesh or Mesh
+        Mesh to check.
+    return_adjacency : bool, optional
+        Return the node to cell adjacency in CSR format instead of lists.
+        Default is False.
 
-    Create a list of cell ids for each node:
+    Returns
+    -------
+    node_cell_ids : list or NodeCellAdjacency
+        Cells of each node. By default, a list of cell ids for each node:
 
-    ..  code-block::
+        ..  code-block::
 
-        node_cell_ids = [
-            [
-                (cell_block_id, cell_id_in_block),
+            node_cell_ids = [
+                [
+                    (cell_block_id, cell_id_in_block),
+                    ...
+                ],
                 ...
-            ],
-            ...
-        ]
+            ]
+
+        If ``return_adjacency`` is True, a :class:`NodeCellAdjacency`,
+        cached on :class:`SGMesh` objects.
+    nodes_in_cells : list or np.ndarray
+        Sorted indices of the nodes used by the cells.
+
+    Raises
+    ------
+    ValueError
+        If some nodes are not used by any cell.
+    """
+    if isinstance(mesh, SGMesh):
+        adjacency = mesh.get_node_cell_adjacency()
+    else:
+        adjacency = _build_node_cell_adjacency(mesh.cells, len(mesh.points))
+
+    counts = adjacency.counts()
+    isolated_nodes = np.flatnonzero(counts[:len(mesh.points)] == 0)
+    if isolated_nodes.size > 0:
+        raise ValueError(f"Isolated nodes found: {isolated_nodes.tolist()}")
+
+    nodes_in_cells = np.flatnonzero(counts)
+    if return_adjacency:
+        return adjacency, nodes_in_cells
+
+    pairs = list(zip(adjacency.block_id.tolist(), adjacency.indices.tolist()))
+    indptr = adjacency.indptr.tolist()
+    node_cell_ids = [pairs[_i:_j] for _i, _j in zip(indptr[:-1], indptr[1:])]
+
+    return node_cell_ids, nodes_in_cells.tolist()
+
+
+# Corner nodes of each cell family. The orientation of a cell is taken
+# from its corners only, so that it also holds for the higher-order types.
+CELL_FAMILY_CORNERS = {
+    'line': 2, 'triangle': 3, 'quad': 4,
+    'tetra': 4, 'pyramid': 5, 'wedge': 6, 'hexahedron': 8,
+}
+
+# Local node permutation reversing the orientation of each cell type
+# (meshio node ordering). Each permutation is its own inverse.
+CELL_REVERSE_PERMUTATION = {
+    'triangle': [0, 2, 1],
+    'triangle6': [0, 2, 1, 5, 4, 3],
+    'quad': [0, 3, 2, 1],
+    'quad8': [0, 3, 2, 1, 7, 6, 5, 4],
+    'quad9': [0, 3, 2, 1, 7, 6, 5, 4, 8],
+    'tetra': [1, 0, 2, 3],
+    'tetra10': [1, 0, 2, 3, 4, 6, 5, 8, 7, 9],
+    'pyramid': [0, 3, 2, 1, 4],
+    'wedge': [0, 2, 1, 3, 5, 4],
+    'wedge15': [0, 2, 1, 3, 5, 4, 8, 7, 6, 11, 10, 9, 12, 14, 13],
+    'wedge18': [
+        0, 2, 1, 3, 5, 4, 8, 7, 6, 11, 10, 9, 12, 14, 13, 17, 16, 15
+    ],
+    'hexahedron': [0, 3, 2, 1, 4, 7, 6, 5],
+    'hexahedron20': [
+        0, 3, 2, 1, 4, 7, 6, 5, 11, 10, 9, 8, 15, 14, 13, 12, 16, 19, 18, 17
+    ],
+    'hexahedron27': [
+        0, 3, 2, 1, 4, 7, 6, 5, 11, 10, 9, 8, 15, 14, 13, 12, 16, 19, 18, 17,
+        22, 23, 20, 21, 24, 25, 26
+    ],
+}
+
+# In-plane coordinate columns of each model space of 2D cells
+MODEL_SPACE_AXES = {'xy': (0, 1), 'yz': (1, 2), 'zx': (2, 0)}
+
+# Number of cells gathered at a time when computing the signed measures
+ORDERING_CHUNK_ROWS = 65536
+
+
+def _face_triangles(family: str) -> np.ndarray:
+    """Triangles of the outward oriented faces of a 3D cell family.
+
+    Quadrilateral faces are split along their first diagonal. The
+    triangles touching corner 0 are left out, since they add nothing to
+    the volume computed relative to corner 0.
     """
-    # print(f'len(mesh.points): {len(mesh.points)}')
-    nodes_in_cells = []
-    node_cell_ids = [[] for _ in mesh.points]
-    # print(f'len(node_cell_ids): {len(node_cell_ids)}')
-    for _cb_id, _cb in enumerate(mesh.cells):
-        for _ci, _nis in enumerate(_cb.data):
-            for _ni in _nis:
-                node_cell_ids[_ni].append((_cb_id, _ci))
-                nodes_in_cells.append(_ni)
+    triangles = []
+    for face in CELL_FAMILY_FACES[family]:
+        for k in range(1, len(face) - 1):
+            triangle = (face[0], face[k], face[k + 1])
+            if 0 not in triangle:
+                triangles.append(triangle)
+    return np.array(triangles)
 
-    nodes_in_cells = list(set(nodes_in_cells))
-    nodes_in_cells.sort()
 
-    # Check if any node is not in any cell
-    isolated_nodes = [i for i, _ncids in enumerate(node_cell_ids) if not _ncids]
-    if isolated_nodes:
-        raise ValueError(f"Isolated nodes found: {isolated_nodes}")
+def _infer_model_space(points: np.ndarray) -> str:
+    """Get the model space of a planar mesh from its flat coordinate.
 
-    return node_cell_ids, nodes_in_cells
+    The plane normal to the coordinate with the smallest range is used,
+    preferring 'xy', then 'yz', then 'zx'.
+    """
+    extent = np.ptp(points, axis=0) if len(points) > 0 else np.zeros(3)
+    normal_axis = {'xy': 2, 'yz': 0, 'zx': 1}
+    return min(normal_axis, key=lambda _space: extent[normal_axis[_space]])
 
 
-def _check_tetra4_ordering(points: np.ndarray, cells: np.ndarray) -> np.ndarray:
-    """Return indices of tetra4 cells with invalid ordering."""
+def _signed_measure(
+    points: np.ndarray, cells: np.ndarray, cell_type: str, model_space: str = 'xy'
+) -> np.ndarray:
+    """Signed measure of each cell, computed from its corner nodes.
+
+    Line cells get their length, 2D cells their signed area in the model
+    space, and 3D cells their signed volume, from the outward oriented
+    faces of the cell family. The measure of a cell with a valid node
+    ordering is positive.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Point coordinates, shape (npoints, 3).
+    cells : np.ndarray
+        Connectivity of the cells, shape (ncells, nnodes).
+    cell_type : str
+        meshio cell type, e.g. 'quad8'.
+    model_space : str
+        Plane of the 2D cells ('xy', 'yz' or 'zx').
+
+    Returns
+    -------
+    np.ndarray
+        Measure of each cell, shape (ncells,).
+    """
     points = np.asarray(points)
     cells = np.asarray(cells)
+    family = cell_family(cell_type)
+    ncorners = CELL_FAMILY_CORNERS[family]
     if cells.size == 0:
-        return np.array([], dtype=int)
-    if cells.ndim != 2 or cells.shape[1] != 4:
+        return np.empty(0)
+    if cells.ndim != 2 or cells.shape[1] < ncorners:
         raise ValueError(
-            f"Expected tetra4 cells with shape (n, 4), got {cells.shape}"
+            f"Expected {cell_type} cells with shape (n, >={ncorners}), got {cells.shape}"
         )
     if points.ndim != 2 or points.shape[1] != 3:
         raise ValueError(
             f"Expected point coordinates with shape (n, 3), got {points.shape}"
         )
 
-    cell_points = points[cells]
-    p0 = cell_points[:, 0, :]
-    p1 = cell_points[:, 1, :]
-    p2 = cell_points[:, 2, :]
-    p3 = cell_points[:, 3, :]
-    normal = np.cross(p1 - p0, p2 - p0)
-    dot = np.einsum("ij,ij->i", normal, p3 - p0)
-    return np.where(dot <= 0.0)[0]
+    dim = CELL_FAMILY_DIM[family]
+    if dim == 2:
+        try:
+            axes = list(MODEL_SPACE_AXES[model_space])
+        except KeyError:
+            raise ValueError(f"Invalid model space: {model_space}")
+    elif dim == 3:
+        triangles = _face_triangles(family)
+
+    measure = np.empty(len(cells))
+    for start in range(0, len(cells), ORDERING_CHUNK_ROWS):
+        chunk = cells[start:start + ORDERING_CHUNK_ROWS, :ncorners]
+        # Corner coordinates relative to the first corner
+        x = points[chunk]
+        x -= x[:, :1]
+
+        if dim == 1:
+            value = np.sqrt(np.einsum('ij,ij->i', x[:, 1], x[:, 1]))
+        elif dim == 2:
+            u, v = x[:, :, axes[0]], x[:, :, axes[1]]
+            value = 0.5 * np.einsum(
+                'ij,ij->i', u, np.roll(v, -1, axis=1)
+            ) - 0.5 * np.einsum('ij,ij->i', np.roll(u, -1, axis=1), v)
+        else:
+            a, b, c = x[:, triangles[:, 0]], x[:, triangles[:, 1]], x[:, triangles[:, 2]]
+            value = np.einsum('ijk,ijk->i', a, np.cross(b, c)) / 6.0
+
+        measure[start:start + len(chunk)] = value
+
+    return measure
 
 
-def _check_cell_ordering_placeholder(
-    points: np.ndarray,
-    cells: np.ndarray,
-    cell_type: str,
+def _check_ordering(
+    points: np.ndarray, cells: np.ndarray, cell_type: str, model_space: str = 'xy'
 ) -> np.ndarray:
-    """Placeholder for future cell ordering checks."""
-    _ = points
-    _ = cells
-    _ = cell_type
-    return np.array([], dtype=int)
+    """Return indices of cells with a non-positive signed measure."""
+    measure = _signed_measure(points, cells, cell_type, model_space)
+    return np.flatnonzero(measure <= 0.0)
 
 
-def check_cell_ordering(mesh: Union[SGMesh, Mesh]) -> Dict[Tuple[int, str], np.ndarray]:
+def _ordering_cell_blocks(mesh: Union[SGMesh, Mesh], model_space: str = ''):
+    """Yield the cell blocks whose ordering can be checked.
+
+    Yields
+    ------
+    tuple[int, str, np.ndarray]
+        Cell block id, cell type, and indices of the cells with invalid
+        ordering.
+    """
+    if not model_space:
+        model_space = _infer_model_space(np.asarray(mesh.points))
+
+    for cb_id, cell_block in enumerate(mesh.cells):
+        cell_type = cell_block.type
+        try:
+            cell_family(cell_type)
+        except ValueError:
+            continue
+        yield cb_id, cell_type, _check_ordering(
+            mesh.points, cell_block.data, cell_type, model_space
+        )
+
+
+def check_cell_ordering(
+    mesh: Union[SGMesh, Mesh], model_space: str = ''
+) -> Dict[Tuple[int, str], np.ndarray]:
     """Check node ordering for supported cell types.
 
+    A cell has a valid ordering if its signed measure, computed from its
+    corner nodes, is positive: the length of line cells, the area of 2D
+    cells in the model space, and the volume of 3D cells.
+
     Parameters
     ----------
     mesh : SGMesh or meshio.Mesh
         Mesh containing cell blocks to validate.
+    model_space : str, optional
+        Plane of the 2D cells ('xy', 'yz' or 'zx'). Default is the plane
+        normal to the coordinate with the smallest range.
 
     Returns
     -------
@@ -296,29 +505,8 @@ def check_cell_ordering(mesh: Union[SGMesh, Mesh]) -> Dict[Tuple[int, str], np.n
         If any invalid cell ordering is detected.
     """
     invalid_cells = {}
-    placeholder_cell_types = {
-        "line",
-        "triangle",
-        "quad",
-        "tetra10",
-        "hexahedron",
-        "wedge",
-        "pyramid",
-    }
-
-    for cb_id, cell_block in enumerate(mesh.cells):
-        cell_type = cell_block.type
-        if cell_type == "tetra":
-            invalid = _check_tetra4_ordering(mesh.points, cell_block.data)
-        elif cell_type in placeholder_cell_types:
-            invalid = _check_cell_ordering_placeholder(
-                mesh.points,
-                cell_block.data,
-                cell_type,
-            )
-        else:
-            continue
 
+    for cb_id, cell_type, invalid in _ordering_cell_blocks(mesh, model_space):
         if invalid.size > 0:
             invalid_cells[(cb_id, cell_type)] = invalid
 
@@ -333,7 +521,7 @@ def check_cell_ordering(mesh: Union[SGMesh, Mesh]) -> Dict[Tuple[int, str], np.n
 
 
 def get_invalid_cell_ordering_element_ids(
-    mesh: Union[SGMesh, Mesh]
+    mesh: Union[SGMesh, Mesh], model_space: str = ''
 ) -> Dict[Tuple[int, str], np.ndarray]:
     """Return invalid element IDs for supported cell types.
 
@@ -341,6 +529,9 @@ def get_invalid_cell_ordering_element_ids(
     ----------
     mesh : SGMesh or meshio.Mesh
         Mesh containing cell blocks to validate.
+    model_space : str, optional
+        Plane of the 2D cells ('xy', 'yz' or 'zx'). Default is the plane
+        normal to the coordinate with the smallest range.
 
     Returns
     -------
@@ -348,20 +539,10 @@ def get_invalid_cell_ordering_element_ids(
         Mapping of (cell_block_id, cell_type) to arrays of invalid element IDs.
     """
     invalid_element_ids = {}
-    placeholder_cell_types = {
-        "line",
-        "triangle",
-        "quad",
-        "tetra10",
-        "hexahedron",
-        "wedge",
-        "pyramid",
-    }
-    element_offset = 0
+    block_offsets = np.cumsum([0] + [len(_cb.data) for _cb in mesh.cells])
 
-    for cb_id, cell_block in enumerate(mesh.cells):
-        cell_type = cell_block.type
-        count = len(cell_block.data)
+    for cb_id, cell_type, invalid in _ordering_cell_blocks(mesh, model_space):
+        count = len(mesh.cells[cb_id].data)
         if "element_id" in mesh.cell_data and cb_id < len(mesh.cell_data["element_id"]):
             element_ids = np.asarray(mesh.cell_data["element_id"][cb_id], dtype=int)
             if element_ids.shape[0] != count:
@@ -371,37 +552,35 @@ def get_invalid_cell_ordering_element_ids(
                 )
         else:
             element_ids = np.arange(
-                element_offset + 1,
-                element_offset + 1 + count,
+                block_offsets[cb_id] + 1,
+                block_offsets[cb_id] + 1 + count,
                 dtype=int,
             )
 
-        if cell_type == "tetra":
-            invalid = _check_tetra4_ordering(mesh.points, cell_block.data)
-        elif cell_type in placeholder_cell_types:
-            invalid = _check_cell_ordering_placeholder(
-                mesh.points,
-                cell_block.data,
-                cell_type,
-            )
-        else:
-            invalid = np.array([], dtype=int)
-
         if invalid.size > 0:
             invalid_element_ids[(cb_id, cell_type)] = element_ids[invalid]
 
-        element_offset += count
-
     return invalid_element_ids
 
 
-def fix_cell_ordering(mesh: Union[SGMesh, Mesh]) -> Dict[Tuple[int, str], np.ndarray]:
+def fix_cell_ordering(
+    mesh: Union[SGMesh, Mesh], model_space: str = ''
+) -> Dict[Tuple[int, str], np.ndarray]:
     """Fix node ordering for supported cell types.
 
+    The nodes of the cells with a negative signed measure are permuted in
+    place to reverse their orientation, e.g. swapping nodes 0 and 1 of a
+    tetra, along with the matching mid-side nodes of the higher-order
+    types. Degenerate cells, with a zero measure, and line cells are left
+    unchanged.
+
     Parameters
     ----------
     mesh : SGMesh or meshio.Mesh
         Mesh containing cell blocks to validate and fix.
+    model_space : str, optional
+        Plane of the 2D cells ('xy', 'yz' or 'zx'). Default is the plane
+        normal to the coordinate with the smallest range.
 
     Returns
     -------
@@ -409,31 +588,22 @@ def fix_cell_ordering(mesh: Union[SGMesh, Mesh]) -> Dict[Tuple[int, str], np.nda
         Mapping of (cell_block_id, cell_type) to arrays of fixed cell indices.
     """
     fixed_cells = {}
-    placeholder_cell_types = {
-        "line",
-        "triangle",
-        "quad",
-        "tetra10",
-        "hexahedron",
-        "wedge",
-        "pyramid",
-    }
+    if not model_space:
+        model_space = _infer_model_space(np.asarray(mesh.points))
 
     for cb_id, cell_block in enumerate(mesh.cells):
         cell_type = cell_block.type
-        if cell_type == "tetra":
-            invalid = _check_tetra4_ordering(mesh.points, cell_block.data)
-            if invalid.size > 0:
-                data = cell_block.data
-                temp = data[invalid, 0].copy()
-                data[invalid, 0] = data[invalid, 1]
-                data[invalid, 1] = temp
-                fixed_cells[(cb_id, cell_type)] = invalid
-        elif cell_type in placeholder_cell_types:
-            continue
-        else:
+        permutation = CELL_REVERSE_PERMUTATION.get(cell_type)
+        if permutation is None:
             continue
 
+        data = cell_block.data
+        measure = _signed_measure(mesh.points, data, cell_type, model_space)
+        invalid = np.flatnonzero(measure < 0.0)
+        if invalid.size > 0:
+            data[invalid] = data[invalid][:, permutation]
+            fixed_cells[(cb_id, cell_type)] = invalid
+
     return fixed_cells
 
 
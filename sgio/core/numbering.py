@@ -17,6 +17,9 @@ from .format_requirements import FormatNumberingRequirements, get_numbering_requ
 
 _module_logger = logging.getLogger(__name__)
 
+# Number of IDs compared with their expected range at a time
+ID_CHECK_CHUNK_ROWS = 65536
+
 
 def _handle_deprecated_parameter(
     old_name: str,
@@ -521,72 +524,91 @@ def _meets_requirements(
         return True
 
     if id_type == "nodes":
-        ids_array = np.asarray(ids, dtype=int).reshape(-1)
-        if ids_array.size == 0:
-            return True
+        return _ids_meet_requirements(
+            [np.asarray(ids, dtype=int).reshape(-1)],
+            requirements.nodes_start_from,
+            requirements.nodes_consecutive,
+            requirements.allows_zero_id,
+        )
+
+    if id_type == "elements":
+        return _ids_meet_requirements(
+            _element_id_blocks(ids),
+            requirements.elements_start_from,
+            requirements.elements_consecutive,
+            requirements.allows_zero_id,
+        )
+
+    raise ValueError(f"Unknown id_type: {id_type!r}")
 
-        # Basic validity
-        if np.any(ids_array < 0):
-            return False
-        if not requirements.allows_zero_id and np.any(ids_array == 0):
-            return False
-        if np.any(ids_array < requirements.nodes_start_from):
-            return False
-        if np.unique(ids_array).size != ids_array.size:
-            return False
 
-        # Consecutive requirement
-        if requirements.nodes_consecutive:
-            start = requirements.nodes_start_from
-            expected = np.arange(start, start + ids_array.size, dtype=int)
-            return np.array_equal(np.sort(ids_array), expected)
+def _ids_meet_requirements(
+    id_blocks: List[np.ndarray], start: int, consecutive: bool, allows_zero_id: bool
+) -> bool:
+    """Check the IDs of all blocks against one set of numbering rules.
 
+    The blocks are not concatenated. IDs already numbered in order are
+    compared with the expected range ``ID_CHECK_CHUNK_ROWS`` at a time, so
+    that checking the IDs of a mesh before writing it does not allocate
+    memory in proportion to the mesh size. Other IDs are checked by
+    marking each ID in a boolean table instead of sorting them.
+    """
+    size = sum(_block.size for _block in id_blocks)
+    if size == 0:
         return True
 
-    if id_type == "elements":
-        all_ids = _flatten_element_ids(ids)
-        if all_ids.size == 0:
-            return True
+    id_min = min(int(_block.min()) for _block in id_blocks if _block.size)
+    id_max = max(int(_block.max()) for _block in id_blocks if _block.size)
 
-        if np.any(all_ids < 0):
-            return False
-        if not requirements.allows_zero_id and np.any(all_ids == 0):
-            return False
-        if np.any(all_ids < requirements.elements_start_from):
-            return False
-        if np.unique(all_ids).size != all_ids.size:
-            return False
+    # Basic validity
+    if id_min < 0:
+        return False
+    if not allows_zero_id and id_min == 0:
+        return False
+    if id_min < start:
+        return False
 
-        if requirements.elements_consecutive:
-            start = requirements.elements_start_from
-            expected = np.arange(start, start + all_ids.size, dtype=int)
-            return np.array_equal(np.sort(all_ids), expected)
+    if consecutive:
+        # n unique IDs within [start, start + n) <=> every slot is hit
+        if id_min != start or id_max != start + size - 1:
+            return False
+        if _ids_in_order(id_blocks, start):
+            return True
+        seen = np.zeros(size, dtype=bool)
+        for block in id_blocks:
+            for row in range(0, block.size, ID_CHECK_CHUNK_ROWS):
+                seen[block[row:row + ID_CHECK_CHUNK_ROWS] - start] = True
+        return bool(seen.all())
 
-        return True
+    return np.unique(np.concatenate(id_blocks)).size == size
 
-    raise ValueError(f"Unknown id_type: {id_type!r}")
 
+def _ids_in_order(id_blocks: List[np.ndarray], start: int) -> bool:
+    """Return True if the IDs of all blocks are ``start, start + 1, ...``."""
+    expected = start
+    for block in id_blocks:
+        for row in range(0, block.size, ID_CHECK_CHUNK_ROWS):
+            chunk = block[row:row + ID_CHECK_CHUNK_ROWS]
+            if not np.array_equal(chunk, np.arange(expected, expected + chunk.size)):
+                return False
+            expected += chunk.size
+    return True
 
-def _flatten_element_ids(ids: Union[list, np.ndarray]) -> np.ndarray:
-    """Flatten element IDs across cell blocks into a 1D int array."""
-    if ids is None:
-        return np.array([], dtype=int)
 
+def _element_id_blocks(ids: Union[list, np.ndarray]) -> List[np.ndarray]:
+    """Element IDs of each non-empty cell block as 1D int arrays."""
     # Some callers may pass a flat ndarray already.
     if isinstance(ids, np.ndarray):
-        return np.asarray(ids, dtype=int).reshape(-1)
+        return [np.asarray(ids, dtype=int).reshape(-1)]
 
-    parts: list[np.ndarray] = []
+    blocks: list[np.ndarray] = []
     for block in ids:
         if block is None:
             continue
         arr = np.asarray(block, dtype=int).reshape(-1)
         if arr.size:
-            parts.append(arr)
-
-    if not parts:
-        return np.array([], dtype=int)
-    return np.concatenate(parts)
+            blocks.append(arr)
+    return blocks
 
 
 def _renumber_nodes_sequential(mesh, requirements: FormatNumberingRequirements) -> None:
@@ -0,0 +1,428 @@
+"""Element quality metrics of SG meshes.
+
+The quality of the cells is computed block by block, with array operations
+over the gathered corner coordinates ``points[cells]`` of each cell block,
+so that cross-sections with millions of elements can be checked before
+they are sent to the solver:
+
+- ``aspect_ratio``: ratio of the longest to the shortest edge, 1 for a
+  regular cell.
+- ``skewness``: equiangular skewness, the largest normalized deviation of
+  the face angles from the angle of the regular face (60 degrees for
+  triangles, 90 degrees for quadrilaterals), in [0, 1]; 0 for a regular
+  cell.
+- ``min_jacobian``: minimum scaled Jacobian over the corners, the
+  determinant of the unit edge vectors leaving each corner, in [-1, 1];
+  1 for a right-angled corner, non-positive for an inverted cell. For the
+  quadratic cells, this is also bounded by the Jacobian ratio of the
+  isoparametric map: the smallest ``det(J)`` over the nodes, divided by
+  its largest magnitude, with ``J`` from the derivatives of all the shape
+  functions, so that a misplaced mid-side node is detected. The Jacobian
+  of 2D cells is taken in the model space ('xy', 'yz' or 'zx').
+- ``warping``: largest angle in degrees between the normals of the two
+  triangles of a quadrilateral face, split along either diagonal; 0 for
+  planar faces and for cells with only triangular faces.
+
+The other metrics are computed from the corner nodes of the cells, so
+that the quadratic cells (e.g. 'triangle6', 'quad8', 'tetra10',
+'hexahedron20') get the metrics of their linear family, as does the
+``min_jacobian`` of the higher-order types without shape functions in
+:data:`HIGHER_ORDER_TYPES`. Line and pyramid cells are not supported and
+get NaN.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from meshio import Mesh
+
+from .mesh import (
+    CELL_FAMILY_CORNERS, MODEL_SPACE_AXES, SGMesh, _infer_model_space,
+)
+from .topology import CELL_FAMILY_EDGES, CELL_FAMILY_FACES, cell_family
+
+
+QUALITY_METRICS = ('aspect_ratio', 'skewness', 'min_jacobian', 'warping')
+
+# Default histogram range of the bounded metrics
+QUALITY_RANGES = {'skewness': (0.0, 1.0), 'min_jacobian': (-1.0, 1.0)}
+
+# Local corner nodes of the three edges leaving each corner of the 3D cell
+# families, ordered so that their determinant is positive for a valid cell
+CELL_FAMILY_CORNER_EDGES = {
+    'tetra': [(0, 1, 2, 3), (1, 2, 0, 3), (2, 0, 1, 3), (3, 0, 2, 1)],
+    'wedge': [
+        (0, 1, 2, 3), (1, 2, 0, 4), (2, 0, 1, 5),
+        (3, 5, 4, 0), (4, 3, 5, 1), (5, 4, 3, 2),
+    ],
+    'hexahedron': [
+        (0, 1, 3, 4), (1, 2, 0, 5), (2, 3, 1, 6), (3, 0, 2, 7),
+        (4, 7, 5, 0), (5, 4, 6, 1), (6, 5, 7, 2), (7, 6, 4, 3),
+    ],
+}
+
+QUALITY_FAMILIES = ('triangle', 'quad', 'tetra', 'wedge', 'hexahedron')
+
+# Parametric coordinates of the corners of each cell family
+CELL_FAMILY_REFERENCE_CORNERS = {
+    'triangle': [(0, 0), (1, 0), (0, 1)],
+    'quad': [(-1, -1), (1, -1), (1, 1), (-1, 1)],
+    'tetra': [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+    'wedge': [(0, 0, -1), (1, 0, -1), (0, 1, -1), (0, 0, 1), (1, 0, 1), (0, 1, 1)],
+    'hexahedron': [
+        (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+        (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+    ],
+}
+
+# Monomial exponents of the shape functions of the higher-order types,
+# whose mid-side nodes follow the edges of CELL_FAMILY_EDGES, then the
+# face centers of HIGHER_ORDER_FACE_CENTERS, and which may have a center
+# node
+HIGHER_ORDER_TYPES = {
+    'triangle6': [_e for _e in product(range(3), repeat=2) if sum(_e) <= 2],
+    'quad8': [_e for _e in product(range(3), repeat=2) if _e.count(2) <= 1],
+    'quad9': list(product(range(3), repeat=2)),
+    'tetra10': [_e for _e in product(range(3), repeat=3) if sum(_e) <= 2],
+    'wedge15': [
+        _e for _e in product(range(3), repeat=3)
+        if _e[0] + _e[1] <= (1 if _e[2] == 2 else 2)
+    ],
+    'wedge18': [_e for _e in product(range(3), repeat=3) if _e[0] + _e[1] <= 2],
+    'hexahedron20': [_e for _e in product(range(3), repeat=3) if _e.count(2) <= 1],
+    'hexahedron27': list(product(range(3), repeat=3)),
+}
+
+# Corner nodes of the faces with a center node, in the node order of the
+# higher-order types
+HIGHER_ORDER_FACE_CENTERS = {
+    'wedge18': [(0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)],
+    'hexahedron27': [
+        (0, 4, 7, 3), (1, 2, 6, 5), (0, 1, 5, 4),
+        (3, 2, 6, 7), (0, 1, 2, 3), (4, 5, 6, 7),
+    ],
+}
+
+# Number of cells gathered at a time
+QUALITY_CHUNK_ROWS = 65536
+
+
+def _cell_faces(family: str) -> Dict[int, np.ndarray]:
+    """Corner nodes of the faces of a cell family, by number of corners."""
+    if family in ('triangle', 'quad'):
+        faces = [tuple(range(CELL_FAMILY_CORNERS[family]))]
+    else:
+        faces = CELL_FAMILY_FACES[family]
+
+    grouped = {}
+    for face in faces:
+        grouped.setdefault(len(face), []).append(face)
+    return {_k: np.array(_faces) for _k, _faces in grouped.items()}
+
+
+def _norm(vectors: np.ndarray) -> np.ndarray:
+    """Length of vectors along the last axis."""
+    return np.sqrt(np.einsum('...k,...k->...', vectors, vectors))
+
+
+def _aspect_ratio(x: np.ndarray, family: str) -> np.ndarray:
+    edges = np.array(CELL_FAMILY_EDGES[family])
+    lengths = _norm(x[:, edges[:, 1]] - x[:, edges[:, 0]])
+    return lengths.max(axis=1) / lengths.min(axis=1)
+
+
+def _skewness(x: np.ndarray, faces: Dict[int, np.ndarray]) -> np.ndarray:
+    skewness = np.zeros(len(x))
+    for ncorners, face_nodes in faces.items():
+        # Angles at the corners of the faces, shape (ncells, nfaces, ncorners)
+        corner = x[:, face_nodes]
+        a = np.roll(corner, -1, axis=2) - corner
+        b = np.roll(corner, 1, axis=2) - corner
+        cosine = np.einsum('...k,...k->...', a, b) / (_norm(a) * _norm(b))
+        angle = np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+
+        regular = 180.0 * (ncorners - 2) / ncorners
+        deviation = np.maximum(
+            (angle.max(axis=(1, 2)) - regular) / (180.0 - regular),
+            (regular - angle.min(axis=(1, 2))) / regular,
+        )
+        skewness = np.fmax(skewness, deviation)
+    return skewness
+
+
+def _min_jacobian(x: np.ndarray, family: str, axes: Sequence[int]) -> np.ndarray:
+    if family in CELL_FAMILY_CORNER_EDGES:
+        nodes = np.array(CELL_FAMILY_CORNER_EDGES[family])
+        corner = x[:, nodes[:, 0]]
+        a, b, c = (x[:, nodes[:, _k]] - corner for _k in (1, 2, 3))
+        det = np.einsum('ijk,ijk->ij', a, np.cross(b, c))
+        scale = _norm(a) * _norm(b) * _norm(c)
+    else:
+        # Edges to the next and previous corners, in the model space
+        planar = x[:, :, list(axes)]
+        a = np.roll(planar, -1, axis=1) - planar
+        b = np.roll(planar, 1, axis=1) - planar
+        det = a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+        scale = _norm(a) * _norm(b)
+    return (det / scale).min(axis=1)
+
+
+def _warping(x: np.ndarray, faces: Dict[int, np.ndarray]) -> np.ndarray:
+    if 4 not in faces:
+        return np.zeros(len(x))
+
+    corner = x[:, faces[4]]
+    warping = np.zeros(corner.shape[:2])
+    for shift in (0, 1):
+        # Triangles (0, 1, 2) and (0, 2, 3) of the face, from corner ``shift``
+        p0, p1, p2, p3 = (corner[:, :, (shift + _k) % 4] for _k in range(4))
+        n1 = np.cross(p1 - p0, p2 - p0)
+        n2 = np.cross(p2 - p0, p3 - p0)
+        angle = np.arctan2(_norm(np.cross(n1, n2)), np.einsum('...k,...k->...', n1, n2))
+        warping = np.fmax(warping, np.degrees(angle))
+    return warping.max(axis=1)
+
+
+@lru_cache(maxsize=None)
+def _shape_derivatives(cell_type: str) -> np.ndarray:
+    """Derivatives of the shape functions of a higher-order type at its nodes.
+
+    The shape functions are the combinations of the monomials of
+    :data:`HIGHER_ORDER_TYPES` equal to 1 at their node and 0 at the
+    others.
+
+    Returns
+    -------
+    np.ndarray
+        ``dN_j/dxi_a`` at node ``p``, shape (nnodes, dim, nnodes).
+    """
+    family = cell_family(cell_type)
+    exponents = np.array(HIGHER_ORDER_TYPES[cell_type])
+    corners = np.array(CELL_FAMILY_REFERENCE_CORNERS[family], dtype=float)
+    nodes = [corners, corners[np.array(CELL_FAMILY_EDGES[family])].mean(axis=1)]
+    if cell_type in HIGHER_ORDER_FACE_CENTERS:
+        nodes.append(corners[np.array(HIGHER_ORDER_FACE_CENTERS[cell_type])].mean(axis=1))
+    if len(exponents) > sum(len(_nodes) for _nodes in nodes):
+        nodes.append(corners.mean(axis=0, keepdims=True))
+    nodes = np.vstack(nodes)
+
+    # Shape function coefficients, from the monomials at the nodes
+    coefficients = np.linalg.inv(np.prod(nodes[:, None, :] ** exponents, axis=2))
+
+    dim = exponents.shape[1]
+    derivatives = np.empty((len(nodes), dim, len(nodes)))
+    for a in range(dim):
+        lowered = exponents.copy()
+        lowered[:, a] = np.maximum(lowered[:, a] - 1, 0)
+        monomials = exponents[:, a] * np.prod(nodes[:, None, :] ** lowered, axis=2)
+        derivatives[:, a] = monomials @ coefficients
+    return derivatives
+
+
+def _jacobian_ratio(x: np.ndarray, cell_type: str, axes: Sequence[int]) -> np.ndarray:
+    """Minimum over the nodes of det(J) over its largest magnitude."""
+    # Rows dX/dxi_a of the Jacobian at each node, shape (ncells, nnodes, dim, 3)
+    derivatives = _shape_derivatives(cell_type)
+    jacobian = (derivatives.reshape(-1, derivatives.shape[2]) @ x).reshape(
+        len(x), *derivatives.shape[:2], 3
+    )
+    if jacobian.shape[2] == 3:
+        det = np.einsum(
+            'cpk,cpk->cp', jacobian[:, :, 0], np.cross(jacobian[:, :, 1], jacobian[:, :, 2])
+        )
+    else:
+        u, v = axes
+        det = (
+            jacobian[:, :, 0, u] * jacobian[:, :, 1, v]
+            - jacobian[:, :, 0, v] * jacobian[:, :, 1, u]
+        )
+    return det.min(axis=1) / np.abs(det).max(axis=1)
+
+
+def cell_quality(
+    points: np.ndarray, cells: np.ndarray, cell_type: str,
+    metrics: Optional[Sequence[str]] = None, model_space: str = 'xy'
+) -> Dict[str, np.ndarray]:
+    """Compute quality metrics of the cells of one block.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Point coordinates, shape (npoints, 3).
+    cells : np.ndarray
+        Connectivity of the cells, shape (ncells, nnodes).
+    cell_type : str
+        meshio cell type, e.g. 'quad8'.
+    metrics : Sequence[str], optional
+        Names of the metrics to compute. Default is :data:`QUALITY_METRICS`.
+    model_space : str, optional
+        Plane of the 2D cells ('xy', 'yz' or 'zx'). Default is 'xy'.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Value of each metric for each cell, shape (ncells,), by metric
+        name. Cells of unsupported types and degenerate cells get NaN.
+
+    Raises
+    ------
+    ValueError
+        If a metric or the model space is unknown.
+    """
+    metrics = list(QUALITY_METRICS if metrics is None else metrics)
+    unknown = set(metrics) - set(QUALITY_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown quality metrics: {sorted(unknown)}")
+    if model_space not in MODEL_SPACE_AXES:
+        raise ValueError(f"Invalid model space: {model_space}")
+
+    points = np.asarray(points, dtype=float)
+    cells = np.asarray(cells)
+    values = {_name: np.full(len(cells), np.nan) for _name in metrics}
+
+    try:
+        family = cell_family(cell_type)
+    except ValueError:
+        return values
+    if family not in QUALITY_FAMILIES or cells.size == 0:
+        return values
+
+    ncorners = CELL_FAMILY_CORNERS[family]
+    if cells.ndim != 2 or cells.shape[1] < ncorners:
+        raise ValueError(
+            f"Expected {cell_type} cells with shape (n, >={ncorners}), got {cells.shape}"
+        )
+
+    faces = _cell_faces(family)
+    axes = MODEL_SPACE_AXES[model_space]
+    jacobian_ratio = (
+        cells.shape[1] > ncorners and 'min_jacobian' in metrics
+        and cell_type in HIGHER_ORDER_TYPES
+    )
+    compute = {
+        'aspect_ratio': lambda _x: _aspect_ratio(_x, family),
+        'skewness': lambda _x: _skewness(_x, faces),
+        'min_jacobian': lambda _x: _min_jacobian(_x, family, axes),
+        'warping': lambda _x: _warping(_x, faces),
+    }
+    if jacobian_ratio and cells.shape[1] != len(HIGHER_ORDER_TYPES[cell_type]):
+        raise ValueError(
+            f"Expected {cell_type} cells with shape "
+            f"(n, {len(HIGHER_ORDER_TYPES[cell_type])}), got {cells.shape}"
+        )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for start in range(0, len(cells), QUALITY_CHUNK_ROWS):
+            chunk = cells[start:start + QUALITY_CHUNK_ROWS]
+            x = points[chunk[:, :ncorners]]
+            for name in metrics:
+                values[name][start:start + len(x)] = compute[name](x)
+
+            if jacobian_ratio:
+                jacobian = values['min_jacobian'][start:start + len(x)]
+                np.fmin(jacobian, _jacobian_ratio(points[chunk], cell_type, axes), out=jacobian)
+
+    for value in values.values():
+        value[~np.isfinite(value)] = np.nan
+
+    return values
+
+
+def mesh_quality(
+    mesh: Union[SGMesh, Mesh], metrics: Optional[Sequence[str]] = None,
+    model_space: str = ''
+) -> Dict[str, List[np.ndarray]]:
+    """Compute quality metrics of all the cells of a mesh.
+
+    The values are stored as ``cell_data``: one array per cell block, in
+    the order of ``mesh.cells``, so that the value of element
+    ``cell_data['element_id'][i][j]`` is ``quality[name][i][j]``. The
+    result can be added to the mesh with ``mesh.cell_data.update(quality)``.
+
+    Parameters
+    ----------
+    mesh : SGMesh or meshio.Mesh
+        Mesh to check.
+    metrics : Sequence[str], optional
+        Names of the metrics to compute. Default is :data:`QUALITY_METRICS`.
+    model_space : str, optional
+        Plane of the 2D cells ('xy', 'yz' or 'zx'). Default is the plane
+        normal to the coordinate with the smallest range.
+
+    Returns
+    -------
+    dict[str, list[np.ndarray]]
+        Values of each metric, by metric name.
+
+    Examples
+    --------
+    ..  code-block:: python
+
+        quality = mesh_quality(sg.mesh)
+        summary = quality_summary(quality)
+        summary['skewness']['max']
+    """
+    if not model_space:
+        model_space = _infer_model_space(np.asarray(mesh.points))
+
+    metrics = list(QUALITY_METRICS if metrics is None else metrics)
+    quality = {_name: [] for _name in metrics}
+    for cell_block in mesh.cells:
+        values = cell_quality(
+            mesh.points, cell_block.data, cell_block.type, metrics, model_space
+        )
+        for name in metrics:
+            quality[name].append(values[name])
+
+    return quality
+
+
+def quality_summary(
+    quality: Dict[str, Union[np.ndarray, List[np.ndarray]]], bins: int = 10,
+    ranges: Optional[Dict[str, tuple]] = None
+) -> Dict[str, dict]:
+    """Summarize quality metrics with statistics and histograms.
+
+    NaN values, e.g. of unsupported cells, are left out.
+
+    Parameters
+    ----------
+    quality : dict[str, np.ndarray or list[np.ndarray]]
+        Values of each metric, as returned by :func:`mesh_quality` or
+        :func:`cell_quality`.
+    bins : int, optional
+        Number of histogram bins. Default is 10.
+    ranges : dict[str, tuple], optional
+        Histogram range of each metric. Default is :data:`QUALITY_RANGES`
+        for the bounded metrics, and the range of the values otherwise.
+
+    Returns
+    -------
+    dict[str, dict]
+        Summary of each metric, by metric name, with keys 'count', 'min',
+        'max', 'mean', 'counts' and 'bin_edges'. ``counts[k]`` is the
+        number of values in ``[bin_edges[k], bin_edges[k+1])``.
+    """
+    ranges = {**QUALITY_RANGES, **(ranges or {})}
+
+    summary = {}
+    for name, value in quality.items():
+        if isinstance(value, (list, tuple)):
+            value = np.concatenate([np.ravel(_v) for _v in value]) if value else np.empty(0)
+        value = np.asarray(value, dtype=float)
+        value = value[~np.isnan(value)]
+
+        counts, bin_edges = np.histogram(value, bins=bins, range=ranges.get(name))
+        summary[name] = {
+            'count': value.size,
+            'min': value.min() if value.size > 0 else np.nan,
+            'max': value.max() if value.size > 0 else np.nan,
+            'mean': value.mean() if value.size > 0 else np.nan,
+            'counts': counts,
+            'bin_edges': bin_edges,
+        }
+
+    return summary
@@ -0,0 +1,438 @@
+"""Derived topology of SG meshes.
+
+:class:`MeshTopology` gives the node to cell adjacency, the unique edges
+and faces of the cells with their inverse maps, the cell to cell adjacency
+through shared facets and the boundary of a mesh. Everything is built with
+sorted-key array operations over whole cell blocks, and only when it is
+first used.
+
+Edges and faces are defined by the corner nodes of the cells, so that
+the quadratic cells (e.g. 'triangle6', 'hexahedron20') share the edges
+and faces of their linear family. Edges are stored as sorted node pairs
+and faces as sorted node quadruples, padded with -1 in front for
+triangular faces.
+
+The facets of a cell are its end nodes for line cells, its edges for 2D
+cells and its faces for 3D cells. Two cells are neighbours if they share
+a facet.
+"""
+from __future__ import annotations
+
+import re
+from functools import cached_property
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+# Local corner nodes of the edges and faces of each cell family (meshio
+# node ordering)
+CELL_FAMILY_EDGES = {
+    'line': [(0, 1)],
+    'triangle': [(0, 1), (1, 2), (2, 0)],
+    'quad': [(0, 1), (1, 2), (2, 3), (3, 0)],
+    'tetra': [(0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3)],
+    'pyramid': [(0, 1), (1, 2), (2, 3), (3, 0), (0, 4), (1, 4), (2, 4), (3, 4)],
+    'wedge': [
+        (0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (0, 3), (1, 4), (2, 5)
+    ],
+    'hexahedron': [
+        (0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+        (0, 4), (1, 5), (2, 6), (3, 7)
+    ],
+}
+CELL_FAMILY_FACES = {
+    'tetra': [(0, 2, 1), (0, 1, 3), (1, 2, 3), (0, 3, 2)],
+    'pyramid': [(0, 3, 2, 1), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)],
+    'wedge': [(0, 2, 1), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)],
+    'hexahedron': [
+        (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6),
+        (3, 0, 4, 7)
+    ],
+}
+CELL_FAMILY_DIM = {
+    'line': 1, 'triangle': 2, 'quad': 2,
+    'tetra': 3, 'pyramid': 3, 'wedge': 3, 'hexahedron': 3,
+}
+
+
+def cell_family(cell_type: str) -> str:
+    """Get the family of a cell type, e.g. 'triangle' for 'triangle6'.
+
+    Raises
+    ------
+    ValueError
+        If the cell type is not supported.
+    """
+    match = re.fullmatch(r'([a-z]+)\d*', cell_type)
+    if match is None or match.group(1) not in CELL_FAMILY_DIM:
+        raise ValueError(f"Unsupported cell type: '{cell_type}'")
+    return match.group(1)
+
+
+class NodeCellAdjacency(NamedTuple):
+    """Node to cell adjacency in compressed sparse row (CSR) format.
+
+    The cells of node ``i`` are ``indices[indptr[i]:indptr[i+1]]`` in the cell
+    blocks ``block_id[indptr[i]:indptr[i+1]]``, ordered by cell block, then
+    by cell. A cell using a node twice is listed twice.
+
+    Attributes
+    ----------
+    indptr : np.ndarray
+        Offsets of the cells of each node, shape (n_nodes + 1,).
+    indices : np.ndarray
+        Index of each cell in its cell block.
+    block_id : np.ndarray
+        Index of the cell block of each cell.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    block_id: np.ndarray
+
+    def counts(self) -> np.ndarray:
+        """Number of cells of each node."""
+        return np.diff(self.indptr)
+
+    def cells(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Cell block indices and cell indices of the cells of a node."""
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.block_id[start:end], self.indices[start:end]
+
+
+class CellAdjacency(NamedTuple):
+    """Cell to cell adjacency in CSR format, over the global cell indices.
+
+    The global index of cell ``i`` of cell block ``k`` is
+    ``cell_offsets[k] + i``. The neighbours of global cell ``c`` are
+    ``indices[indptr[c]:indptr[c+1]]``, in ascending order.
+
+    Attributes
+    ----------
+    indptr : np.ndarray
+        Offsets of the neighbours of each cell, shape (n_cells + 1,).
+    indices : np.ndarray
+        Global index of each neighbour.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    def neighbors(self, cell: int) -> np.ndarray:
+        """Global indices of the neighbours of a cell."""
+        return self.indices[self.indptr[cell]:self.indptr[cell + 1]]
+
+
+def _build_node_cell_adjacency(cells: list, npoints: int) -> NodeCellAdjacency:
+    """Build the node to cell adjacency of cell blocks.
+
+    The node indices of all the cell blocks are concatenated and stably
+    sorted, so that the cells of each node stay in block and cell order.
+    """
+    node_index = [np.asarray(_cb.data, dtype=int).reshape(-1) for _cb in cells]
+    cell_index = [
+        np.repeat(np.arange(len(_cb.data)), _ni.size // max(len(_cb.data), 1))
+        for _cb, _ni in zip(cells, node_index)
+    ]
+    block_id = [np.full(_ni.size, _k) for _k, _ni in enumerate(node_index)]
+
+    if not node_index:
+        node_index = cell_index = block_id = [np.empty(0, dtype=int)]
+    node_index = np.concatenate(node_index)
+    if node_index.size > 0 and node_index.max() >= npoints:
+        raise ValueError(
+            f"Cells use node index {node_index.max()}, but the mesh has {npoints} points"
+        )
+    order = np.argsort(node_index, kind='stable')
+
+    indptr = np.zeros(npoints + 1, dtype=int)
+    np.cumsum(np.bincount(node_index, minlength=npoints), out=indptr[1:])
+
+    return NodeCellAdjacency(
+        indptr, np.concatenate(cell_index)[order], np.concatenate(block_id)[order]
+    )
+
+
+def _unique_rows(keys: np.ndarray, npoints: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the unique rows of an integer array.
+
+    The rows are packed into one int64 key when the node indices allow it,
+    and sorted lexicographically otherwise.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        Rows of node indices in [-1, npoints), shape (n, k).
+    npoints : int
+        Number of points of the mesh.
+
+    Returns
+    -------
+    unique : np.ndarray
+        Unique rows, sorted, shape (nunique, k).
+    inverse : np.ndarray
+        Index of each row of ``keys`` in ``unique``, shape (n,).
+    """
+    n, k = keys.shape
+    if n == 0:
+        return keys.copy(), np.empty(0, dtype=int)
+
+    base = npoints + 1
+    if float(base) ** k < 2.0 ** 63:
+        packed = np.zeros(n, dtype=np.int64)
+        for j in range(k):
+            packed = packed * base + (keys[:, j] + 1)
+        _, first, inverse = np.unique(packed, return_index=True, return_inverse=True)
+        return keys[first], inverse.reshape(-1)
+
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    new_row = np.ones(n, dtype=bool)
+    new_row[1:] = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+    inverse = np.empty(n, dtype=int)
+    inverse[order] = np.cumsum(new_row) - 1
+    return sorted_keys[new_row], inverse
+
+
+class MeshTopology():
+    """Topology of the cells of a mesh, built lazily.
+
+    Use :attr:`sgio.core.mesh.SGMesh.topology` to get the cached topology of
+    an SGMesh.
+
+    Parameters
+    ----------
+    cells : list of meshio.CellBlock
+        Cell blocks, with connectivity given as 0-based point indices.
+    npoints : int
+        Number of points of the mesh.
+
+    Attributes
+    ----------
+    cell_offsets : np.ndarray
+        Global index of the first cell of each cell block, shape
+        (n_blocks + 1,). The last item is the total number of cells.
+
+    Examples
+    --------
+    ..  code-block:: python
+
+        topology = sg.mesh.topology
+        edges = topology.edges[topology.boundary_edges()]  # (n, 2) node pairs
+        block_id, cell = topology.cell_index(topology.cell_neighbors.neighbors(0))
+    """
+
+    def __init__(self, cells: list, npoints: int):
+        self.cells = list(cells)
+        self.npoints = npoints
+        self.cell_offsets = np.zeros(len(self.cells) + 1, dtype=int)
+        np.cumsum([len(_cb.data) for _cb in self.cells], out=self.cell_offsets[1:])
+
+    @cached_property
+    def families(self) -> list[Optional[str]]:
+        """Cell family of each cell block, e.g. 'triangle' for 'triangle6'.
+
+        Blocks of unsupported cell types, e.g. 'vertex', get None and are
+        left out of the edges, faces, boundary and cell neighbours.
+        """
+        families = []
+        for cell_block in self.cells:
+            try:
+                families.append(cell_family(cell_block.type))
+            except ValueError:
+                families.append(None)
+        return families
+
+    @property
+    def ncells(self) -> int:
+        """Total number of cells."""
+        return int(self.cell_offsets[-1])
+
+    def cell_index(self, cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert global cell indices to (cell block index, index in block)."""
+        cells = np.asarray(cells, dtype=int)
+        block_id = np.searchsorted(self.cell_offsets, cells, side='right') - 1
+        return block_id, cells - self.cell_offsets[block_id]
+
+    @cached_property
+    def node_cells(self) -> NodeCellAdjacency:
+        """Node to cell adjacency in CSR format."""
+        return _build_node_cell_adjacency(self.cells, self.npoints)
+
+    def _local_keys(self, local: dict, block_ids: list, width: int) -> list:
+        """Sorted node keys of the local edges/faces of each cell, by block."""
+        keys = []
+        for k in block_ids:
+            data = np.asarray(self.cells[k].data, dtype=int)
+            _keys = []
+            for _nodes in local[self.families[k]]:
+                _key = data[:, list(_nodes)]
+                if len(_nodes) < width:
+                    _pad = np.full((len(data), width - len(_nodes)), -1, dtype=int)
+                    _key = np.hstack([_pad, _key])
+                _keys.append(_key)
+            # (ncell, nlocal, width), sorted along the last axis
+            keys.append(np.sort(np.stack(_keys, axis=1), axis=2))
+        return keys
+
+    def _unique_entities(self, local: dict, block_ids: list, width: int):
+        keys = self._local_keys(local, block_ids, width)
+        if not keys:
+            return np.empty((0, width), dtype=int), {}
+        unique, inverse = _unique_rows(
+            np.concatenate([_k.reshape(-1, width) for _k in keys]), self.npoints
+        )
+        sizes = np.cumsum([0] + [_k.shape[0] * _k.shape[1] for _k in keys])
+        inverses = {
+            _b: inverse[sizes[_i]:sizes[_i + 1]].reshape(keys[_i].shape[:2])
+            for _i, _b in enumerate(block_ids)
+        }
+        return unique, inverses
+
+    @cached_property
+    def _edges(self):
+        block_ids = [_k for _k, _f in enumerate(self.families) if _f is not None]
+        return self._unique_entities(CELL_FAMILY_EDGES, block_ids, 2)
+
+    @cached_property
+    def _faces(self):
+        block_ids = [_k for _k, _f in enumerate(self.families) if _f in CELL_FAMILY_FACES]
+        return self._unique_entities(CELL_FAMILY_FACES, block_ids, 4)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Unique edges of all the cells, as sorted node pairs, shape (n_edges, 2)."""
+        return self._edges[0]
+
+    def cell_edges(self, block_id: int) -> np.ndarray:
+        """Edge indices of the cells of a block, shape (n_cells, n_edges_per_cell)."""
+        return self._edges[1][block_id]
+
+    @property
+    def faces(self) -> np.ndarray:
+        """Unique faces of the 3D cells, as sorted nodes padded with -1, shape (n_faces, 4)."""
+        return self._faces[0]
+
+    def cell_faces(self, block_id: int) -> np.ndarray:
+        """Face indices of the cells of a 3D block, shape (n_cells, n_faces_per_cell)."""
+        return self._faces[1][block_id]
+
+    def _count(self, inverses: dict, block_ids: list, size: int) -> np.ndarray:
+        """Number of cells of the given blocks using each edge/face."""
+        counts = np.zeros(size, dtype=int)
+        for k in block_ids:
+            counts += np.bincount(inverses[k].reshape(-1), minlength=size)
+        return counts
+
+    def _blocks_of_dim(self, dim: int) -> list:
+        return [
+            _k for _k, _f in enumerate(self.families)
+            if _f is not None and CELL_FAMILY_DIM[_f] == dim
+        ]
+
+    def boundary_edges(self) -> np.ndarray:
+        """Indices of the edges used by exactly one 2D cell, e.g. the boundary of a cross-section."""
+        counts = self._count(self._edges[1], self._blocks_of_dim(2), len(self.edges))
+        return np.flatnonzero(counts == 1)
+
+    def boundary_faces(self) -> np.ndarray:
+        """Indices of the faces used by exactly one 3D cell."""
+        counts = self._count(self._faces[1], self._blocks_of_dim(3), len(self.faces))
+        return np.flatnonzero(counts == 1)
+
+    def boundary_nodes(self) -> np.ndarray:
+        """Sorted indices of the nodes on the boundary.
+
+        The boundary is made of the boundary faces if the mesh has 3D
+        cells, and of the boundary edges otherwise.
+        """
+        if self._blocks_of_dim(3):
+            nodes = self.faces[self.boundary_faces()]
+        else:
+            nodes = self.edges[self.boundary_edges()]
+        nodes = np.unique(nodes)
+        return nodes[nodes >= 0]
+
+    def boundary_cells(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Cells having a boundary facet, with the local index of that facet.
+
+        Returns
+        -------
+        block_id : np.ndarray
+            Cell block index of each boundary facet.
+        cell : np.ndarray
+            Cell index in the block.
+        local : np.ndarray
+            Local index of the facet in the cell, in the order of
+            :data:`CELL_FAMILY_FACES` (3D) or :data:`CELL_FAMILY_EDGES` (2D),
+            which gives the nodes of the facet in the cell order.
+        """
+        if self._blocks_of_dim(3):
+            inverses, boundary, blocks = self._faces[1], self.boundary_faces(), self._blocks_of_dim(3)
+            size = len(self.faces)
+        else:
+            inverses, boundary, blocks = self._edges[1], self.boundary_edges(), self._blocks_of_dim(2)
+            size = len(self.edges)
+
+        is_boundary = np.zeros(size, dtype=bool)
+        is_boundary[boundary] = True
+        block_ids, cell_ids, local_ids = [], [], []
+        for k in blocks:
+            cell, local = np.nonzero(is_boundary[inverses[k]])
+            block_ids.append(np.full(cell.size, k))
+            cell_ids.append(cell)
+            local_ids.append(local)
+        if not blocks:
+            return (np.empty(0, dtype=int),) * 3
+        return np.concatenate(block_ids), np.concatenate(cell_ids), np.concatenate(local_ids)
+
+    def _facets(self, dim: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Facet index and global cell index of each facet of the cells of a dimension."""
+        if dim == 3:
+            inverses = self._faces[1]
+        elif dim == 2:
+            inverses = self._edges[1]
+        else:
+            inverses = {
+                _k: np.asarray(self.cells[_k].data, dtype=int)[:, [0, 1]]
+                for _k in self._blocks_of_dim(1)
+            }
+
+        facets, cells = [], []
+        for k in self._blocks_of_dim(dim):
+            _inv = inverses[k]
+            facets.append(_inv.reshape(-1))
+            cells.append(np.repeat(self.cell_offsets[k] + np.arange(len(_inv)), _inv.shape[1]))
+        if not facets:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+        return np.concatenate(facets), np.concatenate(cells)
+
+    @cached_property
+    def cell_neighbors(self) -> CellAdjacency:
+        """Cell to cell adjacency through shared facets, in CSR format."""
+        pairs = []
+        for dim in (1, 2, 3):
+            facet, cell = self._facets(dim)
+            if facet.size == 0:
+                continue
+            # Cells are in ascending order, which a stable sort keeps
+            order = np.argsort(facet, kind='stable')
+            facet, cell = facet[order], cell[order]
+            # Link every cell to every other cell sharing a facet
+            starts = np.flatnonzero(np.r_[True, facet[1:] != facet[:-1]])
+            sizes = np.diff(np.r_[starts, facet.size])
+            for size in np.flatnonzero(np.bincount(sizes)[2:]) + 2:
+                group = starts[sizes == size][:, None] + np.arange(size)
+                _cells = cell[group]
+                i, j = np.nonzero(~np.eye(size, dtype=bool))
+                pairs.append(np.stack([_cells[:, i].reshape(-1), _cells[:, j].reshape(-1)], axis=1))
+
+        pairs = np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=int)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        # Sort by cell, then neighbour, and drop the cells sharing several facets
+        packed = np.sort(pairs[:, 0].astype(np.int64) * self.ncells + pairs[:, 1])
+        packed = packed[np.r_[True, packed[1:] != packed[:-1]][:packed.size]]
+        pairs = np.stack(np.divmod(packed, self.ncells), axis=1)
+
+        indptr = np.zeros(self.ncells + 1, dtype=int)
+        np.cumsum(np.bincount(pairs[:, 0], minlength=self.ncells), out=indptr[1:])
+        return CellAdjacency(indptr, pairs[:, 1].copy())
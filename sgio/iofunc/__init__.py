@@ -5,11 +5,15 @@ from . import (
     vabs,
 )
 
-from ._meshio import add_cell_dict_data_to_mesh, add_point_dict_data_to_mesh
+from ._meshio import (
+    add_cell_dict_data_to_mesh, add_point_dict_data_to_mesh,
+    add_cell_array_data_to_mesh, add_point_array_data_to_mesh, add_state_data_to_mesh,
+    )
 from .main import (
     convert,
     read, read_load_csv,
-    read_output, read_output_model, read_output_state,
+    read_output, read_output_model, read_output_models, read_output_state, iter_output_states,
+    read_output_failure_summary,
     write
     )
 from .base import (
@@ -40,7 +44,10 @@ __all__ = [
     "convert",
     "read_output",
     "read_output_model",
+    "read_output_models",
     "read_output_state",
+    "iter_output_states",
+    "read_output_failure_summary",
     "read_load_csv",
 
     # Base classes and registry
@@ -52,4 +59,7 @@ __all__ = [
     # Mesh utilities
     "add_cell_dict_data_to_mesh",
     "add_point_dict_data_to_mesh",
+    "add_cell_array_data_to_mesh",
+    "add_point_array_data_to_mesh",
+    "add_state_data_to_mesh",
 ]
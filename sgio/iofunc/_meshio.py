@@ -5,7 +5,10 @@ Overall, this module is similar to meshio._helpers.py.
 """
 from __future__ import annotations
 
+import io
+import itertools
 import logging
+import sys
 from typing import Callable, Optional, Union, Any, IO
 
 import numpy as np
@@ -29,6 +32,9 @@ from meshio._helpers import reader_map, _writer_map, extension_to_filetypes
 from meshio import Mesh
 
 from sgio.core.mesh import SGMesh
+from sgio.model.general import State, StateData
+from sgio.iofunc._mmap import MappedTextFile
+from sgio.utils.io import fortran_floats, translate_fortran_exponents
 
 
 logger = logging.getLogger(__name__)
@@ -194,6 +200,9 @@ def add_point_dict_data_to_mesh(name: Union[str, list], dict_data: dict[int, lis
     >>> data = {1: [1.0, 2.0], 2: [3.0, 4.0]}
     >>> add_point_dict_data_to_mesh(['u', 'v'], data, mesh)
     """
+    if isinstance(dict_data, StateData):
+        add_point_array_data_to_mesh(name, dict_data.entity_ids, dict_data.data_array, mesh)
+        return
 
     npoints = len(mesh.points)
 
@@ -295,6 +304,10 @@ def add_cell_dict_data_to_mesh(name: Union[str, list], dict_data: dict[int, list
     >>> data = {1: [[1.0, 2.0], [3.0, 4.0]], 2: [[5.0, 6.0], [7.0, 8.0]]}
     >>> add_cell_dict_data_to_mesh(['stress_x', 'stress_y'], data, mesh)
     """
+    if isinstance(dict_data, StateData):
+        add_cell_array_data_to_mesh(name, dict_data.entity_ids, dict_data.data_array, mesh)
+        return
+
     cell_data_eid = mesh.cell_data['element_id']
 
     # Detect and route to appropriate handler
@@ -383,6 +396,130 @@ def _add_cell_point_dict_data_to_mesh(name: Union[str, list], dict_data: dict[in
 
 
 
+def _mesh_node_ids(mesh: SGMesh) -> np.ndarray:
+    """Node IDs of the mesh, 1 to npoints if ``point_data['node_id']`` is not set."""
+    node_id = mesh.point_data.get('node_id')
+    if node_id is None:
+        return np.arange(1, len(mesh.points) + 1)
+    return np.asarray(node_id, dtype=int)
+
+
+def add_point_array_data_to_mesh(
+    name: Union[str, list], ids: ArrayLike, values: ArrayLike, mesh: SGMesh
+) -> None:
+    """Add point/node data given as arrays to mesh.point_data.
+
+    The rows of ``values`` are aligned to ``point_data['node_id']`` (or to
+    node IDs 1 to npoints) with a sorted-index join, in one pass.
+
+    Parameters
+    ----------
+    name : str or list of str
+        Name(s) of the point data fields to add.
+        If list, must match the number of components of ``values``.
+    ids : array-like of int
+        Node ID of each row of ``values``, in any order.
+    values : array-like
+        Values with shape (n,) or (n, ncomps).
+    mesh : SGMesh
+        Target mesh object. Data will be added to mesh.point_data attribute.
+
+    Raises
+    ------
+    KeyError
+        If a node of the mesh is not in ``ids``.
+
+    Examples
+    --------
+    >>> state = state_case.getState('u')
+    >>> add_point_array_data_to_mesh(['u1', 'u2', 'u3'], state.entity_ids, state.data_array, mesh)
+    """
+    values = np.asarray(values)
+    point_values = values[_id_to_index(_mesh_node_ids(mesh), ids)]
+
+    if isinstance(name, str):
+        mesh.point_data[name] = point_values
+    else:
+        for k, _name in enumerate(name):
+            mesh.point_data[_name] = point_values[:, k]
+
+
+def add_cell_array_data_to_mesh(
+    name: Union[str, list], ids: ArrayLike, values: ArrayLike, mesh: SGMesh
+) -> None:
+    """Add cell/element data given as arrays to mesh.cell_data or mesh.cell_point_data.
+
+    The rows of ``values`` are aligned to ``cell_data['element_id']`` with a
+    sorted-index join, one cell block at a time.
+
+    Parameters
+    ----------
+    name : str or list of str
+        Name(s) of the cell data fields to add.
+        If list, must match the number of components of ``values``.
+    ids : array-like of int
+        Element ID of each row of ``values``, in any order.
+    values : array-like
+        Element data with shape (n,) or (n, ncomps), added to
+        mesh.cell_data, or element-node data with shape
+        (n, nnodes, ncomps), added to mesh.cell_point_data.
+    mesh : SGMesh
+        Target mesh object. Must have mesh.cell_data['element_id'] defined.
+
+    Raises
+    ------
+    KeyError
+        If an element of the mesh is not in ``ids``.
+    """
+    values = np.asarray(values)
+    elem_ids = mesh.cell_data['element_id']
+    sizes = [len(_b) for _b in elem_ids]
+    all_ids = np.concatenate([np.asarray(_b, dtype=int).reshape(-1) for _b in elem_ids])
+
+    cell_values = values[_id_to_index(all_ids, ids)]
+    blocks = np.split(cell_values, np.cumsum(sizes)[:-1])
+
+    target = mesh.cell_point_data if values.ndim == 3 else mesh.cell_data
+    if isinstance(name, str):
+        target[name] = blocks
+    else:
+        for k, _name in enumerate(name):
+            target[_name] = [_b[..., k] for _b in blocks]
+
+
+def add_state_data_to_mesh(state: State, mesh: SGMesh, name: Union[str, list, None] = None) -> None:
+    """Add the field data of a State to the mesh.
+
+    Node states are added to mesh.point_data, element states to
+    mesh.cell_data and element node states to mesh.cell_point_data.
+
+    Parameters
+    ----------
+    state : State
+        State with field data, e.g. ``state_case.getState('u')``.
+    mesh : SGMesh
+        Target mesh object.
+    name : str or list of str, optional
+        Name(s) of the fields to add. If list, one field is added per
+        component. Default is the name of the state.
+
+    Examples
+    --------
+    >>> state = state_case.getState('es')
+    >>> add_state_data_to_mesh(state, sg.mesh, name=state.label)
+    """
+    if not state.is_field_data():
+        raise ValueError(f"State '{state.name}' has no field data")
+    if name is None:
+        name = state.name
+
+    if state.location == 'node':
+        add_point_array_data_to_mesh(name, state.entity_ids, state.data_array, mesh)
+    else:
+        add_cell_array_data_to_mesh(name, state.entity_ids, state.data_array, mesh)
+
+
+
 # ====================================================================
 # Readers
 
@@ -436,6 +573,351 @@ def _read_nodes(f: IO, nnodes: int, sgdim: int = 3) -> tuple[np.ndarray, dict[in
 
 
 
+def _read_data_lines(f: IO, nlines: int, comment: str = '!') -> list[str]:
+    """Read a block of data lines from SG format file without parsing them.
+
+    Parameters
+    ----------
+    f : file-like object
+        File buffer to read from (must be iterable line by line).
+    nlines : int
+        Number of data lines to read.
+    comment : str, optional
+        Comment character, default is '!'.
+
+    Returns
+    -------
+    list of str
+        Raw data lines (comments kept).
+        Shorter than ``nlines`` only if the end of file is reached.
+
+    Notes
+    -----
+    - Empty lines and comment-only lines are skipped and not counted
+    - Lines are fetched in batches so that the per-line cost stays in C
+    """
+    lines = []
+    while len(lines) < nlines:
+        chunk = list(itertools.islice(f, nlines - len(lines)))
+        if not chunk:
+            break
+        for line in chunk:
+            _s = line.lstrip()
+            if _s and _s[0] != comment:
+                lines.append(line)
+
+    return lines
+
+
+def _read_block_array(
+    f: IO, nrows: int, comment: str = '!', dtype: type = float
+) -> tuple[Optional[np.ndarray], list[str]]:
+    """Read a block of data lines from SG format file as a 2D array.
+
+    Parameters
+    ----------
+    f : file-like object
+        File buffer to read from (must be iterable line by line).
+    nrows : int
+        Number of data lines (rows) to read.
+    comment : str, optional
+        Comment character, default is '!'.
+    dtype : type, optional
+        Data type of the parsed array, default is float.
+
+    Returns
+    -------
+    data : np.ndarray or None
+        Array with shape (nrows, ncols).
+        None if the block is not a regular table of numbers of ``dtype``.
+    lines : list of str
+        Raw data lines, to be handed to a line-by-line reader if ``data`` is None.
+
+    Notes
+    -----
+    Memory-mapped buffers (:class:`sgio.iofunc._mmap.MappedTextFile`) parse
+    the block directly from the mapped bytes.
+
+    Float blocks written with Fortran-style 'd'/'D' exponents are parsed in
+    bulk as well, after translating the exponent markers of the whole block.
+    """
+    if isinstance(f, MappedTextFile):
+        return f.read_block_array(nrows, comment=comment, dtype=dtype)
+
+    lines = _read_data_lines(f, nrows, comment=comment)
+
+    if nrows == 0:
+        return np.empty((0, 0), dtype=dtype), lines
+    if len(lines) != nrows:
+        return None, lines
+
+    try:
+        data = np.loadtxt(lines, comments=comment, dtype=dtype, ndmin=2)
+    except ValueError:
+        if not np.issubdtype(dtype, np.floating):
+            return None, lines
+        # Fortran 'd' exponents: translate the whole block once and retry
+        block = translate_fortran_exponents(''.join(lines))
+        try:
+            data = np.loadtxt(io.StringIO(block), comments=comment, dtype=dtype, ndmin=2)
+        except ValueError:
+            return None, lines
+
+    return data, lines
+
+
+# Lines parsed at a time when reading a subset of a block
+READ_CHUNK_ROWS = 65536
+
+
+def _parse_rows(lines: list[str], ncols: int, comment: str = '!') -> np.ndarray:
+    """Parse data lines into a float array of at least ``ncols`` columns.
+
+    Lines are parsed in bulk, and one by one only if the block is not a
+    regular table (e.g. rows with trailing text).
+
+    Raises
+    ------
+    ValueError
+        If a line holds fewer than ``ncols`` numbers.
+    """
+    if not lines:
+        return np.empty((0, ncols))
+    try:
+        data = np.loadtxt(
+            io.StringIO(translate_fortran_exponents(''.join(lines))),
+            comments=comment, dtype=float, ndmin=2
+        )
+    except ValueError:
+        data = None
+
+    if data is None or data.shape[1] < ncols:
+        data = np.zeros((len(lines), ncols))
+        for i, line in enumerate(lines):
+            tokens = line.split(comment)[0].split()
+            if len(tokens) < ncols:
+                raise ValueError(f'incomplete data line: {line!r}')
+            data[i] = fortran_floats(tokens[:ncols])
+
+    return data
+
+
+def _read_id_value_block(
+    f: IO, nrows: Optional[int], value_cols: list[int], ids: Optional[ArrayLike] = None,
+    comment: str = '!', chunk_rows: int = READ_CHUNK_ROWS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read a block of 'id value ...' data lines into an ID and a value array.
+
+    Parameters
+    ----------
+    f : file-like object
+        File buffer to read from (must be iterable line by line).
+    nrows : int or None
+        Number of data lines (rows) to read. None reads until the end of file.
+    value_cols : list of int
+        Columns of the values, the ID being column 0.
+    ids : array-like of int, optional
+        Only keep the rows of these IDs. The other rows are skipped without
+        being converted to numbers, ``chunk_rows`` lines at a time.
+    comment : str, optional
+        Comment character, default is '!'.
+    chunk_rows : int, optional
+        Number of lines handled at a time when ``ids`` is given.
+
+    Returns
+    -------
+    ids : np.ndarray of int
+        IDs, shape (n,), in file order.
+    values : np.ndarray
+        Values, shape (n, len(value_cols)).
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``nrows`` lines are read or a line is incomplete.
+    """
+    ncols = max(value_cols) + 1
+    limit = nrows if nrows is not None else sys.maxsize
+
+    if ids is None:
+        if nrows is not None:
+            data, lines = _read_block_array(f, nrows, comment=comment, dtype=float)
+        else:
+            data, lines = None, _read_data_lines(f, limit, comment=comment)
+        if nrows is not None and len(lines) < nrows:
+            raise ValueError(f'expected {nrows} data lines, read {len(lines)}')
+        if data is None or data.shape[1] < ncols:
+            data = _parse_rows(lines, ncols, comment)
+        return data[:, 0].astype(int), data[:, value_cols]
+
+    ids = np.asarray(ids, dtype=int).reshape(-1)
+    out_ids, out_values = [], []
+    nread = 0
+    while nread < limit:
+        lines = _read_data_lines(f, min(chunk_rows, limit - nread), comment=comment)
+        if not lines:
+            break
+        nread += len(lines)
+
+        # Only the ID column is converted for the skipped rows
+        row_ids = np.array([_l.split(None, 1)[0] for _l in lines], dtype=int)
+        keep = np.flatnonzero(np.isin(row_ids, ids))
+        if keep.size == 0:
+            continue
+        data = _parse_rows([lines[_i] for _i in keep], ncols, comment)
+        out_ids.append(row_ids[keep])
+        out_values.append(data[:, value_cols])
+
+    if nrows is not None and nread < nrows:
+        raise ValueError(f'expected {nrows} data lines, read {nread}')
+    if not out_ids:
+        return np.empty(0, dtype=int), np.empty((0, len(value_cols)))
+    return np.concatenate(out_ids), np.concatenate(out_values)
+
+
+def _id_to_index(ids: ArrayLike, ref_ids: ArrayLike) -> np.ndarray:
+    """Map original (node or element) IDs to 0-based positions in ``ref_ids``.
+
+    Parameters
+    ----------
+    ids : array-like of int
+        Original IDs to look up (any shape).
+    ref_ids : array-like of int
+        Reference IDs, e.g. ``point_data['node_id']`` or the concatenated
+        ``cell_data['element_id']`` blocks.
+
+    Returns
+    -------
+    np.ndarray
+        Array of positions in ``ref_ids`` with the same shape as ``ids``.
+
+    Raises
+    ------
+    KeyError
+        If any ID in ``ids`` is not in ``ref_ids``.
+
+    Notes
+    -----
+    A dense inverse table is used when the IDs are reasonably compact,
+    otherwise a sorted search over ``ref_ids``.
+    """
+    ids = np.asarray(ids, dtype=int)
+    ref_ids = np.asarray(ref_ids, dtype=int)
+    if ids.size == 0:
+        return np.zeros(ids.shape, dtype=int)
+    if ref_ids.size == 0:
+        raise KeyError(int(ids.flat[0]))
+
+    id_min, id_max = ref_ids.min(), ref_ids.max()
+    if id_min >= 0 and id_max <= 4 * ref_ids.size + 1024:
+        table = np.full(id_max + 1, -1, dtype=int)
+        table[ref_ids] = np.arange(ref_ids.size)
+        _ids = np.clip(ids, 0, id_max)
+        index = np.where(_ids == ids, table[_ids], -1)
+        missing = index < 0
+    else:
+        order = np.argsort(ref_ids, kind='stable')
+        _pos = np.searchsorted(ref_ids, ids, sorter=order)
+        _pos = np.minimum(_pos, ref_ids.size - 1)
+        index = order[_pos]
+        missing = ref_ids[index] != ids
+
+    if np.any(missing):
+        raise KeyError(int(ids[missing].flat[0]))
+
+    return index
+
+
+def _scatter_to_cell_blocks(
+    ids: ArrayLike, values: ArrayLike, elem_ids: list, fill_value: Any = 0
+) -> list[np.ndarray]:
+    """Scatter per-element values given in file order into cell blocks.
+
+    Parameters
+    ----------
+    ids : array-like of int
+        Original element IDs, one per row of ``values``.
+    values : array-like
+        Values with shape (n,) or (n, ncomps).
+    elem_ids : list of array-like
+        Element IDs of each cell block (``cell_data['element_id']``).
+    fill_value : optional
+        Value for elements not listed in ``ids``, default is 0.
+
+    Returns
+    -------
+    list of np.ndarray
+        One array per cell block, aligned with ``elem_ids``.
+
+    Raises
+    ------
+    KeyError
+        If any ID in ``ids`` is not an element of the mesh.
+    """
+    values = np.asarray(values)
+    sizes = [len(_b) for _b in elem_ids]
+    if not sizes:
+        return []
+    all_ids = np.concatenate([np.asarray(_b, dtype=int).reshape(-1) for _b in elem_ids])
+
+    flat = np.full((all_ids.size,) + values.shape[1:], fill_value, dtype=values.dtype)
+    flat[_id_to_index(ids, all_ids)] = values
+
+    return np.split(flat, np.cumsum(sizes)[:-1])
+
+
+def _read_nodes_bulk(f: IO, nnodes: int, sgdim: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """Read node coordinates from SG format file in one block.
+
+    Parameters
+    ----------
+    f : file-like object
+        File buffer to read from (must be iterable line by line).
+    nnodes : int
+        Number of nodes to read.
+    sgdim : int, optional
+        Spatial dimension (1, 2, or 3), default is 3.
+
+    Returns
+    -------
+    points : np.ndarray
+        Array of node coordinates with shape (nnodes, 3).
+        Coordinates are padded with 0.0 for dimensions < 3.
+    node_id : np.ndarray
+        Array of original node IDs with shape (nnodes,), in file order.
+
+    Notes
+    -----
+    - The whole node block is parsed with a single NumPy call
+    - Falls back to :func:`_read_nodes` if the block is not a regular table
+      of ``1 + sgdim`` columns (e.g. malformed or ragged lines)
+    """
+    if nnodes == 0:
+        return np.zeros((0, 3), dtype=float), np.zeros(0, dtype=int)
+
+    data, lines = _read_block_array(f, nnodes, comment='!', dtype=float)
+
+    if (
+        data is None
+        or data.shape != (nnodes, sgdim + 1)
+        or np.any(data[:, 0] != np.floor(data[:, 0]))
+    ):
+        logger.debug('falling back to line-by-line node reader')
+        points, point_ids, _ = _read_nodes(io.StringIO(''.join(lines)), nnodes, sgdim)
+        node_id = np.empty(len(point_ids), dtype=int)
+        for _orig_id, _idx in point_ids.items():
+            node_id[_idx] = _orig_id
+        return points, node_id
+
+    points = np.zeros((nnodes, 3), dtype=float)
+    points[:, 3 - sgdim:] = data[:, 1:]
+    node_id = data[:, 0].astype(int)
+
+    return points, node_id
+
+
+
+
 def _sg_to_meshio_order(cell_type: str, idx: ArrayLike) -> np.ndarray:
     """Convert SG cell node ordering to meshio/VTK ordering.
     
@@ -492,9 +974,148 @@ def _sg_to_meshio_order(cell_type: str, idx: ArrayLike) -> np.ndarray:
 # Writers
 
 
+# Coordinate columns written for each sgdim and model space
+NODE_COORDINATE_COLUMNS = {
+    1: {'x': [0], 'y': [1], 'z': [2]},
+    2: {'xy': [0, 1], 'yz': [1, 2], 'zx': [2, 0]},
+    3: {'': [0, 1, 2]},
+}
+
+# Number of rows formatted and written per chunk
+WRITE_CHUNK_ROWS = 8192
+
+
+def _write_rows(
+    f: IO, row_fmt: str, columns: list, comment: str = '',
+    chunk_rows: int = WRITE_CHUNK_ROWS
+) -> None:
+    """Write a table of values with a fixed row format in large chunks.
+
+    Parameters
+    ----------
+    f : file-like object
+        File buffer to write to (must support write operations).
+    row_fmt : str
+        Format of one row without the newline, e.g. ``'{:8d}{:20.9e}'``.
+    columns : list of array-like
+        One 1D array per field in ``row_fmt``, all of the same length.
+    comment : str, optional
+        Text appended to the first row only, e.g. ``'  ! nodal coordinates'``.
+    chunk_rows : int, optional
+        Number of rows formatted per write, default is ``WRITE_CHUNK_ROWS``.
+
+    Notes
+    -----
+    Each field is formatted with ``str.format`` exactly as a per-row loop
+    would do, so the output is identical; only the Python-level loop and
+    the number of ``write`` calls are removed.
+    """
+    columns = [np.asarray(_c) for _c in columns]
+    nrows = len(columns[0]) if columns else 0
+    if nrows == 0:
+        return
+
+    f.write(row_fmt.format(*[_c[0].item() for _c in columns]) + comment + '\n')
+
+    line_fmt = (row_fmt + '\n').format
+    for i in range(1, nrows, chunk_rows):
+        chunk = [_c[i:i + chunk_rows].tolist() for _c in columns]
+        f.write(''.join(map(line_fmt, *chunk)))
+
+
+def _format_int_rows(data: np.ndarray, width: int) -> Optional[str]:
+    """Format an integer matrix as right-aligned fixed-width text rows.
+
+    Equivalent to ``('{:<width>d}' * ncols + '\\n').format(*row)`` for every
+    row, but built digit by digit with array operations.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        2D integer array.
+    width : int
+        Field width of every value.
+
+    Returns
+    -------
+    str or None
+        Formatted rows, each ending with a newline.
+        None if some value does not fit in ``width`` characters.
+    """
+    data = np.asarray(data, dtype=np.int64)
+    nrows, ncols = data.shape
+    neg = data < 0
+    mag = np.abs(data)
+    ndigits_max = len(str(int(mag.max()))) if mag.size else 1
+
+    ndigits = np.ones(data.shape, dtype=np.int64)
+    _p = 10
+    for _ in range(1, ndigits_max):
+        ndigits += mag >= _p
+        _p *= 10
+    if np.any(ndigits + neg > width):
+        return None
+
+    text = np.full((nrows, ncols * width + 1), ord(' '), dtype=np.uint8)
+    text[:, -1] = ord('\n')
+    fields = text[:, :-1].reshape(nrows, ncols, width)
+    for _pos in range(ndigits_max):
+        _digit = (mag % 10).astype(np.uint8) + ord('0')
+        mag //= 10
+        fields[:, :, width - 1 - _pos] = np.where(_pos < ndigits, _digit, ord(' '))
+    if neg.any():
+        _r, _c = np.nonzero(neg)
+        fields[_r, _c, width - 1 - ndigits[_r, _c]] = ord('-')
+
+    return text.tobytes().decode('ascii')
+
+
+def _write_int_rows(
+    f: IO, data: np.ndarray, int_fmt: str = '8d', comment: str = '',
+    chunk_rows: int = WRITE_CHUNK_ROWS
+) -> None:
+    """Write an integer matrix with the same format for every value.
+
+    Parameters
+    ----------
+    f : file-like object
+        File buffer to write to (must support write operations).
+    data : np.ndarray
+        2D integer array, one row per line.
+    int_fmt : str, optional
+        Format string of each value (default '8d').
+    comment : str, optional
+        Text appended to the first row only.
+    chunk_rows : int, optional
+        Number of rows formatted per write, default is ``WRITE_CHUNK_ROWS``.
+
+    Notes
+    -----
+    Plain width formats (``'<width>d'``) are formatted with array operations
+    (see :func:`_format_int_rows`); other formats, and chunks with values
+    wider than the field, go through :func:`_write_rows`.
+    """
+    data = np.asarray(data)
+    if len(data) == 0:
+        return
+
+    row_fmt = ('{:' + int_fmt + '}') * data.shape[1]
+    f.write(row_fmt.format(*data[0].tolist()) + comment + '\n')
+
+    width = int(int_fmt[:-1]) if int_fmt[:-1].isdigit() and int_fmt[-1] == 'd' else 0
+    line_fmt = (row_fmt + '\n').format
+    for i in range(1, len(data), chunk_rows):
+        chunk = data[i:i + chunk_rows]
+        text = _format_int_rows(chunk, width) if width > 0 else None
+        if text is None:
+            text = ''.join(map(line_fmt, *chunk.T.tolist()))
+        f.write(text)
+
+
 def _write_nodes(
     f: IO, points: np.ndarray, sgdim: int, node_id: list[int] = [],
-    model_space: str = '', int_fmt: str = '8d', float_fmt: str = '20.9e'
+    model_space: str = '', int_fmt: str = '8d', float_fmt: str = '20.9e',
+    chunk_rows: int = WRITE_CHUNK_ROWS
 ) -> None:
     """Write node coordinates to SG format file.
 
@@ -518,6 +1139,8 @@ def _write_nodes(
         Format string for integer node IDs (default '8d').
     float_fmt : str, optional
         Format string for float coordinates (default '20.9e').
+    chunk_rows : int, optional
+        Number of nodes formatted per write, default is ``WRITE_CHUNK_ROWS``.
 
     Raises
     ------
@@ -528,46 +1151,30 @@ def _write_nodes(
     -----
     Writes one node per line with format: node_id coord1 [coord2] [coord3].
     First line includes comment "! nodal coordinates".
+    The coordinate columns are selected once and the block is written
+    in chunks (see :func:`_write_rows`).
     """
-    sfi = '{:' + int_fmt + '}'
-    sff = ''.join(['{:' + float_fmt + '}', ] * sgdim)
-
-    for i, ncoord in enumerate(points):
-        nid = node_id[i] if len(node_id) > 0 else i + 1
-        f.write(sfi.format(nid))  # node id
-
-        if sgdim == 1:
-            if model_space == 'x':
-                f.write(sff.format(ncoord[0]))
-            elif model_space == 'y':
-                f.write(sff.format(ncoord[1]))
-            elif model_space == 'z':
-                f.write(sff.format(ncoord[2]))
-            else:
-                raise ValueError(f"Invalid model space: {model_space}")
-
-        elif sgdim == 2:
-            if model_space == 'xy':
-                f.write(sff.format(ncoord[0], ncoord[1]))
-            elif model_space == 'yz':
-                f.write(sff.format(ncoord[1], ncoord[2]))
-            elif model_space == 'zx':
-                f.write(sff.format(ncoord[2], ncoord[0]))
-            else:
-                raise ValueError(f"Invalid model space: {model_space}")
-
-        elif sgdim == 3:
-            f.write(sff.format(*ncoord))
-
-        # Add comment
-        if i == 0:
-            f.write('  ! nodal coordinates')
-
-        f.write('\n')
+    points = np.asarray(points)
 
-    f.write('\n')
+    if len(points) > 0:
+        if sgdim == 3:
+            model_space = ''
+        try:
+            columns = NODE_COORDINATE_COLUMNS[sgdim][model_space]
+        except KeyError:
+            raise ValueError(f"Invalid model space: {model_space}")
+
+        if len(node_id) > 0:
+            nids = np.asarray(node_id)
+        else:
+            nids = np.arange(1, len(points) + 1)
 
+        row_fmt = '{:' + int_fmt + '}' + ('{:' + float_fmt + '}') * len(columns)
+        _write_rows(
+            f, row_fmt, [nids] + [points[:, _j] for _j in columns],
+            comment='  ! nodal coordinates', chunk_rows=chunk_rows)
 
+    f.write('\n')
 
 
 def _meshio_to_sg_order(
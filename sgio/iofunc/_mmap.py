@@ -0,0 +1,285 @@
+"""
+Memory-mapped, read-only text buffer for large SG input files.
+
+The file is mapped once and a line table (start/end byte offsets and the
+first non-blank byte of every line) is built with a single vectorized scan.
+Small sections (header, materials) are read through the usual ``readline``
+interface, while the bulk numeric blocks (nodes, elements, property blocks)
+are handed to :func:`numpy.loadtxt` as one byte range, so that no Python
+string is created per line.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import mmap
+import os
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+
+from sgio.utils.io import translate_fortran_exponents
+
+logger = logging.getLogger(__name__)
+
+# Bytes scanned at a time when building the line table
+_SCAN_CHUNK_SIZE = 1 << 26
+
+_NEWLINE = ord('\n')
+_BLANK_BYTES = (ord(' '), ord('\t'), ord('\r'), ord('\f'), ord('\v'))
+
+
+class MappedTextFile:
+    """Read-only, memory-mapped text file with a line-oriented interface.
+
+    The object supports the subset of the text file protocol used by the
+    VABS and SwiftComp readers (``readline``, line iteration, context
+    manager) plus :meth:`read_block_array` for bulk numeric blocks.
+
+    Parameters
+    ----------
+    filename : str or path-like
+        Name of a regular file. Empty files and non-regular files
+        (pipes, character devices) cannot be mapped.
+    encoding : str, optional
+        Text encoding used when decoding lines, default is 'utf-8'.
+
+    Raises
+    ------
+    ValueError
+        If the file is empty or is not a regular file.
+    """
+
+    def __init__(self, filename, encoding: str = 'utf-8'):
+        self.name = os.fspath(filename)
+        self.encoding = encoding
+
+        if not os.path.isfile(self.name):
+            raise ValueError(f"Not a regular file: {self.name}")
+
+        self._file = open(self.name, 'rb')
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise ValueError(f"Cannot memory-map an empty file: {self.name}")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        self._buf = np.frombuffer(self._mm, dtype=np.uint8)
+        self._offsets, self._first = self._scan_lines()
+        self._cursor = 0
+
+    # ------------------------------------------------------------------
+    # Line table
+    # ------------------------------------------------------------------
+
+    def _scan_lines(self) -> tuple[np.ndarray, np.ndarray]:
+        """Build the line table in one pass over the mapped bytes.
+
+        Returns
+        -------
+        offsets : np.ndarray
+            Byte offsets of the line starts, plus the file size as the last
+            entry, so that line ``i`` is ``offsets[i]:offsets[i+1]``.
+        first : np.ndarray of uint8
+            First non-blank byte of each line, 0 for blank lines.
+        """
+        buf = self._buf
+        size = buf.size
+
+        newlines = [
+            np.flatnonzero(buf[i:i + _SCAN_CHUNK_SIZE] == _NEWLINE) + i
+            for i in range(0, size, _SCAN_CHUNK_SIZE)
+        ]
+        ends = np.concatenate(newlines) + 1
+        if ends.size == 0 or ends[-1] != size:
+            ends = np.append(ends, size)
+        offsets = np.empty(ends.size + 1, dtype=ends.dtype)
+        offsets[0] = 0
+        offsets[1:] = ends
+        del newlines, ends
+        starts, ends = offsets[:-1], offsets[1:]
+
+        # Skip the indentation of all lines at once; the loop runs once
+        # per indentation level, not once per line
+        pos = starts.copy()
+        active = np.flatnonzero(pos < ends)
+        while active.size > 0:
+            c = buf[pos[active]]
+            blank = np.isin(c, _BLANK_BYTES)
+            active = active[blank]
+            pos[active] += 1
+            active = active[pos[active] < ends[active]]
+
+        # A line holding only the newline character is blank as well
+        first = np.zeros(starts.size, dtype=np.uint8)
+        has_char = pos < ends
+        first[has_char] = buf[pos[has_char]]
+        first[first == _NEWLINE] = 0
+
+        return offsets, first
+
+    # ------------------------------------------------------------------
+    # Text file protocol
+    # ------------------------------------------------------------------
+
+    def _line(self, i: int) -> str:
+        return self._mm[self._offsets[i]:self._offsets[i + 1]].decode(self.encoding)
+
+    def readline(self) -> str:
+        """Read the next line, including the newline. Empty string at EOF."""
+        if self._cursor >= self._first.size:
+            return ''
+        line = self._line(self._cursor)
+        self._cursor += 1
+        return line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def close(self) -> None:
+        """Release the mapping and close the underlying file."""
+        if self._mm is not None:
+            # Drop the array view first, the mapping cannot be closed
+            # while a buffer export is alive
+            self._buf = None
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._mm is None
+
+    def __enter__(self) -> 'MappedTextFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Bulk blocks
+    # ------------------------------------------------------------------
+
+    def _find_data_lines(self, nrows: int, comment: str) -> np.ndarray:
+        """Indices of the next ``nrows`` data lines from the cursor.
+
+        Blank lines and lines starting with ``comment`` are skipped.
+        Fewer indices are returned only if the end of file is reached.
+        """
+        comment_byte = ord(comment)
+        nlines = self._first.size
+        window = nrows + 64
+        while True:
+            stop = min(self._cursor + window, nlines)
+            first = self._first[self._cursor:stop]
+            index = np.flatnonzero((first != 0) & (first != comment_byte))
+            if index.size >= nrows or stop == nlines:
+                return index[:nrows] + self._cursor
+            window *= 2
+
+    def read_block_array(
+        self, nrows: int, comment: str = '!', dtype: type = float
+    ) -> tuple[Optional[np.ndarray], Sequence[str]]:
+        """Read the next ``nrows`` data lines as a 2D array.
+
+        Same contract as :func:`sgio.iofunc._meshio._read_block_array`,
+        except that the raw lines are only decoded when accessed.
+
+        Parameters
+        ----------
+        nrows : int
+            Number of data lines (rows) to read.
+        comment : str, optional
+            Comment character, default is '!'.
+        dtype : type, optional
+            Data type of the parsed array, default is float.
+
+        Returns
+        -------
+        data : np.ndarray or None
+            Array with shape (nrows, ncols).
+            None if the block is not a regular table of numbers of ``dtype``.
+        lines : list of str
+            Raw data lines, decoded lazily on access.
+        """
+        if nrows == 0:
+            return np.empty((0, 0), dtype=dtype), []
+
+        index = self._find_data_lines(nrows, comment)
+        lines = _MappedLines(self, index)
+        if index.size == 0:
+            return None, lines
+        self._cursor = int(index[-1]) + 1
+
+        if index.size != nrows:
+            return None, lines
+
+        # Blank and comment lines between the first and last data line
+        # are skipped by the parser itself
+        block = self._mm[self._offsets[index[0]]:self._offsets[index[-1] + 1]]
+        try:
+            data = np.loadtxt(
+                io.BytesIO(block), comments=comment, dtype=dtype, ndmin=2,
+                encoding=self.encoding
+            )
+        except ValueError:
+            if not np.issubdtype(dtype, np.floating):
+                return None, lines
+            # Fortran 'd' exponents: translate the whole block once and retry
+            try:
+                data = np.loadtxt(
+                    io.BytesIO(translate_fortran_exponents(block)), comments=comment,
+                    dtype=dtype, ndmin=2, encoding=self.encoding
+                )
+            except ValueError:
+                return None, lines
+
+        return data, lines
+
+
+class _MappedLines(Sequence):
+    """Lines of a mapped file, decoded only when accessed."""
+
+    def __init__(self, mapped: MappedTextFile, index: np.ndarray):
+        self._mapped = mapped
+        self._index = index
+
+    def __len__(self) -> int:
+        return self._index.size
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._mapped._line(j) for j in self._index[i]]
+        return self._mapped._line(self._index[i])
+
+
+def open_mapped(filename, encoding: str = 'utf-8') -> Optional[MappedTextFile]:
+    """Memory-map a text file if possible.
+
+    Parameters
+    ----------
+    filename : str or path-like
+        Name of the file.
+    encoding : str, optional
+        Text encoding, default is 'utf-8'.
+
+    Returns
+    -------
+    MappedTextFile or None
+        None if the file cannot be memory-mapped (e.g. empty file, pipe,
+        or a platform without mmap support for it).
+    """
+    try:
+        return MappedTextFile(filename, encoding=encoding)
+    except (ValueError, OSError) as e:
+        logger.debug(f'cannot memory-map {filename}: {e}')
+        return None
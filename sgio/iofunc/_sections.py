@@ -0,0 +1,213 @@
+"""Table-driven parser of sectioned solver output.
+
+The homogenization output of VABS (.K) and SwiftComp (.k) is a sequence of
+titled sections, e.g.::
+
+     The Effective Stiffness Matrix
+     --------------------------------------------
+           1.4373796E+006      1.0740058E+005 ...
+
+A model reader describes the sections it needs with a table of
+``(title, name, reader)`` rows. :func:`_parse_sections` first indexes the
+title lines of the whole file, then calls the reader of each table row
+once, at the index of its title line.
+
+A title is found in any line containing it, or, if it is a compiled regular
+expression, in any line it matches. If a line contains several titles, only
+the first row of the table is used. If a title is found in several lines,
+the last one is used.
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+import re
+from typing import Callable, Union
+
+from sgio.utils.io import fortran_floats
+
+
+def _find_all(text: str, title: Union[str, re.Pattern]) -> list[int]:
+    """Offsets of all the occurrences of a title in the text."""
+    if isinstance(title, re.Pattern):
+        return [_m.start() for _m in title.finditer(text)]
+    found = []
+    pos = text.find(title)
+    while pos != -1:
+        found.append(pos)
+        pos = text.find(title, pos + len(title))
+    return found
+
+
+def _index_sections(lines: list[str], titles: list[Union[str, re.Pattern]]) -> dict[int, int]:
+    """Find the title line of each section.
+
+    Only the lines starting with a letter can hold a title, which leaves
+    out the numeric lines and the separator lines of the sections. These
+    lines are joined into one text, in which each title is searched at
+    once.
+
+    Parameters
+    ----------
+    lines : list[str]
+        Stripped lines of the output file.
+    titles : list[str or re.Pattern]
+        Section titles, in order of priority.
+
+    Returns
+    -------
+    dict[int, int]
+        Index of the last line containing each title, by title index.
+        Titles that are not found are absent.
+    """
+    title_lines = [_ln for _ln, _line in enumerate(lines) if _line[:1].isalpha()]
+    text = '\n'.join([lines[_ln] for _ln in title_lines])
+    offsets = list(itertools.accumulate(
+        [len(lines[_ln]) + 1 for _ln in title_lines], initial=0
+    ))
+
+    # Title of the highest priority in each line
+    line_title = {}
+    for i, title in enumerate(titles):
+        for pos in _find_all(text, title):
+            _ln = title_lines[bisect.bisect_right(offsets, pos) - 1]
+            line_title.setdefault(_ln, i)
+
+    index = {}
+    for _ln in sorted(line_title):
+        index[line_title[_ln]] = _ln
+
+    return index
+
+
+def _parse_sections(text: str, table: list[tuple]) -> dict:
+    """Parse the sections of an output file listed in a table.
+
+    Parameters
+    ----------
+    text : str
+        Text of the output file.
+    table : list[tuple[str or re.Pattern, str, callable]]
+        Rows of ``(title, name, reader)``. ``reader(lines, ln)`` parses the
+        section whose title is the stripped line ``lines[ln]``.
+
+    Returns
+    -------
+    dict
+        Value returned by the reader of each section found, by name, in
+        order of the sections in the file.
+    """
+    lines = [_line.strip() for _line in text.splitlines()]
+    index = _index_sections(lines, [_row[0] for _row in table])
+
+    values = {}
+    for i, ln in sorted(index.items(), key=lambda _item: _item[1]):
+        _, name, reader = table[i]
+        values[name] = reader(lines, ln)
+
+    return values
+
+
+def _data_lines(lines: list[str], ln: int, nlines: int) -> list[str]:
+    """Get the ``nlines`` data lines following the title line ``ln``.
+
+    Empty lines and separator lines ('--...', '==...') are skipped.
+    """
+    data = []
+    for line in itertools.islice(lines, ln + 1, None):
+        if line and not line.startswith(('--', '==')):
+            data.append(line)
+            if len(data) == nlines:
+                break
+    return data
+
+
+def _title_line(title: str) -> re.Pattern:
+    """Title found only in a line equal to ``title``."""
+    return re.compile(rf'^{re.escape(title)}$', re.MULTILINE)
+
+
+# Section readers
+# ---------------
+
+
+def _last_value(lines: list[str], ln: int) -> float:
+    """Last number of the title line, e.g. 'Mass per unit span  1.0E+00'."""
+    return float(lines[ln].split()[-1])
+
+
+def _equal_value(lines: list[str], ln: int) -> float:
+    """Number after '=' on the title line, e.g. 'N11T = 1.0E+00'."""
+    return float(lines[ln].split('=')[-1])
+
+
+def _point(lines: list[str], ln: int) -> list[float]:
+    """Coordinates on the first data line following the title line."""
+    line, = _data_lines(lines, ln, 1)
+    return list(map(float, line.split()))
+
+
+def _matrix(nrows: int, ncols: int) -> Callable[[list[str], int], list[list[float]]]:
+    """Reader of an ``nrows`` by ``ncols`` matrix following the title line."""
+
+    def reader(lines: list[str], ln: int) -> list[list[float]]:
+        rows = _data_lines(lines, ln, nrows)
+        if len(rows) < nrows:
+            raise ValueError(f'expected {nrows} matrix rows, got {len(rows)}')
+        return fortran_floats(rows).reshape(nrows, -1)[:, :ncols].tolist()
+
+    return reader
+
+
+def _angle(wrap: bool) -> Callable[[list[str], int], float]:
+    """Reader of the angle before 'degrees' on the title line.
+
+    If ``wrap`` is True, the angle may be on the line after the title line.
+    Otherwise, a title line without an angle gives 0.
+    """
+
+    def reader(lines: list[str], ln: int) -> float:
+        line = lines[ln].split()
+        if 'degrees' not in line:
+            if not wrap:
+                return 0
+            line = lines[ln + 1].split()
+        return float(line[line.index('degrees') - 1])
+
+    return reader
+
+
+def _constants(nlines: int) -> Callable[[list[str], int], dict[str, float]]:
+    """Reader of up to ``nlines`` 'label = value' lines after the title line.
+
+    Reading stops at the first line without '='.
+    """
+
+    def reader(lines: list[str], ln: int) -> dict[str, float]:
+        constants = {}
+        for line in _data_lines(lines, ln, nlines):
+            if '=' not in line:
+                break
+            label, _, value = line.partition('=')
+            constants[label.strip()] = float(value)
+        return constants
+
+    return reader
+
+
+def _set_attributes(obj, values: dict) -> None:
+    """Set the parsed section values as attributes of ``obj``.
+
+    A name may be a tuple of attribute names, set from the items of the
+    value, e.g. ``('xm2', 'xm3')`` for a point.
+    """
+    for name, value in values.items():
+        if isinstance(name, tuple):
+            if len(value) != len(name):
+                raise ValueError(
+                    f'expected {len(name)} values for {name}, got {len(value)}'
+                )
+            for _name, _value in zip(name, value):
+                setattr(obj, _name, _value)
+        else:
+            setattr(obj, name, value)
@@ -11,6 +11,7 @@ from typing import Any, TextIO
 
 import sgio.model as smdl
 import sgio.utils as sutl
+from sgio.iofunc._meshio import _read_block_array, _read_data_lines
 
 
 logger = logging.getLogger(__name__)
@@ -43,22 +44,26 @@ def read_material_rotation_combinations(
     logger.debug('reading combinations of material and in-plane rotations...')
     
     combinations = {}
-    
-    counter = 0
-    while counter < ncomb:
-        line = file.readline().split(comment_char)[0].strip()
-        while line == '':
-            line = file.readline().split(comment_char)[0].strip()
-        
-        line = line.split()
+
+    data, lines = _read_block_array(file, ncomb, comment=comment_char, dtype=float)
+
+    if data is not None and data.ndim == 2 and data.shape[1] >= 3:
+        for comb_id, mate_id, ip_rotation in zip(
+            data[:, 0].astype(int).tolist(),
+            data[:, 1].astype(int).tolist(),
+            data[:, 2].tolist()
+        ):
+            combinations[comb_id] = [mate_id, ip_rotation]
+        return combinations
+
+    for line in lines:
+        line = line.split(comment_char)[0].split()
         comb_id = int(line[0])
         mate_id = int(line[1])
         ip_rotation = sutl.fortran_float(line[2])
-        
+
         combinations[comb_id] = [mate_id, ip_rotation]
-        
-        counter += 1
-    
+
     return combinations
 
 
@@ -230,11 +235,9 @@ def read_elastic_property(
     else:
         nrow = 0
     
-    for i in range(nrow):
-        line = file.readline().split(comment_char)[0].strip()
-        while line == '':
-            line = file.readline().split(comment_char)[0].strip()
-        constants.extend(list(map(sutl.fortran_float, line.split())))
+    if nrow > 0:
+        lines = _read_data_lines(file, nrow, comment=comment_char)
+        constants.extend(sutl.fortran_floats(lines, comment=comment_char).tolist())
     
     return constants
 
@@ -261,7 +264,7 @@ def read_thermal_property(
     specific_heat = 0.0
     
     line = sutl.readNextNonEmptyLine(file)
-    line = list(map(sutl.fortran_float, line.split()))
+    line = sutl.fortran_floats(line).tolist()
     
     if isotropy == 0:
         cte = line[:1]
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import contextlib
 import csv
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Sequence
 import meshio
+import numpy as np
 from meshio import Mesh
 
 import sgio._global as GLOBAL
 import sgio.iofunc._meshio as _meshio
+from sgio.iofunc._mmap import open_mapped
 import sgio.iofunc.abaqus as _abaqus
 import sgio.iofunc.gmsh as _gmsh
 import sgio.iofunc.swiftcomp as _swiftcomp
 import sgio.iofunc.vabs as _vabs
 import sgio.model as sgmodel
+from sgio.model.table import ModelTable, _stack_matrices
 from sgio.core import StructureGene
 from sgio.core.numbering import ensure_node_ids
 from sgio.utils import readNextNonEmptyLine
@@ -79,6 +86,30 @@ def _safe_file_read(filename: str, mode: str = 'r'):
         raise
 
 
+def _open_input(filename: str, mmap: bool = False):
+    """Open a VABS/SwiftComp input file for reading.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+    mmap : bool
+        Try to memory-map the file first
+
+    Returns
+    -------
+    file object
+        :class:`sgio.iofunc._mmap.MappedTextFile` if ``mmap`` is True and
+        the file can be mapped, otherwise a regular text file object
+    """
+    if mmap:
+        file = open_mapped(filename)
+        if file is not None:
+            return file
+        logger.debug(f'reading {filename} as text')
+    return _safe_file_read(filename, 'r')
+
+
 def _get_file_extension(file_format: str, extension_type: str) -> str:
     """Get the appropriate file extension for a given format and type.
     
@@ -354,12 +385,298 @@ def _ensure_material_exists(sg: StructureGene, mat_name: str) -> None:
         sg.materials[mat_name] = mat
 
 
+def _add_failure_states(
+    state_case: sgmodel.StateCase, elem_id: np.ndarray, fi: np.ndarray,
+    sr: np.ndarray, eids_sr_min: list[int]
+) -> None:
+    """Add failure index, strength ratio and minimum strength ratio states.
+
+    Parameters
+    ----------
+    state_case : StateCase
+        State case to add the states to
+    elem_id : np.ndarray
+        Element IDs
+    fi : np.ndarray
+        Failure index of each element
+    sr : np.ndarray
+        Strength ratio of each element
+    eids_sr_min : list[int]
+        IDs of the elements having the lowest strength ratio
+    """
+    if np.any(elem_id[1:] <= elem_id[:-1]):
+        # Sort by element ID, keeping the last line of a repeated element
+        elem_id, index = np.unique(elem_id[::-1], return_index=True)
+        index = len(fi) - 1 - index
+        fi, sr = fi[index], sr[index]
+
+    state_case.addState(
+        name="fi", state=sgmodel.State(
+            name="fi", data=fi, label=["fi"], location="element",
+            entity_ids=elem_id
+        )
+    )
+    state_case.addState(
+        name="sr", state=sgmodel.State(
+            name="sr", data=sr, label=["sr"], location="element",
+            entity_ids=elem_id
+        )
+    )
+    missing = np.setdiff1d(eids_sr_min, elem_id)
+    if missing.size > 0:
+        raise KeyError(int(missing[0]))
+    mask = np.isin(elem_id, eids_sr_min)
+    state_case.addState(
+        name="sr_min", state=sgmodel.State(
+            name="sr_min", data=sr[mask], label=["sr_min"], location="element",
+            entity_ids=elem_id[mask]
+        )
+    )
+
+
+def _lowest_strength_ratios(
+    elem_id: np.ndarray, sr: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the ``k`` elements having the lowest strength ratios.
+
+    Parameters
+    ----------
+    elem_id : np.ndarray
+        Element IDs
+    sr : np.ndarray
+        Strength ratio of each element
+    k : int
+        Number of elements to find
+
+    Returns
+    -------
+    np.ndarray
+        IDs of the ``k`` critical elements, from the lowest strength ratio
+    np.ndarray
+        Strength ratios of the ``k`` critical elements, in ascending order
+    """
+    k = min(k, len(sr))
+    if k < len(sr):
+        index = np.argpartition(sr, k - 1)[:k]
+    else:
+        index = np.arange(len(sr))
+    # Equal strength ratios are kept in file order
+    index = index[np.lexsort((index, sr[index]))]
+    return elem_id[index], sr[index]
+
+
+def _iter_swiftcomp_output_states(
+    filename: str, analysis: str, model_type: str, extension: list[str],
+    num_cases: int, num_elements: int, sg: StructureGene, node_ids=None, **kwargs
+) -> Iterator[sgmodel.StateCase]:
+    """Yield SwiftComp output state data one load case at a time.
+
+    All requested output files are opened together and each load case is
+    read from them just before it is yielded.
+
+    Parameters
+    ----------
+    filename : str
+        Base filename
+    analysis : str
+        Analysis type
+    model_type : str
+        Model type
+    extension : list[str]
+        Extensions to read
+    num_cases : int
+        Number of cases
+    num_elements : int
+        Number of elements
+    sg : StructureGene
+        Structure gene object
+    node_ids : array-like of int, optional
+        Only read the displacement of these nodes
+    **kwargs
+        Additional arguments
+
+    Yields
+    ------
+    StateCase
+        State case of the next load case
+
+    Raises
+    ------
+    ValueError
+        If no data is read for a load case
+    """
+    if analysis == "fi":
+        # Failure indices of all load cases are read as one set
+        with open(f"{filename}.fi", "r") as file:
+            elem_id, fi, sr, eids_sr_min = (
+                _swiftcomp._read_output_failure_index_array(file)
+            )
+        state_case = sgmodel.StateCase({}, {})
+        _add_failure_states(state_case, elem_id, fi, sr, eids_sr_min)
+        yield state_case
+        return
+
+    if analysis != "d" and analysis != "l":
+        return
+
+    if num_elements == 0 and sg is not None:
+        num_elements = sg.nelems
+
+    with contextlib.ExitStack() as stack:
+        files = {}
+        for _ext, _description in (
+            ('u', 'displacement'),
+            ('sn', 'element node strain and stress'),
+            ('snm', 'element node strain and stress in material c/s'),
+        ):
+            if _ext in extension:
+                logger.info(f'reading {_description}... {filename}.{_ext}')
+                files[_ext] = stack.enter_context(open(f"{filename}.{_ext}", "r"))
+
+        for _ in range(num_cases):
+            state_case = sgmodel.StateCase({}, {})
+
+            if 'u' in files:
+                state_case.addState(
+                    name="u", state=_swiftcomp._read_output_node_disp_case_state(
+                        files['u'], sg.nnodes, node_ids=node_ids
+                    )
+                )
+
+            # Element node strain and stress, in the global and
+            # the material coordinate systems
+            for _ext, _suffix in (('sn', ''), ('snm', 'm')):
+                if _ext not in files:
+                    continue
+                strains, stresses = _swiftcomp._read_output_node_strain_stress_case_arrays(
+                    files[_ext], num_elements
+                )
+                states = _swiftcomp._build_element_node_strain_stress_states(
+                    strains, stresses, suffix=_suffix
+                )
+                for name, state in states.items():
+                    state_case.addState(name=name, state=state)
+
+            yield state_case
+
+
+def _vabs_num_elements(num_elements: int, sg: StructureGene) -> int:
+    """Number of elements of VABS element outputs, from the SG if not given.
+
+    Raises
+    ------
+    ValueError
+        If neither ``num_elements`` nor ``sg`` gives the number of elements.
+    """
+    if num_elements < 1 and sg is not None:
+        num_elements = sg.nelems
+    if num_elements < 1:
+        raise ValueError(
+            "Unknown number of elements: give sg or num_elements to read "
+            "VABS element output"
+        )
+    return num_elements
+
+
+def _iter_vabs_output_states(
+    filename: str, analysis: str, extension: list[str],
+    num_cases: int, num_elements: int, sg: StructureGene,
+    tool_version: str, node_ids=None, **kwargs
+) -> Iterator[sgmodel.StateCase]:
+    """Yield VABS output state data one load case at a time.
+
+    All requested output files are opened together and each load case is
+    read from them just before it is yielded.
+
+    Parameters
+    ----------
+    filename : str
+        Base filename
+    analysis : str
+        Analysis type
+    extension : list[str]
+        Extensions to read
+    num_cases : int
+        Number of cases
+    num_elements : int
+        Number of elements
+    sg : StructureGene
+        Structure gene object
+    tool_version : str
+        Tool version
+    node_ids : array-like of int, optional
+        Only read the displacement of these nodes
+    **kwargs
+        Additional arguments
+
+    Yields
+    ------
+    StateCase
+        State case of the next load case
+
+    Raises
+    ------
+    ValueError
+        If a load case is incomplete, or the number of elements of the
+        element outputs is unknown
+    """
+    if analysis == "fi" or (analysis in ("d", "l") and "ele" in extension):
+        num_elements = _vabs_num_elements(num_elements, sg)
+
+    with contextlib.ExitStack() as stack:
+        files = {}
+        if analysis == "fi":
+            files['fi'] = stack.enter_context(open(f"{filename}.fi", "r"))
+        elif analysis == "d" or analysis == "l":
+            if "u" in extension:
+                files['u'] = stack.enter_context(open(f"{filename}.U", "r"))
+            if "ele" in extension:
+                files['ele'] = stack.enter_context(open(f"{filename}.ELE", "r"))
+        if not files:
+            return
+
+        # Element outputs of version 4.1+ start each load case with a header
+        has_case_header = float(tool_version) > 4
+
+        for _ in range(num_cases):
+            state_case = sgmodel.StateCase({}, {})
+
+            if 'fi' in files:
+                if has_case_header:
+                    _vabs._readOutputCaseHeader(files['fi'])
+                elem_id, fi, sr, eids_sr_min = _vabs._readOutputFailureIndexArray(
+                    files['fi'], num_elements
+                )
+                _add_failure_states(state_case, elem_id, fi, sr, eids_sr_min)
+
+            if 'u' in files:
+                # Without the SG, the whole file is one load case
+                nnode = sg.nnodes if sg is not None else None
+                state_case.addState(
+                    name="u", state=_vabs._readOutputNodeDisplacementState(
+                        files['u'], nnode, node_ids=node_ids
+                    )
+                )
+
+            if 'ele' in files:
+                if has_case_header:
+                    _vabs._readOutputCaseHeader(files['ele'])
+                elem_id, values = _vabs._readOutputElementStrainStressArray(
+                    files['ele'], num_elements
+                )
+                states = _vabs._buildElementStrainStressStates(elem_id, values)
+                for name, state in states.items():
+                    state_case.addState(name=name, state=state)
+
+            yield state_case
+
+
 def _read_swiftcomp_output_state(
-    filename: str, analysis: str, model_type: str, extension: list[str], 
+    filename: str, analysis: str, model_type: str, extension: list[str],
     num_cases: int, num_elements: int, sg: StructureGene, **kwargs
 ) -> list[sgmodel.StateCase]:
     """Read SwiftComp output state data.
-    
+
     Parameters
     ----------
     filename : str
@@ -378,125 +695,38 @@ def _read_swiftcomp_output_state(
         Structure gene object
     **kwargs
         Additional arguments
-        
+
     Returns
     -------
     list[StateCase]
         List of state cases
     """
-    state_cases = [sgmodel.StateCase({}, {}) for _ in range(num_cases)]
-    
     if analysis == "fi":
         with open(f"{filename}.fi", "r") as file:
             return _swiftcomp.read_output_buffer(
                 file, analysis=analysis, model_type=model_type, **kwargs
             )
-    
-    elif analysis == "d" or analysis == "l":
-        # Read displacement
-        if 'u' in extension:
-            if num_elements == 0:
-                num_elements = sg.nelems
-            logger.info(f'reading displacement... {filename}.u')
-            with open(f"{filename}.u", "r") as file:
-                for i_case in range(num_cases):
-                    state_case = state_cases[i_case]
-                    try:
-                        u = _swiftcomp._read_output_node_disp_case(file, sg.nnodes)
-                    except Exception as e:
-                        logger.error(f"Error: {e}")
-                        return None
-                    if u is None:
-                        logger.error("Error: No data read")
-                        return None
-                    state_case.addState(
-                        name="u", state=sgmodel.State(
-                            name="u", data=u, label=["u1", "u2", "u3"], location="node"
-                        )
-                    )
-
-        # Read element node strain and stress
-        if 'sn' in extension:
-            if num_elements == 0:
-                num_elements = sg.nelems
-            logger.info(f'reading element node strain and stress... {filename}.sn')
-            with open(f"{filename}.sn", "r") as file:
-                for i_case in range(num_cases):
-                    state_case = state_cases[i_case]
-                    try:
-                        strains, stresses = _swiftcomp._read_output_node_strain_stress_case_global_gmsh(
-                            file, num_elements, sg
-                        )
-                    except Exception as e:
-                        logger.error(f"Error: {e}")
-                        return None
-                    if strains is None or stresses is None:
-                        logger.error("Error: No data read")
-                        return None
-                    
-                    # Add strain state
-                    state_case.addState(
-                        name='e', state=sgmodel.State(
-                            name='e', data=strains,
-                            label=['e11', 'e22', 'e33', '2e23', '2e13', '2e12'],
-                            location='element_node'
-                        )
-                    )
-                    # Add stress state
-                    state_case.addState(
-                        name='s', state=sgmodel.State(
-                            name='s', data=stresses,
-                            label=['s11', 's22', 's33', 's23', 's13', 's12'],
-                            location='element_node'
-                        )
-                    )
-
-        # Read element node strain and stress in material coordinate system
-        if 'snm' in extension:
-            if num_elements == 0:
-                num_elements = sg.nelems
-            logger.info(f'reading element node strain and stress in material c/s... {filename}.snm')
-            with open(f"{filename}.snm", "r") as file:
-                for i_case in range(num_cases):
-                    state_case = state_cases[i_case]
-                    try:
-                        strains, stresses = _swiftcomp._read_output_node_strain_stress_case_global_gmsh(
-                            file, num_elements, sg
-                        )
-                    except Exception as e:
-                        logger.error(f"Error: {e}")
-                        return None
-                    if strains is None or stresses is None:
-                        logger.error("Error: No data read")
-                        return None
-                    
-                    # Add strain state in material coordinate system
-                    state_case.addState(
-                        name='em', state=sgmodel.State(
-                            name='em', data=strains,
-                            label=['e11m', 'e22m', 'e33m', '2e23m', '2e13m', '2e12m'],
-                            location='element_node'
-                        )
-                    )
-                    # Add stress state in material coordinate system
-                    state_case.addState(
-                        name='sm', state=sgmodel.State(
-                            name='sm', data=stresses,
-                            label=['s11m', 's22m', 's33m', 's23m', 's13m', 's12m'],
-                            location='element_node'
-                        )
-                    )
 
-    return state_cases
+    state_cases = _iter_swiftcomp_output_states(
+        filename, analysis, model_type, extension,
+        num_cases, num_elements, sg, **kwargs
+    )
+    try:
+        return list(state_cases)
+    except OSError:
+        raise
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        return None
 
 
 def _read_vabs_output_state(
-    filename: str, analysis: str, extension: list[str], 
-    num_cases: int, num_elements: int, sg: StructureGene, 
+    filename: str, analysis: str, extension: list[str],
+    num_cases: int, num_elements: int, sg: StructureGene,
     tool_version: str, **kwargs
 ) -> list[sgmodel.StateCase]:
     """Read VABS output state data.
-    
+
     Parameters
     ----------
     filename : str
@@ -515,127 +745,23 @@ def _read_vabs_output_state(
         Tool version
     **kwargs
         Additional arguments
-        
+
     Returns
     -------
     list[StateCase]
         List of state cases
     """
-    state_cases = [sgmodel.StateCase({}, {}) for _ in range(num_cases)]
-    
-    if analysis == "fi":
-        if num_elements == 0:
-            num_elements = sg.nelems
-        with open(f"{filename}.fi", "r") as file:
-            for i_case in range(num_cases):
-                state_case = state_cases[i_case]
-                try:
-                    if float(tool_version) > 4:
-                        line = file.readline()  # skip the first line
-                        while line.strip() == '':
-                            line = file.readline()
-                        print(f'line: {line}')
-                    fi, sr, eids_sr_min = _vabs._readOutputFailureIndexCase(file, num_elements)
-                except Exception as e:
-                    logger.error(f"Error: {e}")
-                    return None
-                if fi is None or sr is None:
-                    logger.error("Error: No data read")
-                    return None
-                
-                state_case.addState(
-                    name="fi", state=sgmodel.State(
-                        name="fi", data=fi, label=["fi"], location="element"
-                    )
-                )
-                state_case.addState(
-                    name="sr", state=sgmodel.State(
-                        name="sr", data=sr, label=["sr"], location="element"
-                    )
-                )
-                sr_min = {}
-                for eid in eids_sr_min:
-                    sr_min[eid] = sr[eid]
-                state_case.addState(
-                    name="sr_min", state=sgmodel.State(
-                        name="sr_min", data=sr_min, label=["sr_min"], location="element"
-                    )
-                )
-    
-    elif analysis == "d" or analysis == "l":
-        # Read displacement
-        if "u" in extension:
-            if num_elements == 0:
-                num_elements = sg.nelems
-            with open(f"{filename}.U", "r") as file:
-                for i_case in range(num_cases):
-                    state_case = state_cases[i_case]
-                    try:
-                        u = _vabs.read_output_buffer(file, analysis, extension="u", **kwargs)
-                    except Exception as e:
-                        logger.error(f"Error: {e}")
-                        return None
-                    if u is None:
-                        logger.error("Error: No data read")
-                        return None
-                    state_case.addState(
-                        name="u", state=sgmodel.State(
-                            name="u", data=u, label=["u1", "u2", "u3"], location="node"
-                        )
-                    )
-
-        # Read element strain and stress
-        if "ele" in extension:
-            if num_elements == 0:
-                num_elements = sg.nelems
-            with open(f"{filename}.ELE", "r") as file:
-                for i_case in range(num_cases):
-                    state_case = state_cases[i_case]
-                    ee, es, eem, esm = None, None, None, None
-                    try:
-                        if float(tool_version) > 4:
-                            line = file.readline()  # skip the first line
-                            while line.strip() == '':
-                                line = file.readline()
-                            print(f'line: {line}')
-                        ee, es, eem, esm = _vabs._readOutputElementStrainStressCase(file, num_elements)
-                    except Exception as e:
-                        logger.error(f"Error: {e}")
-                        return None
-                    if ee is None or es is None or eem is None or esm is None:
-                        logger.error("Error: No data read")
-                        return None
-                    
-                    state_case.addState(
-                        name="ee", state=sgmodel.State(
-                            name="ee", data=ee,
-                            label=["e11", "2e12", "2e13", "e22", "2e23", "e33"],
-                            location="element"
-                        )
-                    )
-                    state_case.addState(
-                        name="es", state=sgmodel.State(
-                            name="es", data=es,
-                            label=["s11", "s12", "s13", "s22", "s23", "s33"],
-                            location="element"
-                        )
-                    )
-                    state_case.addState(
-                        name="eem", state=sgmodel.State(
-                            name="eem", data=eem,
-                            label=["em11", "2em12", "2em13", "em22", "2em23", "em33"],
-                            location="element"
-                        )
-                    )
-                    state_case.addState(
-                        name="esm", state=sgmodel.State(
-                            name="esm", data=esm,
-                            label=["sm11", "sm12", "sm13", "sm22", "sm23", "sm33"],
-                            location="element"
-                        )
-                    )
-
-    return state_cases
+    state_cases = _iter_vabs_output_states(
+        filename, analysis, extension, num_cases,
+        num_elements, sg, tool_version, **kwargs
+    )
+    try:
+        return list(state_cases)
+    except OSError:
+        raise
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        return None
 
 
 def read_output_state(
@@ -688,6 +814,10 @@ def read_output_state(
         * 0 - Native format
         * 1 - Gmsh format
 
+    node_ids : array-like of int, optional
+        Only read the displacement ('u') of these nodes.
+        The other lines are skipped without being parsed.
+
     Returns
     -------
     list[StateCase]
@@ -716,6 +846,224 @@ def read_output_state(
         raise ValueError(f"Unsupported file format: {file_format}")
 
 
+def iter_output_states(
+    filename: str, file_format: str, analysis: str, model_type: str = "",
+    extension: str = "ele", sg: StructureGene = None, tool_version: str = "",
+    num_cases: int = 1, num_elements: int = 0, node_ids=None, **kwargs
+) -> Iterator[sgmodel.StateCase]:
+    """Iterate over SG dehomogenization or failure analysis output by load case.
+
+    Same as :func:`read_output_state`, but each :obj:`StateCase` is parsed
+    from the output files (.U/.ELE/.fi for VABS, .u/.sn/.snm/.fi for
+    SwiftComp) only when it is requested, so that many load cases can be
+    post-processed with constant memory.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the SG analysis output file
+    file_format : str
+        Format of the SG data file.
+        Choose one from 'vabs', 'sc', 'swiftcomp'.
+    analysis : str
+        Indicator of SG analysis.
+        Choose one from
+
+        * 'd' or 'l': Dehomogenization
+        * 'fi': Initial failure indices and strength ratios
+    model_type : str
+        Type of the macro structural model.
+    extension : str or list of str
+        Extension of the output data.
+        Default is 'ele'.
+        Include one or more of the following keywords:
+
+        * 'u': Displacement
+        * 'ele': Element strain and stress (VABS)
+        * 'sn', 'snm': Element node strain and stress (SwiftComp)
+    sg : StructureGene
+        Structure gene object
+    tool_version : str
+        Version of the tool
+    num_cases : int
+        Number of load cases
+    num_elements : int
+        Number of elements
+    node_ids : array-like of int, optional
+        Only read the displacement ('u') of these nodes.
+
+    Yields
+    ------
+    StateCase
+        State case of the next load case
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported or a load case cannot be read.
+
+    Notes
+    -----
+    SwiftComp writes the failure indices of all load cases as one set,
+    which is yielded as a single state case.
+
+    Examples
+    --------
+    Maximum failure index over all load cases, without keeping the cases:
+
+    ..  code-block:: python
+
+        fi_max = max(
+            state_case.getState('fi').data_array.max()
+            for state_case in iter_output_states(
+                'cs.sg', 'vabs', 'fi', sg=sg, tool_version='4.1', num_cases=1000)
+        )
+    """
+    logger.debug('iterating output states...')
+    logger.debug(locals())
+
+    if not isinstance(extension, list):
+        extension = [extension]
+    extension = [e.lower() for e in extension]
+
+    if file_format.lower().startswith("s"):
+        yield from _iter_swiftcomp_output_states(
+            filename, analysis, model_type, extension,
+            num_cases, num_elements, sg, node_ids=node_ids, **kwargs
+        )
+    elif file_format.lower().startswith("v"):
+        yield from _iter_vabs_output_states(
+            filename, analysis, extension, num_cases,
+            num_elements, sg, tool_version, node_ids=node_ids, **kwargs
+        )
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+
+def _iter_failure_index_arrays(
+    filename: str, file_format: str, sg: StructureGene, tool_version: str,
+    num_cases: int, num_elements: int
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, list[int]]]:
+    """Yield element IDs, failure indices and strength ratios of each load case.
+
+    SwiftComp writes the failure indices of all load cases as one set,
+    which is yielded once.
+    """
+    if file_format.lower().startswith("s"):
+        with open(f"{filename}.fi", "r") as file:
+            yield _swiftcomp._read_output_failure_index_array(file)
+
+    elif file_format.lower().startswith("v"):
+        num_elements = _vabs_num_elements(num_elements, sg)
+        has_case_header = float(tool_version) > 4
+        with open(f"{filename}.fi", "r") as file:
+            for _ in range(num_cases):
+                if has_case_header:
+                    _vabs._readOutputCaseHeader(file)
+                yield _vabs._readOutputFailureIndexArray(file, num_elements)
+
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+
+def read_output_failure_summary(
+    filename: str, file_format: str, sg: StructureGene = None,
+    tool_version: str = "", num_cases: int = 1, num_elements: int = 0,
+    top_k: int = 1
+) -> dict[str, np.ndarray]:
+    """Summarize SG failure analysis output over all load cases.
+
+    The failure indices and strength ratios (.fi) of each load case are read
+    as arrays and reduced to the case maximum failure index, the case minimum
+    strength ratio and the ``top_k`` critical elements, without building any
+    :obj:`State`.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the SG analysis output file
+    file_format : str
+        Format of the SG data file.
+        Choose one from 'vabs', 'sc', 'swiftcomp'.
+    sg : StructureGene
+        Structure gene object
+    tool_version : str
+        Version of the tool
+    num_cases : int
+        Number of load cases
+    num_elements : int
+        Number of elements
+    top_k : int
+        Number of critical elements to keep for each load case.
+        Default is 1.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Summary of each load case, with one row per case:
+
+        * 'fi_max': Maximum failure index, shape (ncase,)
+        * 'sr_min': Minimum strength ratio, shape (ncase,)
+        * 'eid_sr_min': ID of the element of the sectional strength ratio
+          reported by the solver, shape (ncase,)
+        * 'critical_eids': IDs of the ``top_k`` elements having the lowest
+          strength ratios, from the lowest, shape (ncase, top_k)
+        * 'critical_sr': Strength ratios of these elements, shape (ncase, top_k)
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported, a load case cannot be read,
+        ``top_k`` is less than 1, or the number of elements of VABS output
+        is unknown.
+
+    Notes
+    -----
+    SwiftComp writes the failure indices of all load cases as one set,
+    which is summarized as a single case.
+
+    Examples
+    --------
+    Load case and element of the lowest strength ratio of a sweep:
+
+    ..  code-block:: python
+
+        summary = read_output_failure_summary(
+            'cs.sg', 'vabs', sg=sg, tool_version='4.1', num_cases=1000)
+        case = summary['sr_min'].argmin()
+        eid = summary['critical_eids'][case, 0]
+    """
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+
+    fi_max = []
+    sr_min = []
+    eid_sr_min = []
+    critical_eids = []
+    critical_sr = []
+
+    for elem_id, fi, sr, eids_sr_min in _iter_failure_index_arrays(
+        filename, file_format, sg, tool_version, num_cases, num_elements
+    ):
+        _eids, _sr = _lowest_strength_ratios(elem_id, sr, top_k)
+        fi_max.append(fi.max())
+        sr_min.append(_sr[0])
+        eid_sr_min.append(eids_sr_min[0])
+        critical_eids.append(_eids)
+        critical_sr.append(_sr)
+
+    # Fewer than top_k critical elements if the SG has fewer elements
+    ncritical = len(critical_sr[0]) if critical_sr else top_k
+
+    return {
+        'fi_max': np.array(fi_max),
+        'sr_min': np.array(sr_min),
+        'eid_sr_min': np.array(eid_sr_min, dtype=int),
+        'critical_eids': np.array(critical_eids, dtype=int).reshape(-1, ncritical),
+        'critical_sr': np.array(critical_sr, dtype=float).reshape(-1, ncritical),
+    }
+
+
 def read(
     filename: str,
     file_format: str,
@@ -723,6 +1071,7 @@ def read(
     format_version: str = '',
     sgdim: int = 3,
     sg: StructureGene = None,
+    mmap: bool = False,
     **kwargs
 ) -> StructureGene:
     """Read SG data file.
@@ -750,6 +1099,11 @@ def read(
         Choose one from 1, 2, 3.
     sg : :obj:`sgio.core.sg.StructureGene`, optional
         Structure gene object
+    mmap : bool, optional
+        Memory-map VABS/SwiftComp input files and parse the node, element
+        and property blocks directly from the mapped bytes.
+        Recommended for very large (3D) SG files. Files that cannot be
+        mapped (e.g. pipes) are read as text. Default is False.
 
     Returns
     -------
@@ -762,12 +1116,12 @@ def read(
     # sutils.check_file_exists(filename)
     file_format = file_format.lower()
     if file_format == 'sc' or file_format == 'swiftcomp':
-        with open(filename, 'r') as file:
+        with _open_input(filename, mmap) as file:
             sg = _swiftcomp.read_input_buffer(
                 file, format_version, model_type
             )
     elif file_format == 'vabs':
-        with open(filename, 'r') as file:
+        with _open_input(filename, mmap) as file:
             sg = _vabs.read_buffer(
                 file, format_version
             )
@@ -817,15 +1171,7 @@ def read_output_model(
 
     model = None
     try:
-        with open(filename, "r") as file:
-            if file_format.lower().startswith("s"):
-                model = _swiftcomp.read_output_buffer(
-                    file, analysis="h", model_type=model_type, sg=sg, **kwargs
-                )
-            elif file_format.lower().startswith("v"):
-                model = _vabs.read_output_buffer(
-                    file, analysis="h", sg=sg, model_type=model_type, **kwargs
-                )
+        model = _read_output_model_file(filename, file_format, model_type, sg, **kwargs)
     except FileNotFoundError:
         logger.error(f"File not found: {filename}")
     except Exception as e:
@@ -834,6 +1180,157 @@ def read_output_model(
     return model
 
 
+def _read_output_model_file(
+    filename: str, file_format: str, model_type: str = "", sg: StructureGene = None,
+    **kwargs
+):
+    """Read SG homogenization output file, raising on failure."""
+    if file_format.lower().startswith("s"):
+        read_output_buffer = _swiftcomp.read_output_buffer
+    elif file_format.lower().startswith("v"):
+        read_output_buffer = _vabs.read_output_buffer
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+    with open(filename, "r") as file:
+        return read_output_buffer(
+            file, analysis="h", model_type=model_type, sg=sg, **kwargs
+        )
+
+
+def _read_output_model_task(
+    filename: str, file_format: str, model_type: str, sg: StructureGene, kwargs: dict
+) -> tuple:
+    """Read one output file of a batch, returning the model or the error."""
+    try:
+        return _read_output_model_file(filename, file_format, model_type, sg, **kwargs), None
+    except FileNotFoundError:
+        return None, f"File not found: {filename}"
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+# Arguments shared by the files of a batch, set once in each worker process
+_worker_read_output_model_args = ()
+
+
+def _init_read_output_model_worker(*args) -> None:
+    """Store the arguments shared by the files of a batch in a worker process.
+
+    The SG is sent once per worker, instead of once per file.
+    """
+    global _worker_read_output_model_args
+    _worker_read_output_model_args = args
+
+
+def _read_output_model_worker_task(filename: str) -> tuple:
+    """Read one output file of a batch in a worker process."""
+    return _read_output_model_task(filename, *_worker_read_output_model_args)
+
+
+def read_output_models(
+    filenames: Sequence[str], file_format: str, model_type: str = "",
+    sg: StructureGene = None, workers: int | None = None,
+    stack: bool | Sequence[str] = False, table: bool = False, **kwargs
+) -> dict:
+    """Read many SG homogenization output files in parallel.
+
+    Each file is read independently by :func:`read_output_model` in a pool
+    of worker processes. A file that cannot be read does not stop the
+    batch; its error is reported in the result instead.
+
+    Parameters
+    ----------
+    filenames : Sequence[str]
+        Names of the SG analysis output files
+    file_format : str
+        Format of the SG data file.
+        Choose one from 'vabs', 'sc', 'swiftcomp'.
+    model_type : str
+        Type of the macro structural model.
+    sg : StructureGene, optional
+        SG object, sent once to each worker process.
+    workers : int, optional
+        Number of worker processes. Default is the number of CPUs.
+        With 1 worker, or a single file, the files are read in the
+        current process.
+    stack : bool or Sequence[str]
+        Names of the matrix attributes of the models (e.g. 'stff', 'mass',
+        'cmpl') to stack into (nfile, nrow, ncol) arrays.
+        True stacks 'stff' and 'mass'. Default is False.
+    table : bool
+        Also return the models as a :class:`sgio.model.ModelTable`.
+        Default is False.
+
+    Returns
+    -------
+    dict
+        Result of the batch:
+
+        * 'models': Model of each file, in the order of ``filenames``,
+          or None if the file could not be read
+        * 'errors': Error message of each file that could not be read,
+          by index in ``filenames``
+        * one (nfile, nrow, ncol) array per stacked matrix, by attribute
+          name, with rows of NaN for the files without it. Matrices that
+          no model has are left out.
+        * 'table': :class:`sgio.model.ModelTable` of the models, if
+          ``table`` is True and at least one model was read
+
+    Examples
+    --------
+    Stiffness matrices of a design of experiments:
+
+    ..  code-block:: python
+
+        filenames = [f'doe/cs_{i}.sg.K' for i in range(10000)]
+        result = read_output_models(
+            filenames, 'vabs', model_type='BM2', workers=8, stack=True)
+        stff = result['stff']  # (10000, 6, 6)
+        failed = [filenames[i] for i in result['errors']]
+    """
+    filenames = [str(_fn) for _fn in filenames]
+    args = (file_format, model_type, sg, kwargs)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(filenames)))
+
+    if workers == 1:
+        results = [_read_output_model_task(_fn, *args) for _fn in filenames]
+    else:
+        chunksize = max(1, len(filenames) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_read_output_model_worker,
+            initargs=args
+        ) as executor:
+            results = list(executor.map(
+                _read_output_model_worker_task, filenames, chunksize=chunksize
+            ))
+
+    models = []
+    errors = {}
+    for i, (model, error) in enumerate(results):
+        models.append(model)
+        if error is not None:
+            errors[i] = error
+            logger.error(error)
+
+    batch = {'models': models, 'errors': errors}
+
+    if stack is True:
+        stack = ('stff', 'mass')
+    for name in (stack or ()):
+        stacked = _stack_matrices(models, name)
+        if stacked is not None:
+            batch[name] = stacked
+
+    if table and any(_model is not None for _model in models):
+        batch['table'] = ModelTable.from_models(models)
+
+    return batch
+
+
 def read_output(
     filename: str, file_format: str, analysis: str = 'h', model_type: str = '',
     sg: StructureGene = None, **kwargs
@@ -943,7 +1440,8 @@ def write(
     model_space: str = '', prop_ref_y: str = 'x',
     macro_responses: list[sgmodel.StateCase] = [], model_type: str = 'SD1',
     load_type: int = 0, sfi: str = '8d', sff: str = '20.12e', mesh_only: bool = False,
-    binary: bool = False
+    binary: bool = False, chunk_rows: int = _meshio.WRITE_CHUNK_ROWS,
+    buffer_size: int = -1
 ) -> str:
     """Write analysis input.
 
@@ -981,6 +1479,14 @@ def write(
         String formatting floats. Default is '20.12e'
     mesh_only : bool, optional
         If write meshing data only. Default is False
+    chunk_rows : int, optional
+        Number of nodes/elements formatted and written at a time for
+        VABS/SwiftComp inputs. Together with ``buffer_size`` this bounds the
+        memory used for writing, on top of the mesh arrays themselves.
+        Default is ``WRITE_CHUNK_ROWS``
+    buffer_size : int, optional
+        Size in bytes of the output file buffer, passed to :func:`open`.
+        Default is -1 (system default)
     """
 
     logger.info('Writing file...')
@@ -999,7 +1505,7 @@ def write(
         raise ValueError('structure_gene.mesh is None')
 
     # Open the file and write the data
-    with open(filename, 'w', encoding='utf-8') as file:
+    with open(filename, 'w', encoding='utf-8', buffering=buffer_size) as file:
         if file_format.startswith('s'):
             if format_version == '':
                 format_version = GLOBAL.SC_VERSION_DEFAULT
@@ -1010,7 +1516,8 @@ def write(
                 macro_responses=macro_responses,
                 model_space=model_space, prop_ref_y=prop_ref_y,
                 load_type=load_type,
-                sfi=sfi, sff=sff, version=format_version
+                sfi=sfi, sff=sff, version=format_version,
+                chunk_rows=chunk_rows
             )
 
         elif file_format.startswith('v'):
@@ -1023,7 +1530,7 @@ def write(
                 macro_responses=macro_responses, model=model_type,
                 model_space=model_space, prop_ref_y=prop_ref_y,
                 sfi=sfi, sff=sff, version=format_version,
-                mesh_only=mesh_only
+                mesh_only=mesh_only, chunk_rows=chunk_rows
             )
 
         elif file_format.startswith('gmsh'):
@@ -12,7 +12,13 @@ Main Functions
 Internal Functions
 ------------------
 - _read_output_node_disp_case: Parse node displacement data
+- _read_output_node_disp_case_array: Parse node displacement data as arrays
+- _read_output_node_disp_case_state: Parse node displacement data as a State
 - _read_output_node_strain_stress_case_global_gmsh: Parse node strain/stress in Gmsh format
+- _read_output_node_strain_stress_case_arrays: Parse node strain/stress in Gmsh format as arrays
+- _build_element_node_strain_stress_states: Build node strain/stress states from arrays
+- _add_element_node_groups_to_mesh: Add node strain/stress arrays to mesh.cell_point_data
+- _read_output_failure_index_array: Parse failure index data as arrays
 """
 
 from __future__ import annotations
@@ -21,7 +27,13 @@ from ._global import *
 
 from ._output import (
     _read_output_node_disp_case,
+    _read_output_node_disp_case_array,
+    _read_output_node_disp_case_state,
     _read_output_node_strain_stress_case_global_gmsh,
+    _read_output_node_strain_stress_case_arrays,
+    _build_element_node_strain_stress_states,
+    _add_element_node_groups_to_mesh,
+    _read_output_failure_index_array,
 )
 
 from ._swiftcomp import (
@@ -8,6 +8,7 @@ from sgio.core.sg import StructureGene
 from ._mesh import (
     read_buffer,
     write_buffer,
+    WRITE_CHUNK_ROWS,
 )
 from ..common import (
     read_material_rotation_combinations,
@@ -167,7 +168,8 @@ def _readThermalProperty(file, isotropy:int):
 def writeInputBuffer(
     sg, file, analysis, physics,
     model_space, prop_ref_y,
-    sfi:str='8d', sff:str='20.12e', version=None):
+    sfi:str='8d', sff:str='20.12e', version=None,
+    chunk_rows:int=WRITE_CHUNK_ROWS):
     """
     """
 
@@ -186,7 +188,7 @@ def writeInputBuffer(
         sgdim=sg.sgdim,
         model_space=model_space,
         prop_ref_y=prop_ref_y,
-        int_fmt=sfi, float_fmt=sff
+        int_fmt=sfi, float_fmt=sff, chunk_rows=chunk_rows
         )
 
     # Get material ID mapping for export
@@ -282,7 +284,7 @@ def writeInputBufferGlobal(
 
 def _writeMesh(
     mesh, file, sgdim, model_space, prop_ref_y='x',
-    int_fmt='8d', float_fmt='20.12e'
+    int_fmt='8d', float_fmt='20.12e', chunk_rows=WRITE_CHUNK_ROWS
     ):
     """Write mesh data to SwiftComp format."""
     logger.debug('writing mesh...')
@@ -290,7 +292,7 @@ def _writeMesh(
     write_buffer(
         file, mesh, sgdim=sgdim,
         model_space=model_space, prop_ref_y=prop_ref_y,
-        int_fmt=int_fmt, float_fmt=float_fmt)
+        int_fmt=int_fmt, float_fmt=float_fmt, chunk_rows=chunk_rows)
 
     return
 
@@ -2,6 +2,7 @@
 I/O for SwiftComp format
 """
 from __future__ import annotations
+import io
 import logging
 from typing import TextIO, List, Dict, Tuple, Optional, Union
 
@@ -13,8 +14,14 @@ from sgio.iofunc._meshio import (
     register_sgmesh_format,
     _meshio_to_sg_order,
     _sg_to_meshio_order,
-    _read_nodes,
+    _read_nodes_bulk,
+    _read_block_array,
+    _id_to_index,
+    _scatter_to_cell_blocks,
     _write_nodes,
+    _write_int_rows,
+    _write_rows,
+    WRITE_CHUNK_ROWS,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,6 +32,16 @@ NODE_COUNT_2D = 9  # Node count for 2D elements
 NODE_COUNT_3D = 20  # Node count for 3D elements
 CSYS_MATRIX_SIZE = 9  # Coordinate system transformation matrix size (3x3)
 
+# Element types of each element family, keyed by the number of nodes
+ELEMENT_FAMILY_TYPES = {
+    'triangle': {3: 'triangle', 6: 'triangle6'},
+    'quad': {4: 'quad', 8: 'quad8', 9: 'quad9'},
+    'tetra': {4: 'tetra', 10: 'tetra10'},
+    'wedge': {6: 'wedge', 15: 'wedge15'},
+    'hexahedron': {8: 'hexahedron', 20: 'hexahedron20'},
+}
+ELEMENT_FAMILIES = ('line', 'triangle', 'quad', 'tetra', 'wedge', 'hexahedron')
+
 
 def _determine_element_type(node_ids: List, elem_id: int) -> Tuple[str, List[int]]:
     """Determine element type from node IDs and convert to integers.
@@ -57,33 +74,66 @@ def _determine_element_type(node_ids: List, elem_id: int) -> Tuple[str, List[int
     try:
         if len(node_ids) == NODE_COUNT_1D:  # 1d elements
             node_ids = [int(_i) for _i in node_ids if _i != '0']
-            if len(node_ids) == 2:
-                cell_type = 'line'
-            else:
-                cell_type = 'line{}'.format(len(node_ids))
+            cell_type = _line_element_type(len(node_ids))
         elif len(node_ids) == NODE_COUNT_2D:  # 2d elements
             if node_ids[3] == '0':  # triangle
                 node_ids = [int(_i) for _i in node_ids if _i != '0']
-                cell_type = {3: 'triangle', 6: 'triangle6'}[len(node_ids)]
+                cell_type = ELEMENT_FAMILY_TYPES['triangle'][len(node_ids)]
             else:  # quadrilateral
                 node_ids = [int(_i) for _i in node_ids if _i != '0']
-                cell_type = {4: 'quad', 8: 'quad8', 9: 'quad9'}[len(node_ids)]
+                cell_type = ELEMENT_FAMILY_TYPES['quad'][len(node_ids)]
         elif len(node_ids) == NODE_COUNT_3D:  # 3d elements
             if node_ids[4] == '0':  # tetrahedral
                 node_ids = [int(_i) for _i in node_ids if _i != '0']
-                cell_type = {4: 'tetra', 10: 'tetra10'}[len(node_ids)]
+                cell_type = ELEMENT_FAMILY_TYPES['tetra'][len(node_ids)]
             elif node_ids[6] == '0':  # wedge
                 node_ids = [int(_i) for _i in node_ids if _i != '0']
-                cell_type = {6: 'wedge', 15: 'tetra15'}[len(node_ids)]
+                cell_type = ELEMENT_FAMILY_TYPES['wedge'][len(node_ids)]
             else:  # hexahedron
                 node_ids = [int(_i) for _i in node_ids if _i != '0']
-                cell_type = {8: 'hexahedron', 20: 'hexahedron20'}[len(node_ids)]
+                cell_type = ELEMENT_FAMILY_TYPES['hexahedron'][len(node_ids)]
     except (ValueError, KeyError) as e:
         raise ValueError(f"Invalid node IDs or element type for element {elem_id}: {e}")
     
     return cell_type, node_ids
 
 
+def _line_element_type(nnode: int) -> str:
+    """Return the line element type with the given number of nodes."""
+    return 'line' if nnode == 2 else 'line{}'.format(nnode)
+
+
+def _element_family(conn: np.ndarray) -> Optional[np.ndarray]:
+    """Determine the element family of each row of a connectivity block.
+
+    Parameters
+    ----------
+    conn : numpy.ndarray
+        Node slots of the elements, shape (nelem, nslots), zero-padded
+
+    Returns
+    -------
+    numpy.ndarray or None
+        Index into ``ELEMENT_FAMILIES`` for each element, or None if the
+        number of node slots is not recognized
+
+    Notes
+    -----
+    The family is derived from the zero slots written by
+    ``_meshio_to_sg_order``: 2D rows with slot 4 empty are triangles,
+    3D rows with slot 5 empty are tetrahedra and rows with slot 7 empty
+    are wedges.
+    """
+    nelem, nslots = conn.shape
+    if nslots == NODE_COUNT_1D:
+        return np.zeros(nelem, dtype=int)
+    elif nslots == NODE_COUNT_2D:
+        return np.where(conn[:, 3] == 0, 1, 2)
+    elif nslots == NODE_COUNT_3D:
+        return np.where(conn[:, 4] == 0, 3, np.where(conn[:, 6] == 0, 4, 5))
+    return None
+
+
 def read_buffer(f: TextIO, sgdim: int, nnode: int, nelem: int, read_local_frame: bool) -> SGMesh:
     """Read SwiftComp mesh data from a file buffer.
     
@@ -137,7 +187,6 @@ def read_buffer(f: TextIO, sgdim: int, nnode: int, nelem: int, read_local_frame:
     # Initialize the optional data fields
     points = []
     cells = []
-    cell_ids = []
     point_sets = {}
     cell_sets = {}
     cell_sets_element = {}  # Handle cell sets defined in ELEMENT
@@ -148,31 +197,20 @@ def read_buffer(f: TextIO, sgdim: int, nnode: int, nelem: int, read_local_frame:
     point_ids = None
 
     # Read nodes
-    points, point_ids, line = _read_nodes(f, nnode, sgdim)
-    if point_ids:
-        # Map original node IDs back to array order for point_data['node_id']
-        n_nodes = len(points)
-        node_id = np.empty(n_nodes, dtype=int)
-        for _orig_id, _idx in point_ids.items():
-            node_id[_idx] = _orig_id
+    points, node_id = _read_nodes_bulk(f, nnode, sgdim)
+    if len(node_id) > 0:
         point_data["node_id"] = node_id
 
     # Read elements
-    cells, elem_ids, prop_ids, cell_ids, line = _read_elements(f, nelem, point_ids)
+    cells, elem_ids, prop_ids = _read_elements_bulk(f, nelem, node_id)
 
-    # Set element_id cell data
+    # Set element_id and property_id cell data
     cell_data["element_id"] = elem_ids
-
-    # Build property_id cell data from prop_ids mapping
-    _cd = []
-    for _cb in cells:
-        _ct = _cb[0]
-        _cd.append(prop_ids[_ct])
-    cell_data["property_id"] = _cd
+    cell_data["property_id"] = prop_ids
 
     if read_local_frame:
         # Read local coordinate system for sectional properties
-        cell_csys = _read_property_ref_csys(f, nelem, cells, cell_ids)
+        cell_csys = _read_property_ref_csys(f, nelem, elem_ids)
         cell_data["property_ref_csys"] = cell_csys
 
     from sgio.core.numbering import (
@@ -290,12 +328,110 @@ def _read_elements(f: TextIO, nelem: int, point_ids: Dict) -> Tuple:
 
 
 
+def _read_elements_bulk(f: TextIO, nelem: int, node_id: np.ndarray) -> Tuple:
+    """Read element connectivity and properties as a columnar block.
+
+    Parses the whole element block into an integer matrix, determines the
+    element type of every row in bulk and groups the rows into cell blocks.
+
+    Parameters
+    ----------
+    f : TextIO
+        File buffer object to read from
+    nelem : int
+        Number of elements to read
+    node_id : numpy.ndarray
+        Original node IDs of the mesh points, in point order
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        - cells : list of tuples
+            Element data organized by type [(cell_type, connectivity), ...]
+        - elem_ids : list of numpy.ndarray
+            Element IDs for each cell block
+        - prop_ids : list of numpy.ndarray
+            Property IDs for each cell block
+
+    Raises
+    ------
+    ValueError
+        If element type cannot be determined or node IDs are not found
+
+    Notes
+    -----
+    Cell blocks are ordered by first appearance, as in :func:`_read_elements`,
+    which is used as the fallback for blocks that are not a regular integer
+    table.
+    """
+    data, lines = _read_block_array(f, nelem, comment='#', dtype=int)
+
+    family = None
+    if data is not None and nelem > 0:
+        family = _element_family(data[:, 2:])
+
+    if data is None or (nelem > 0 and family is None):
+        logger.debug('falling back to line-by-line element reader')
+        point_ids = dict(zip(np.asarray(node_id).tolist(), range(len(node_id))))
+        cells, elem_ids, prop_ids, _, _ = _read_elements(
+            io.StringIO(''.join(lines)), nelem, point_ids)
+        return (
+            cells,
+            [np.asarray(_b, dtype=int) for _b in elem_ids],
+            [np.asarray(prop_ids[_ct], dtype=int) for _ct, _ in cells],
+        )
+
+    cells = []
+    elem_ids = []
+    prop_ids = []
+    if nelem == 0:
+        return cells, elem_ids, prop_ids
+
+    elem_id = data[:, 0]
+    prop_id = data[:, 1]
+    conn = data[:, 2:]
+    mask = conn != 0
+    counts = mask.sum(axis=1)
+
+    # Resolve the element type of each distinct (family, node count) pair
+    keys = family * (NODE_COUNT_3D + 1) + counts
+    _keys, _first = np.unique(keys, return_index=True)
+
+    for k in np.argsort(_first):
+        rows = np.flatnonzero(keys == _keys[k])
+        _family = ELEMENT_FAMILIES[family[_first[k]]]
+        _nnode = int(counts[_first[k]])
+        try:
+            if _family == 'line':
+                cell_type = _line_element_type(_nnode)
+            else:
+                cell_type = ELEMENT_FAMILY_TYPES[_family][_nnode]
+        except KeyError as e:
+            raise ValueError(
+                f"Invalid node IDs or element type for element {elem_id[rows[0]]}: {e}")
+
+        _nids = conn[rows][mask[rows]].reshape(-1, _nnode)
+        try:
+            _point_ids = _id_to_index(_nids, node_id)
+        except KeyError as e:
+            raise ValueError(f"Node ID {e} in element list not found in node list")
+
+        cells.append((cell_type, _point_ids))
+        elem_ids.append(elem_id[rows])
+        prop_ids.append(prop_id[rows])
+
+    return cells, elem_ids, prop_ids
+
+
+
 
 
 
 
 
-def _read_property_ref_csys(file: TextIO, nelem: int, cells: List, cell_ids: Dict) -> List[np.ndarray]:
+
+def _read_property_ref_csys(file: TextIO, nelem: int, elem_ids: List) -> List[np.ndarray]:
     """Read local coordinate system data for element properties.
     
     Parses reference coordinate system definitions for each element,
@@ -307,10 +443,8 @@ def _read_property_ref_csys(file: TextIO, nelem: int, cells: List, cell_ids: Dic
         File buffer object to read from
     nelem : int
         Number of elements to read coordinate systems for
-    cells : list of tuples
-        Element data organized by type
-    cell_ids : dict
-        Mapping from element ID to (cell_type_index, element_index)
+    elem_ids : list of numpy.ndarray
+        Element IDs for each cell block
         
     Returns
     -------
@@ -321,41 +455,44 @@ def _read_property_ref_csys(file: TextIO, nelem: int, cells: List, cell_ids: Dic
     Raises
     ------
     ValueError
-        If coordinate system data format is invalid
-    IndexError
-        If element IDs are out of range
+        If coordinate system data format is invalid or an element ID
+        is not in the element list
+
+    Notes
+    -----
+    The block is parsed in one pass and scattered into the cell blocks
+    through an element ID lookup; malformed blocks are re-parsed line by
+    line to report the offending line.
     """
 
-    cell_csys = []
-    counter = 0
-    while counter < nelem:
-        line = file.readline().strip()
-        if line == "": continue
+    data, lines = _read_block_array(file, nelem, comment='#', dtype=float)
 
-        line = line.split()
+    if data is None or data.shape[1] != CSYS_MATRIX_SIZE + 1:
+        data = np.zeros((len(lines), CSYS_MATRIX_SIZE + 1))
+        for counter, line in enumerate(lines):
+            line = line.split()
 
-        try:
-            elem_id = int(line[0])
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid element ID on coordinate system line {counter + 1}: {e}")
-        
-        try:
-            elem_csys = list(map(float, line[1:]))
-        except ValueError as e:
-            raise ValueError(f"Invalid coordinate system values for element {elem_id}: {e}")
-        
-        try:
-            cell_block_id, cell_id = cell_ids[elem_id]
-        except KeyError:
-            raise ValueError(f"Element ID {elem_id} not found in element list")
+            try:
+                elem_id = int(line[0])
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"Invalid element ID on coordinate system line {counter + 1}: {e}")
 
-        if cell_block_id > len(cell_csys) - 1:
-            _ncell = len(cells[cell_block_id][1])
-            cell_csys.append(np.zeros((_ncell, CSYS_MATRIX_SIZE)))
+            try:
+                elem_csys = list(map(float, line[1:]))
+            except ValueError as e:
+                raise ValueError(f"Invalid coordinate system values for element {elem_id}: {e}")
 
-        cell_csys[cell_block_id][cell_id] = elem_csys
+            if len(elem_csys) != CSYS_MATRIX_SIZE:
+                raise ValueError(
+                    f"Invalid coordinate system values for element {elem_id}: "
+                    f"expected {CSYS_MATRIX_SIZE} values, got {len(elem_csys)}")
 
-        counter += 1
+            data[counter] = [elem_id] + elem_csys
+
+    try:
+        cell_csys = _scatter_to_cell_blocks(data[:, 0].astype(int), data[:, 1:], elem_ids)
+    except KeyError as e:
+        raise ValueError(f"Element ID {e} not found in element list")
 
     return cell_csys
 
@@ -417,7 +554,7 @@ def write(
 
 def write_buffer(
     file: TextIO, mesh: SGMesh, sgdim: int, model_space: str, prop_ref_y: str = 'x',
-    int_fmt: str = '8d', float_fmt: str = "20.9e"
+    int_fmt: str = '8d', float_fmt: str = "20.9e", chunk_rows: int = WRITE_CHUNK_ROWS
     ) -> None:
     """Write SGMesh data to SwiftComp format file buffer.
 
@@ -443,6 +580,10 @@ def write_buffer(
         Format string for integer output, default '8d'
     float_fmt : str, optional
         Format string for float output, default "20.9e"
+    chunk_rows : int, optional
+        Number of nodes/elements converted and written at a time,
+        default ``WRITE_CHUNK_ROWS``. Bounds the temporary memory used
+        for formatting, independent of the mesh size.
 
     Raises
     ------
@@ -495,7 +636,7 @@ def write_buffer(
     _write_nodes(
         file, mesh.points, sgdim, node_id=_node_id,
         model_space=model_space,
-        int_fmt=int_fmt, float_fmt=float_fmt
+        int_fmt=int_fmt, float_fmt=float_fmt, chunk_rows=chunk_rows
         )
 
     # IDs are always ensured above; keep a defensive fallback.
@@ -504,7 +645,7 @@ def write_buffer(
     cell_id_to_elem_id = _write_elements(
         file, mesh.cells, mesh.cell_data['property_id'],
         mesh.cell_data['element_id'], _node_id,
-        int_fmt=int_fmt
+        int_fmt=int_fmt, chunk_rows=chunk_rows
         )
 
     if 'property_ref_csys' in mesh.cell_data.keys():
@@ -512,7 +653,7 @@ def write_buffer(
             file,
             mesh.cell_data['property_ref_csys'],
             cell_id_to_elem_id,
-            int_fmt, float_fmt
+            int_fmt, float_fmt, chunk_rows=chunk_rows
         )
 
 
@@ -525,11 +666,14 @@ def _write_elements(
     elem_id: List,
     node_id,
     int_fmt: str = '8d',
+    chunk_rows: int = WRITE_CHUNK_ROWS,
 ) -> List:
     """Write element connectivity and properties to SwiftComp format.
     
     Outputs element definitions in SwiftComp format, including element
     IDs, property IDs, and node connectivity for each element type.
+    Each chunk of a cell block is stacked into one integer matrix
+    ``[eid, pid, n1, ...]`` and written with a single row format.
     
     Parameters
     ----------
@@ -545,11 +689,14 @@ def _write_elements(
         Node ID mapping for renumbering
     int_fmt : str, optional
         Format string for integer output, default '8d'
+    chunk_rows : int, optional
+        Number of elements converted and written at a time,
+        default ``WRITE_CHUNK_ROWS``
         
     Returns
     -------
-    list of lists
-        Mapping from cell indices to element IDs for reference
+    list of numpy.ndarray
+        Element IDs of each cell block, for reference
         
     Raises
     ------
@@ -558,52 +705,41 @@ def _write_elements(
     IndexError
         If array indices are out of range
     """
-    if len(elem_id) == 0:
-        generate_eid = True
-    else:
-        generate_eid = False
+    generate_eid = len(elem_id) == 0
 
     cell_id_to_elem_id = []
 
-    sfi = '{:' + int_fmt + '}'
-
     consecutive_index = 0
     for k, cell_block in enumerate(cells):
-        cell_type = cell_block.type
-        node_idcs = _meshio_to_sg_order(
-            cell_type, cell_block.data,
-            node_id=node_id
-            )
+        nelem = len(cell_block.data)
 
-        _cid_to_eid = []
         if generate_eid:
-            elem_id.append([])
-
-        for i, c in enumerate(node_idcs):
-            if generate_eid:
-                _eid = consecutive_index + i + 1
-                elem_id[k].append(_eid)
-            else:
-                _eid = elem_id[k][i]
-
-            _pid = cell_prop_ids[k][i]
-
-            _nums = [_eid, _pid]  # Element id, property id
-
-            _nums.extend(c.tolist())
-
-            # Write the numbers
-            fmt = ''.join([sfi,]*len(_nums))
-            f.write(fmt.format(*_nums))
-            if k == 0 and i == 0:
-                f.write('  # element connectivity')
-            f.write('\n')
-
-            _cid_to_eid.append(_eid)
+            _eids = np.arange(consecutive_index + 1, consecutive_index + nelem + 1)
+            elem_id.append(_eids.tolist())
+        else:
+            _eids = np.asarray(elem_id[k], dtype=int)
+
+        _pids = np.asarray(cell_prop_ids[k], dtype=int)
+        if len(_eids) != nelem or len(_pids) != nelem:
+            raise ValueError(
+                f"Cell block {k} ({cell_block.type}) has {nelem} elements, "
+                f"but {len(_eids)} element IDs and {len(_pids)} property IDs")
+
+        for i in range(0, nelem, chunk_rows):
+            node_idcs = _meshio_to_sg_order(
+                cell_block.type, cell_block.data[i:i + chunk_rows],
+                node_id=node_id
+                )
+            block = np.column_stack([
+                _eids[i:i + chunk_rows], _pids[i:i + chunk_rows], node_idcs])
+            _write_int_rows(
+                f, block, int_fmt,
+                comment='  # element connectivity' if k == 0 and i == 0 else '',
+                chunk_rows=chunk_rows)
 
-        cell_id_to_elem_id.append(_cid_to_eid)
+        cell_id_to_elem_id.append(_eids)
 
-        consecutive_index += len(node_idcs)
+        consecutive_index += nelem
 
     f.write('\n')
     return cell_id_to_elem_id
@@ -611,11 +747,17 @@ def _write_elements(
 
 
 
-def _write_property_ref_csys(file: TextIO, cell_csys: List, cell_id_to_elem_id: List, int_fmt: str = '8d', float_fmt: str = '20.12e') -> None:
+def _write_property_ref_csys(
+    file: TextIO, cell_csys: List, cell_id_to_elem_id: List,
+    int_fmt: str = '8d', float_fmt: str = '20.12e', chunk_rows: int = WRITE_CHUNK_ROWS
+    ) -> None:
     """Write local coordinate system data for element properties.
     
     Outputs reference coordinate system definitions for each element
     in SwiftComp format, used for property orientation calculations.
+    Each cell block is written as one ``[eid, a1, a2, a3, b1, b2, b3,
+    c1, c2, c3]`` table; missing components of the c axis are written
+    as zeros.
     
     Parameters
     ----------
@@ -629,6 +771,9 @@ def _write_property_ref_csys(file: TextIO, cell_csys: List, cell_id_to_elem_id:
         Format string for integer output, default '8d'
     float_fmt : str, optional
         Format string for float output, default '20.12e'
+    chunk_rows : int, optional
+        Number of elements converted and written at a time,
+        default ``WRITE_CHUNK_ROWS``
         
     Raises
     ------
@@ -638,17 +783,34 @@ def _write_property_ref_csys(file: TextIO, cell_csys: List, cell_id_to_elem_id:
         If element ID mappings are out of range
     """
 
-    sfi = '{:' + int_fmt + '}'
-    sff = ''.join(['{:' + float_fmt + '}', ]*CSYS_MATRIX_SIZE)
-    c = [0, 0, 0]
+    row_fmt = '{:' + int_fmt + '}' + ('{:' + float_fmt + '}') * CSYS_MATRIX_SIZE
 
     for i, block_data in enumerate(cell_csys):
-        for j, csys in enumerate(block_data):
-            elem_id = cell_id_to_elem_id[i][j]
-
-            file.write(sfi.format(elem_id))
-            file.write(sff.format(*(list(csys)+c)))
-            file.write('\n')
+        elem_id = np.asarray(cell_id_to_elem_id[i])
+        csys = np.asarray(block_data, dtype=float)
+        if len(csys) == 0:
+            continue
+
+        if csys.ndim != 2 or csys.shape[1] < CSYS_MATRIX_SIZE - 3:
+            raise ValueError(
+                f"Invalid coordinate system data for cell block {i}: "
+                f"expected shape (n, {CSYS_MATRIX_SIZE}), got {csys.shape}")
+        if len(elem_id) < len(csys):
+            raise IndexError(
+                f"Cell block {i} has {len(csys)} coordinate systems "
+                f"but {len(elem_id)} element IDs")
+
+        ncomps = min(csys.shape[1], CSYS_MATRIX_SIZE)
+        for j in range(0, len(csys), chunk_rows):
+            _csys = csys[j:j + chunk_rows]
+            # Pad the c axis with zeros if only a and b are given
+            columns = np.zeros((len(_csys), CSYS_MATRIX_SIZE))
+            columns[:, :ncomps] = _csys[:, :ncomps]
+
+            _write_rows(
+                file, row_fmt,
+                [elem_id[j:j + len(_csys)]] + [columns[:, _k] for _k in range(CSYS_MATRIX_SIZE)],
+                chunk_rows=chunk_rows)
 
     file.write('\n')
     return
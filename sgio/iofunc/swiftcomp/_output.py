@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 # import sgio._global as GLOBAL
 from sgio.core.sg import StructureGene
+from sgio.iofunc._meshio import _id_to_index, _read_block_array, _read_id_value_block
 import sgio.utils as sutl
 import sgio.model as smdl
+import sgio.iofunc._sections as _sections
 from sgio._exceptions import OutputFileError
 
 logger = logging.getLogger(__name__)
@@ -53,101 +57,55 @@ def _readOutputBeamModel(file, model):
 
 
 
+# Sections of the SwiftComp .k file, in order of priority
+_BEAM_INERTIAL_SECTIONS = [
+    ('Effective Mass Matrix', 'mass', _sections._matrix(6, 6)),
+    ('Mass Center Location', ('xm2', 'xm3'), _sections._point),
+    ('Mass per unit span', 'mu', _sections._last_value),
+    ('i11', 'i11', _sections._last_value),
+    ('i22', 'i22', _sections._last_value),
+    ('i33', 'i33', _sections._last_value),
+    ('principal inertial axes', 'phi_pia', _sections._angle(wrap=False)),
+    ('Mass-Weighted Radius of Gyration', 'rg', _sections._last_value),
+]
+
+_BEAM_CLASSICAL_SECTIONS = [
+    ('extension stiffness EA', 'ea', _sections._last_value),
+    ('torsional stiffness GJ', 'gj', _sections._last_value),
+    ('Principal bending stiffness EI22', 'ei22', _sections._last_value),
+    ('Principal bending stiffness EI33', 'ei33', _sections._last_value),
+    ('principal bending axes', 'phi_pba', _sections._angle(wrap=False)),
+]
+
+EULER_BERNOULLI_BEAM_SECTIONS = _BEAM_INERTIAL_SECTIONS + [
+    ('Effective Stiffness Matrix', 'stff', _sections._matrix(4, 4)),
+    ('Effective Compliance Matrix', 'cmpl', _sections._matrix(4, 4)),
+    ('Tension Center Location', ('xt2', 'xt3'), _sections._point),
+] + _BEAM_CLASSICAL_SECTIONS
+
+TIMOSHENKO_BEAM_SECTIONS = _BEAM_INERTIAL_SECTIONS + [
+    ('Effective Stiffness Matrix', 'stff_c', _sections._matrix(4, 4)),
+    ('Effective Compliance Matrix', 'cmpl_c', _sections._matrix(4, 4)),
+    ('Effective Timoshenko Stiffness Matrix', 'stff', _sections._matrix(6, 6)),
+    ('Effective Timoshenko Compliance Matrix', 'cmpl', _sections._matrix(6, 6)),
+    ('Tension Center Location', ('xt2', 'xt3'), _sections._point),
+    ('Shear Center Location', ('xs2', 'xs3'), _sections._point),
+] + _BEAM_CLASSICAL_SECTIONS + [
+    ('Principal shear stiffness GA22', 'ga22', _sections._last_value),
+    ('Principal shear stiffness GA33', 'ga33', _sections._last_value),
+    ('principal shear axes', 'phi_psa', _sections._angle(wrap=False)),
+]
+
+
 def _readEulerBernoulliBeamModel(file):
     """Read homogenization output for Euler-Bernoulli beam model.
     """
 
     model = smdl.EulerBernoulliBeamModel()
 
-    block = ''
-    line = file.readline()
-
-    while True:
-        if not line:  # EOF
-            break
-
-        line = line.strip()
-
-        if len(line) == 0:
-            line = file.readline()
-            continue
-        elif line.startswith('--') or line.startswith('=='):
-            line = file.readline()
-            continue
-
-
-        # Inertial properties
-        # -------------------
-
-        elif 'Effective Mass Matrix' in line:
-            line = file.readline()
-            _mass, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.mass = _mass
-
-        elif 'Mass Center Location' in line:
-            for _ in range(2): line = file.readline()
-            model.xm2, model.xm3 = list(map(float, line.split()))
-        elif 'Mass per unit span' in line:
-            model.mu = float(line.split()[-1])
-        elif 'i11' in line:
-            model.i11 = float(line.split()[-1])
-        elif 'i22' in line:
-            model.i22 = float(line.split()[-1])
-        elif 'i33' in line:
-            model.i33 = float(line.split()[-1])
-        elif 'principal inertial axes' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-                model.phi_pia = float(line[tmp_id - 1])
-            except ValueError:
-                model.phi_pia = 0
-        elif 'Mass-Weighted Radius of Gyration' in line:
-            model.rg = float(line.split()[-1])
-
-
-        # Structural properties
-        # ---------------------
-
-        elif 'Effective Stiffness Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4,
-                number_type=float, comments=['----',]
-                )
-            model.stff = _matrix
-        elif 'Effective Compliance Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4,
-                number_type=float, comments=['----',]
-                )
-            model.cmpl = _matrix
-
-        elif 'Tension Center Location' in line:
-            for _ in range(2): line = file.readline()
-            model.xt2, model.xt3 = list(map(float, line.split()))
-
-        elif 'extension stiffness EA' in line:
-            model.ea = float(line.split()[-1])
-        elif 'torsional stiffness GJ' in line:
-            model.gj = float(line.split()[-1])
-        elif 'Principal bending stiffness EI22' in line:
-            model.ei22 = float(line.split()[-1])
-        elif 'Principal bending stiffness EI33' in line:
-            model.ei33 = float(line.split()[-1])
-        elif 'principal bending axes' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-                model.phi_pba = float(line[tmp_id - 1])
-            except ValueError:
-                model.phi_pba = 0
-
-        line = file.readline()
+    _sections._set_attributes(
+        model, _sections._parse_sections(file.read(), EULER_BERNOULLI_BEAM_SECTIONS)
+    )
 
     return model
 
@@ -160,125 +118,9 @@ def _readTimoshenkoBeamModel(file):
 
     model = smdl.TimoshenkoBeamModel()
 
-    block = ''
-    line = file.readline()
-
-    while True:
-        if not line:  # EOF
-            break
-
-        line = line.strip()
-
-        if len(line) == 0:
-            line = file.readline()
-            continue
-        elif line.startswith('--') or line.startswith('=='):
-            line = file.readline()
-            continue
-
-
-        # Inertial properties
-        # -------------------
-
-        elif 'Effective Mass Matrix' in line:
-            line = file.readline()
-            _mass, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.mass = _mass
-
-        elif 'Mass Center Location' in line:
-            for _ in range(2): line = file.readline()
-            model.xm2, model.xm3 = list(map(float, line.split()))
-        elif 'Mass per unit span' in line:
-            model.mu = float(line.split()[-1])
-        elif 'i11' in line:
-            model.i11 = float(line.split()[-1])
-        elif 'i22' in line:
-            model.i22 = float(line.split()[-1])
-        elif 'i33' in line:
-            model.i33 = float(line.split()[-1])
-        elif 'principal inertial axes' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-                model.phi_pia = float(line[tmp_id - 1])
-            except ValueError:
-                model.phi_pia = 0
-        elif 'Mass-Weighted Radius of Gyration' in line:
-            model.rg = float(line.split()[-1])
-
-
-        # Structural properties
-        # ---------------------
-
-        elif 'Effective Stiffness Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4,
-                number_type=float, comments=['----',]
-                )
-            model.stff_c = _matrix
-        elif 'Effective Compliance Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4,
-                number_type=float, comments=['----',]
-                )
-            model.cmpl_c = _matrix
-
-        elif 'Effective Timoshenko Stiffness Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.stff = _matrix
-        elif 'Effective Timoshenko Compliance Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.cmpl = _matrix
-
-        elif 'Tension Center Location' in line:
-            for _ in range(2): line = file.readline()
-            model.xt2, model.xt3 = list(map(float, line.split()))
-
-        elif 'Shear Center Location' in line:
-            for _ in range(2): line = file.readline()
-            model.xs2, model.xs3 = list(map(float, line.split()))
-
-        elif 'extension stiffness EA' in line:
-            model.ea = float(line.split()[-1])
-        elif 'torsional stiffness GJ' in line:
-            model.gj = float(line.split()[-1])
-        elif 'Principal bending stiffness EI22' in line:
-            model.ei22 = float(line.split()[-1])
-        elif 'Principal bending stiffness EI33' in line:
-            model.ei33 = float(line.split()[-1])
-        elif 'principal bending axes' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-                model.phi_pba = float(line[tmp_id - 1])
-            except ValueError:
-                model.phi_pba = 0
-        elif 'Principal shear stiffness GA22' in line:
-            model.ga22 = float(line.split()[-1])
-        elif 'Principal shear stiffness GA33' in line:
-            model.ga33 = float(line.split()[-1])
-        elif 'principal shear axes' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-                model.phi_psa = float(line[tmp_id - 1])
-            except ValueError:
-                model.phi_psa = 0
-
-        line = file.readline()
+    _sections._set_attributes(
+        model, _sections._parse_sections(file.read(), TIMOSHENKO_BEAM_SECTIONS)
+    )
 
     return model
 
@@ -438,6 +280,28 @@ def _readOutputShellModel(file, model):
 
 
 
+# Labels of the plate/shell in-plane and flexural properties
+PLATE_ENGINEERING_CONSTANTS = ['E1', 'E2', 'G12', 'nu12', 'eta121', 'eta122']
+
+KIRCHHOFF_LOVE_PLATE_SHELL_SECTIONS = [
+    ('Effective Mass Matrix', 'mass', _sections._matrix(6, 6)),
+    ('Mass Center Location', 'xm3', _sections._last_value),
+    ('i11', 'i11', _sections._last_value),
+    ('Effective Stiffness Matrix', 'stff', _sections._matrix(6, 6)),
+    ('Effective Compliance Matrix', 'cmpl', _sections._matrix(6, 6)),
+    ('Geometric Correction to the Stiffness Matrix', 'geo_correction_stff', _sections._matrix(6, 6)),
+    ('Total Stiffness Matrix after Geometric Correction', 'stff_geo', _sections._matrix(6, 6)),
+    ('In-Plane', 'in_plane_prop', _sections._constants(6)),
+    ('Flexural', 'flexural_prop', _sections._constants(6)),
+    ('N11T', 'n11_t', _sections._equal_value),
+    ('N22T', 'n22_t', _sections._equal_value),
+    ('N12T', 'n12_t', _sections._equal_value),
+    ('M11T', 'm11_t', _sections._equal_value),
+    ('M22T', 'm22_t', _sections._equal_value),
+    ('M12T', 'm12_t', _sections._equal_value),
+]
+
+
 def _readKirchhoffLovePlateShellModel(file):
     """
     """
@@ -445,126 +309,17 @@ def _readKirchhoffLovePlateShellModel(file):
 
     model = smdl.KirchhoffLovePlateShellModel()
 
-    block = ''
-    line = file.readline()
+    values = _sections._parse_sections(file.read(), KIRCHHOFF_LOVE_PLATE_SHELL_SECTIONS)
+    if 'i11' in values:
+        values['i22'] = values['i11']
 
-    while True:
-        if not line:  # EOF
-            break
+    for _block, _suffix in (('in_plane_prop', '_i'), ('flexural_prop', '_o')):
+        _constants = values.pop(_block, {})
+        for _label in PLATE_ENGINEERING_CONSTANTS:
+            if _label in _constants:
+                values[_label.lower() + _suffix] = _constants[_label]
 
-        line = line.strip()
-
-        if '-----' in line or len(line) == 0:
-            line = file.readline()
-            continue
-
-
-        # Inertial properties
-        # -------------------
-
-        elif 'Effective Mass Matrix' in line:
-            line = file.readline()
-            _mass, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.mass = _mass
-
-        elif 'Mass Center Location' in line:
-            model.xm3 = float(line.split()[-1])
-
-        elif 'i11' in line:
-            model.i11 = float(line.split()[-1])
-            model.i22 = model.i11
-
-
-        # Structural properties
-        # ---------------------
-
-        elif 'Effective Stiffness Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.stff = _matrix
-        elif 'Effective Compliance Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.cmpl = _matrix
-
-        elif 'Geometric Correction to the Stiffness Matrix' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.geo_correction_stff = _matrix
-        elif 'Total Stiffness Matrix after Geometric Correction' in line:
-            line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float, comments=['----',]
-                )
-            model.stff_geo = _matrix
-
-        elif 'In-Plane' in line:
-            block = 'in_plane_prop'
-        elif 'Flexural' in line:
-            block = 'flexural_prop'
-
-        elif line.startswith('E1'):
-            if block == 'in_plane_prop':
-                model.e1_i = float(line.split('=')[-1])
-            elif block == 'flexural_prop':
-                model.e1_o = float(line.split('=')[-1])
-        elif line.startswith('E2'):
-            if block == 'in_plane_prop':
-                model.e2_i = float(line.split('=')[-1])
-            elif block == 'flexural_prop':
-                model.e2_o = float(line.split('=')[-1])
-        elif line.startswith('G12'):
-            if block == 'in_plane_prop':
-                model.g12_i = float(line.split('=')[-1])
-            elif block == 'flexural_prop':
-                model.g12_o = float(line.split('=')[-1])
-        elif line.startswith('nu12'):
-            if block == 'in_plane_prop':
-                model.nu12_i = float(line.split('=')[-1])
-            elif block == 'flexural_prop':
-                model.nu12_o = float(line.split('=')[-1])
-        elif line.startswith('eta121'):
-            if block == 'in_plane_prop':
-                model.eta121_i = float(line.split('=')[-1])
-            elif block == 'flexural_prop':
-                model.eta121_o = float(line.split('=')[-1])
-        elif line.startswith('eta122'):
-            if block == 'in_plane_prop':
-                model.eta122_i = float(line.split('=')[-1])
-            elif block == 'flexural_prop':
-                model.eta122_o = float(line.split('=')[-1])
-
-
-        # Thermal properties
-        # ---------------------
-
-        elif 'N11T' in line:
-            model.n11_t = float(line.split('=')[-1])
-        elif 'N22T' in line:
-            model.n22_t = float(line.split('=')[-1])
-        elif 'N12T' in line:
-            model.n12_t = float(line.split('=')[-1])
-        elif 'M11T' in line:
-            model.m11_t = float(line.split('=')[-1])
-        elif 'M22T' in line:
-            model.m22_t = float(line.split('=')[-1])
-        elif 'M12T' in line:
-            model.m12_t = float(line.split('=')[-1])
-
-        line = file.readline()
+    _sections._set_attributes(model, values)
 
 
     if model.mass is None:
@@ -743,103 +498,69 @@ def _readKirchhoffLovePlateShellModel(file):
 
 
 
+CAUCHY_CONTINUUM_SECTIONS = [
+    ('The Effective Stiffness Matrix', 'stff', _sections._matrix(6, 6)),
+    ('The Effective Compliance Matrix', 'cmpl', _sections._matrix(6, 6)),
+    ('The Engineering Constants', 'const', _sections._constants(9)),
+    ('Effective Density', 'density', _sections._equal_value),
+    ('alpha11', 'a11', _sections._equal_value),
+    ('alpha22', 'a22', _sections._equal_value),
+    ('alpha33', 'a33', _sections._equal_value),
+    ('2alpha23', '2a23', _sections._equal_value),
+    ('2alpha13', '2a13', _sections._equal_value),
+    ('2alpha12', '2a12', _sections._equal_value),
+    ('Dthetatheta', 'd_thetatheta', _sections._equal_value),
+    ('Feff', 'f_eff', _sections._equal_value),
+]
+
+
 def _readOutputCauchyContinuumModel(file):
     r"""
     """
 
-    # mp = mmsd.MaterialProperty()
-    # mp = smdl.MaterialSection()
     mp = smdl.CauchyContinuumModel()
 
     # Always set the homogenizated material as general anisotropic
     # mp.isotropy = 2
     mp.set('isotropy', 2)
 
-    linesRead = []
-    keywordsIndex = {}
-
-    # with open(fn, 'r') as fin:
-    ln = -1
+    values = _sections._parse_sections(file.read(), CAUCHY_CONTINUUM_SECTIONS)
 
-    for line in file:
-
-        line = line.strip()
+    # Thermal properties
+    # ---------------------
 
-        if len(line) > 0:
-            linesRead.append(line)
-            ln += 1
-        else:
-            continue
+    if '2a12' in values:
+        _cte = [values[_k] for _k in ('a11', 'a22', 'a33', '2a23', '2a13', '2a12')]
+        mp.set('cte', _cte)
 
-        if '-----' in line:
-            continue
+    if 'd_thetatheta' in values:
+        mp.d_thetatheta = values['d_thetatheta']
+    if 'f_eff' in values:
+        mp.f_eff = values['f_eff']
+        _t1 = 0
+        _tm = 1
+        _t = _t1 + _tm
+        _specific_heat = mp.d_thetatheta - _t * mp.f_eff
+        mp.set('specific_heat', _specific_heat)
 
-        if 'The Effective Stiffness Matrix' in line:
-            keywordsIndex['stff'] = ln
-        if 'The Effective Compliance Matrix' in line:
-            keywordsIndex['cmpl'] = ln
-        if 'The Engineering Constants' in line:
-            keywordsIndex['const'] = ln
-        if 'Effective Density' in line:
-            keywordsIndex['density'] = ln
-
-        # Thermal properties
-        # ---------------------
-
-        elif 'alpha11' in line:
-            _a11 = float(line.split('=')[-1])
-        elif 'alpha22' in line:
-            _a22 = float(line.split('=')[-1])
-        elif 'alpha33' in line:
-            _a33 = float(line.split('=')[-1])
-        elif '2alpha23' in line:
-            _2a23 = float(line.split('=')[-1])
-        elif '2alpha13' in line:
-            _2a13 = float(line.split('=')[-1])
-        elif '2alpha12' in line:
-            _2a12 = float(line.split('=')[-1])
-            _cte = [_a11, _a22, _a33, _2a23, _2a13, _2a12]
-            mp.set('cte', _cte)
-
-        elif 'Dthetatheta' in line:
-            mp.d_thetatheta = float(line.split('=')[-1])
-        elif 'Feff' in line:
-            mp.f_eff = float(line.split('=')[-1])
-            _t1 = 0
-            _tm = 1
-            _t = _t1 + _tm
-            _specific_heat = mp.d_thetatheta - _t * mp.f_eff
-            mp.set('specific_heat', _specific_heat)
-
-    try:
-        ln = keywordsIndex['stff']
-        _stff = sutl.textToMatrix(linesRead[ln + 2:ln + 8])
-        mp.set('elastic', _stff, input_type='stiffness')
-    except KeyError:
+    if 'stff' in values:
+        mp.set('elastic', values['stff'], input_type='stiffness')
+    else:
         logger.debug('No classical stiffness matrix found.')
 
-    try:
-        ln = keywordsIndex['cmpl']
-        _cmpl = sutl.textToMatrix(linesRead[ln + 2:ln + 8])
-        mp.set('elastic', _cmpl, input_type='compliance')
-    except KeyError:
+    if 'cmpl' in values:
+        mp.set('elastic', values['cmpl'], input_type='compliance')
+    else:
         logger.debug('No classical flexibility matrix found.')
 
-    try:
-        ln = keywordsIndex['const']
-        for line in linesRead[ln + 2:ln + 11]:
-            line = line.strip()
-            line = line.split('=')
-            label = line[0].strip().lower()
-            value = float(line[-1].strip())
+    if 'const' in values:
+        for label, value in values['const'].items():
             # mp.constants[label] = value
-            mp.set(label, value)
-    except KeyError:
+            mp.set(label.lower(), value)
+    else:
         logger.debug('No engineering constants found.')
 
-    line = linesRead[keywordsIndex['density']]
-    line = line.strip().split('=')
-    mp.set('density', float(line[-1].strip()))
+    mp.set('density', values['density'])
     # mp.density = float(line[-1].strip())
 
 
@@ -852,6 +573,68 @@ def _readOutputCauchyContinuumModel(file):
 # Read output state
 
 
+# Columns of the SwiftComp .u file: node id, u1, u2, u3
+NODE_DISPLACEMENT_COLUMNS = [1, 2, 3]
+
+
+def _read_output_node_disp_case_array(file, nnode, node_ids=None):
+    """Read SwiftComp output displacement on nodes as arrays.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nnode: int
+        Number of nodes.
+    node_ids: array-like of int, optional
+        Only read the displacement of these nodes.
+
+    Returns
+    -------
+    np.ndarray:
+        Node IDs, shape (n,), in file order.
+    np.ndarray:
+        Displacements [u1, u2, u3], shape (n, 3).
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``nnode`` lines are read or a line is incomplete.
+    """
+    return _read_id_value_block(
+        file, nnode, NODE_DISPLACEMENT_COLUMNS, ids=node_ids, comment='#'
+    )
+
+
+def _read_output_node_disp_case_state(file, nnode, node_ids=None):
+    """Read SwiftComp output displacement on nodes as a State.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nnode: int
+        Number of nodes.
+    node_ids: array-like of int, optional
+        Only read the displacement of these nodes.
+
+    Returns
+    -------
+    State:
+        State 'u' on nodes, sorted by node ID.
+    """
+    node_id, u = _read_output_node_disp_case_array(file, nnode, node_ids)
+
+    if np.any(node_id[1:] < node_id[:-1]):
+        order = np.argsort(node_id, kind='stable')
+        node_id, u = node_id[order], u[order]
+
+    return smdl.State(
+        name='u', data=u, label=['u1', 'u2', 'u3'], location='node',
+        entity_ids=node_id
+    )
+
+
 def _read_output_node_disp_case(file, nnode):
     """Read SwiftComp output displacement on nodes.
 
@@ -867,25 +650,226 @@ def _read_output_node_disp_case(file, nnode):
     dict[int, list[float]]:
         Displacement of all nodes.
     """
-    output = {}
+    node_id, u = _read_output_node_disp_case_array(file, nnode)
+
+    return dict(zip(node_id.tolist(), u.tolist()))
+
+
+
+
+# Components of the SwiftComp element node output, in block order
+ELEMENT_NODE_STRAIN_COMPONENTS = ['e11', 'e22', 'e33', '2e23', '2e13', '2e12']
+ELEMENT_NODE_STRESS_COMPONENTS = ['s11', 's22', 's33', 's23', 's13', 's12']
+
+
+def _read_output_element_node_component(file, nelem):
+    """Read one component block of SC output on element nodes.
+
+    Each of the ``nelem`` lines contains the element id, the number of
+    nodes, and the value at each node.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nelem: int
+        Number of elements.
+
+    Returns
+    -------
+    dict[int, tuple[np.ndarray, np.ndarray]]:
+        Element IDs, shape (n,), and nodal values, shape (n, nnode),
+        grouped by the number of nodes per element ``nnode``.
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``nelem`` lines are read or a line does not hold
+        as many values as its number of nodes.
+    """
+    data, lines = _read_block_array(file, nelem, comment='#', dtype=float)
+
+    if data is not None and data.shape[1] >= 2 and np.all(data[:, 1] == data.shape[1] - 2):
+        return {data.shape[1] - 2: (data[:, 0].astype(int), data[:, 2:])}
+
+    # Mixed element types: group the lines on their number of values
+    if len(lines) < nelem:
+        raise ValueError(
+            f'expected {nelem} elements in SC element node output, read {len(lines)}'
+        )
+    rows = {}
+    for line in lines:
+        line = line.split('#')[0].split()
+        rows.setdefault(len(line) - 2, []).append(line)
+
+    groups = {}
+    for nnode, _rows in rows.items():
+        _data = np.array(_rows, dtype=float)
+        if nnode < 0 or np.any(_data[:, 1] != nnode):
+            raise ValueError('number of nodes does not match the values in SC element node output')
+        groups[nnode] = (_data[:, 0].astype(int), _data[:, 2:])
+
+    return groups
+
+
+def _read_output_node_strain_stress_case_arrays(file, nelem):
+    """Read SC output strains and stresses on element nodes as arrays.
+
+    The 12 component blocks (6 strains, then 6 stresses, see
+    :func:`_read_output_node_strain_stress_case_global_gmsh`) are read
+    in bulk and stacked into tensors. Elements with different numbers of
+    nodes are kept in separate groups.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nelem: int
+        Number of elements.
+
+    Returns
+    -------
+    dict[int, tuple[np.ndarray, np.ndarray]]:
+        Nodal 3D strains, grouped by the number of nodes per element
+        ``nnode``: element IDs, shape (n,), and strains, shape (n, nnode, 6),
+        with components [e11, e22, e33, 2e23, 2e13, 2e12].
+    dict[int, tuple[np.ndarray, np.ndarray]]:
+        Nodal 3D stresses, grouped in the same way, with components
+        [s11, s22, s33, s23, s13, s12].
+
+    Raises
+    ------
+    ValueError
+        If a block is incomplete or blocks list different elements.
+    """
+    ncomps = len(ELEMENT_NODE_STRAIN_COMPONENTS) + len(ELEMENT_NODE_STRESS_COMPONENTS)
+    blocks = [_read_output_element_node_component(file, nelem) for _ in range(ncomps)]
+
+    strains, stresses = {}, {}
+    for nnode, (elem_id, _) in blocks[0].items():
+        values = np.empty((len(elem_id), nnode, ncomps))
+        for k, block in enumerate(blocks):
+            if nnode not in block:
+                raise ValueError('SC element node output blocks list different elements')
+            _ids, _values = block[nnode]
+            if not np.array_equal(_ids, elem_id):
+                try:
+                    _values = _values[_id_to_index(elem_id, _ids)]
+                except KeyError as e:
+                    raise ValueError(
+                        f'element {e} is missing in a SC element node output block'
+                    ) from None
+            values[:, :, k] = _values
+
+        strains[nnode] = (elem_id, values[:, :, :6])
+        stresses[nnode] = (elem_id, values[:, :, 6:])
+
+    return strains, stresses
+
+
+def _element_node_groups_to_cell_blocks(groups, elem_ids):
+    """Arrange element node arrays into cell blocks.
+
+    Parameters
+    ----------
+    groups: dict[int, tuple[np.ndarray, np.ndarray]]
+        Element IDs and nodal values grouped by the number of nodes per
+        element, as returned by :func:`_read_output_node_strain_stress_case_arrays`.
+    elem_ids: list of array-like
+        Element IDs of each cell block (``cell_data['element_id']``).
+
+    Returns
+    -------
+    list of np.ndarray
+        One array per cell block, with shape (n_elements, nnode, ncomps).
+
+    Raises
+    ------
+    KeyError
+        If the elements of a cell block are not all found in one group.
+    """
+    blocks = []
+    for block_ids in elem_ids:
+        block_ids = np.asarray(block_ids, dtype=int)
+        for _ids, _values in groups.values():
+            try:
+                blocks.append(_values[_id_to_index(block_ids, _ids)])
+                break
+            except KeyError:
+                continue
+        else:
+            raise KeyError('elements of a cell block are missing in the element node output')
+    return blocks
 
-    i = 0
-    while i < nnode:
-        line = file.readline().strip()
-        if line == '':
-            continue
 
-        line = line.split()
-        _nid = int(line[0])
-        _disp = list(map(float, line[1:4]))
+def _add_element_node_groups_to_mesh(name, groups, mesh):
+    """Add element node arrays to ``mesh.cell_point_data``.
 
-        output[_nid] = _disp
+    Parameters
+    ----------
+    name: str or list of str
+        Name of the field holding all components, or one name per component.
+    groups: dict[int, tuple[np.ndarray, np.ndarray]]
+        Element IDs and nodal values grouped by the number of nodes per
+        element, as returned by :func:`_read_output_node_strain_stress_case_arrays`.
+    mesh: SGMesh
+        Target mesh. Must have ``mesh.cell_data['element_id']`` defined.
+    """
+    blocks = _element_node_groups_to_cell_blocks(groups, mesh.cell_data['element_id'])
 
-        i += 1
+    if isinstance(name, str):
+        mesh.cell_point_data[name] = blocks
+    else:
+        for k, _name in enumerate(name):
+            mesh.cell_point_data[_name] = [_b[:, :, k] for _b in blocks]
 
-    return output
 
+def _build_element_node_strain_stress_states(strain_groups, stress_groups, suffix=''):
+    """Build the SC element node strain and stress states from arrays.
+
+    Parameters
+    ----------
+    strain_groups: dict[int, tuple[np.ndarray, np.ndarray]]
+        Strains grouped by the number of nodes per element, as returned by
+        :func:`_read_output_node_strain_stress_case_arrays`.
+    stress_groups: dict[int, tuple[np.ndarray, np.ndarray]]
+        Stresses, grouped in the same way.
+    suffix: str, optional
+        Suffix of the state names and labels, e.g. 'm' for the material
+        coordinate system. Default is ''.
 
+    Returns
+    -------
+    dict[str, State]:
+        States 'e' and 's' (with the suffix appended).
+
+    Notes
+    -----
+    A State holds one array, so when the output mixes element types the
+    data is passed as element-keyed nested lists instead.
+    """
+    states = {}
+    for name, groups, components in (
+        ('e', strain_groups, ELEMENT_NODE_STRAIN_COMPONENTS),
+        ('s', stress_groups, ELEMENT_NODE_STRESS_COMPONENTS),
+    ):
+        if len(groups) == 1:
+            (elem_id, values), = groups.values()
+            if np.any(elem_id[1:] < elem_id[:-1]):
+                order = np.argsort(elem_id, kind='stable')
+                elem_id, values = elem_id[order], values[order]
+            data = {'data': values, 'entity_ids': elem_id}
+        else:
+            data = {'data': {}}
+            for elem_id, values in groups.values():
+                data['data'].update(zip(elem_id.tolist(), values.tolist()))
+
+        states[f'{name}{suffix}'] = smdl.State(
+            name=f'{name}{suffix}',
+            label=[f'{_c}{suffix}' for _c in components],
+            location='element_node', **data
+        )
+    return states
 
 
 def _read_output_node_strain_stress_case_global_gmsh(file, nelem, sg:StructureGene):
@@ -943,72 +927,13 @@ def _read_output_node_strain_stress_case_global_gmsh(file, nelem, sg:StructureGe
 
     """
 
-    # Temporary storage: component -> element_id -> node values
-    comp_data = {}
-
-    components = [
-        'e11', 'e22', 'e33', '2e23', '2e13', '2e12',
-        's11', 's22', 's33', 's23', 's13', 's12',
-    ]
-
-    # Read all 12 blocks (6 strain components + 6 stress components)
-    for comp in components:
-        comp_data[comp] = {}
-
-        i = 0
-        while i < nelem:
-            line = file.readline().strip()
-            if line == '':
-                continue
-
-            line = line.split()
-            _eid = int(line[0])
-            _nvals = int(line[1])
-
-            _vals = list(map(float, line[2:]))
-
-            comp_data[comp][_eid] = _vals
+    strain_groups, stress_groups = _read_output_node_strain_stress_case_arrays(file, nelem)
 
-            i += 1
-
-    # Transform data structure from component-based to element-based
     strains = {}
     stresses = {}
-
-    # Get all element IDs from the first component
-    element_ids = comp_data['e11'].keys()
-
-    for eid in element_ids:
-        # Get number of nodes for this element
-        nnodes = len(comp_data['e11'][eid])
-
-        # Initialize lists for this element
-        strains[eid] = []
-        stresses[eid] = []
-
-        # For each node, collect all 6 components
-        for node_idx in range(nnodes):
-            # Strain components for this node: [e11, e22, e33, 2e23, 2e13, 2e12]
-            strain_node = [
-                comp_data['e11'][eid][node_idx],
-                comp_data['e22'][eid][node_idx],
-                comp_data['e33'][eid][node_idx],
-                comp_data['2e23'][eid][node_idx],
-                comp_data['2e13'][eid][node_idx],
-                comp_data['2e12'][eid][node_idx],
-            ]
-            strains[eid].append(strain_node)
-
-            # Stress components for this node: [s11, s22, s33, s23, s13, s12]
-            stress_node = [
-                comp_data['s11'][eid][node_idx],
-                comp_data['s22'][eid][node_idx],
-                comp_data['s33'][eid][node_idx],
-                comp_data['s23'][eid][node_idx],
-                comp_data['s13'][eid][node_idx],
-                comp_data['s12'][eid][node_idx],
-            ]
-            stresses[eid].append(stress_node)
+    for groups, output in ((strain_groups, strains), (stress_groups, stresses)):
+        for elem_id, values in groups.values():
+            output.update(zip(elem_id.tolist(), values.tolist()))
 
     return strains, stresses
 
@@ -1016,20 +941,34 @@ def _read_output_node_strain_stress_case_global_gmsh(file, nelem, sg:StructureGe
 
 
 
-def _readOutputFailureIndex(file):
-    """
+def _read_output_failure_index_array(file):
+    """Read SwiftComp output initial failure indices and strength ratios as arrays.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+
+    Returns
+    -------
+    np.ndarray:
+        Element IDs, in file order.
+    np.ndarray:
+        Initial failure indices.
+    np.ndarray:
+        Strength ratios.
+    list[int]:
+        ID of elements having the lowest strength ratio. Taken from the
+        'The sectional strength ratio is' lines if present, otherwise the
+        element with the lowest strength ratio in the file.
     """
 
     logger.debug('reading sg failure indices and strengh ratios...')
 
-    fi = {}
-    sr = {}
+    rows = []
     eids_sr_min = []
 
-    _sr_min = -1
-    _eid_sr_min = 0
-
-    for i, line in enumerate(file):
+    for line in file:
         line = line.strip()
         if (line == ''):
             continue
@@ -1037,33 +976,35 @@ def _readOutputFailureIndex(file):
             continue
 
         if (line.startswith('The sectional strength ratio is')):
-            line = line.split()
-            # _loc = line.index('existing')
-            # _sr_min = float(line[tmp_id - 1])
-            _eid = int(line[-1])
-            eids_sr_min.append(_eid)
-            # lines.pop()
+            eids_sr_min.append(int(line.split()[-1]))
             continue
 
-        line = line.split()
-        if len(line) == 3:
-            # lines.append(line)
-            _eid = int(line[0])
-            _fi = float(line[1])
-            _sr = float(line[2])
-
-            fi[_eid] = _fi
-            sr[_eid] = _sr
+        if len(line.split()) == 3:
+            rows.append(line)
 
-            if _sr_min == -1 or _sr < _sr_min:
-                _sr_min = _sr
-                _eid_sr_min = _eid
+    values = sutl.fortran_floats(rows).reshape(-1, 3)
+    elem_id = values[:, 0].astype(int)
+    fi = values[:, 1]
+    sr = values[:, 2]
 
-    if len(sr) == 1 and len(eids_sr_min) == 0:
+    if sr.size == 1 and len(eids_sr_min) == 0:
         eids_sr_min.append(1)
 
     if len(eids_sr_min) == 0:
-        eids_sr_min.append(_eid_sr_min)
+        eids_sr_min.append(int(elem_id[np.argmin(sr)]) if sr.size > 0 else 0)
+
+    return elem_id, fi, sr, eids_sr_min
+
+
+def _readOutputFailureIndex(file):
+    """
+    """
+
+    elem_id, fi, sr, eids_sr_min = _read_output_failure_index_array(file)
+
+    elem_id = elem_id.tolist()
+    fi = dict(zip(elem_id, fi.tolist()))
+    sr = dict(zip(elem_id, sr.tolist()))
 
     return fi, sr, eids_sr_min
 
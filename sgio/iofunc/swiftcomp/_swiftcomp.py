@@ -12,6 +12,7 @@ from sgio.core.sg import StructureGene
 # from sgio._exceptions import OutputFileError
 
 from ._input import (
+    WRITE_CHUNK_ROWS,
     _readHeader,
     _readMesh,
     _readMaterialRotationCombinations,
@@ -203,7 +204,8 @@ def write_buffer(
     model_space='xy', prop_ref_y='x',
     macro_responses:list[smdl.StateCase]=[],
     load_type=0,
-    sfi:str='8d', sff:str='20.12e', version=None
+    sfi:str='8d', sff:str='20.12e', version=None,
+    chunk_rows:int=WRITE_CHUNK_ROWS
     ):
     """Write analysis input.
 
@@ -231,6 +233,9 @@ def write_buffer(
         Float format string, by default '20.12e'.
     version : optional
         Format version.
+    chunk_rows : int, optional
+        Number of nodes/elements converted and written at a time,
+        by default ``WRITE_CHUNK_ROWS``.
 
     Returns
     -------
@@ -242,7 +247,7 @@ def write_buffer(
         writeInputBuffer(
             sg, file, analysis, sg.physics,
             model_space, prop_ref_y,
-            sfi=sfi, sff=sff, version=version)
+            sfi=sfi, sff=sff, version=version, chunk_rows=chunk_rows)
 
     elif (analysis == 'd') or (analysis == 'l') or (analysis.startswith('f')):
         if sg is None:
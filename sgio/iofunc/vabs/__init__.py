@@ -11,15 +11,27 @@ Main Functions
 
 Internal Functions
 ------------------
+- _readOutputCaseHeader: Skip the header line of a load case
+- _readOutputNodeDisplacementArray: Parse nodal displacement data as arrays
+- _readOutputNodeDisplacementState: Parse nodal displacement data as a State
 - _readOutputElementStrainStressCase: Parse element strain/stress data
+- _readOutputElementStrainStressArray: Parse element strain/stress data as arrays
+- _buildElementStrainStressStates: Build element strain/stress states from arrays
 - _readOutputFailureIndexCase: Parse failure index data
+- _readOutputFailureIndexArray: Parse failure index data as arrays
 """
 
 from __future__ import annotations
 
 from ._output import (
+    _readOutputCaseHeader,
+    _readOutputNodeDisplacementArray,
+    _readOutputNodeDisplacementState,
     _readOutputElementStrainStressCase,
+    _readOutputElementStrainStressArray,
+    _buildElementStrainStressStates,
     _readOutputFailureIndexCase,
+    _readOutputFailureIndexArray,
 )
 from .main import (
     read_buffer,
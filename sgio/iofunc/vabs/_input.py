@@ -9,6 +9,7 @@ import sgio.model as smdl
 from ._mesh import (
     read_buffer,
     write_buffer,
+    WRITE_CHUNK_ROWS,
 )
 from ..common import (
     read_material_rotation_combinations,
@@ -153,7 +154,7 @@ def _readElasticProperty(file, isotropy:int):
 
 def _writeMesh(
     mesh, file, model_space='', prop_ref_y='x',
-    int_fmt='8d', float_fmt='20.12e'
+    int_fmt='8d', float_fmt='20.12e', chunk_rows=WRITE_CHUNK_ROWS
     ):
     """Write mesh data to VABS format."""
     logger.debug('writing mesh...')
@@ -161,7 +162,7 @@ def _writeMesh(
     write_buffer(
         file, mesh,
         sgdim=2, model_space=model_space, prop_ref_y=prop_ref_y,
-        int_fmt=int_fmt, float_fmt=float_fmt
+        int_fmt=int_fmt, float_fmt=float_fmt, chunk_rows=chunk_rows
     )
 
     return
@@ -3,6 +3,7 @@ I/O for VABS format
 """
 from __future__ import annotations
 
+import io
 import logging
 
 import numpy as np
@@ -15,8 +16,15 @@ from sgio.iofunc._meshio import (
     register_sgmesh_format,
     _meshio_to_sg_order,
     _sg_to_meshio_order,
-    _read_nodes,
+    _read_nodes_bulk,
+    _read_block_array,
+    _id_to_index,
+    _scatter_to_cell_blocks,
     _write_nodes,
+    _write_int_rows,
+    _write_rows,
+    NODE_COORDINATE_COLUMNS,
+    WRITE_CHUNK_ROWS,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,22 +64,17 @@ def read_buffer(f, sgdim:int, nnode:int, nelem:int, format_flag, **kwargs):
     point_ids = None
 
     # Read nodes
-    points, point_ids, line = _read_nodes(f, nnode, sgdim)
-    if point_ids:
-        # Map original node IDs back to array order for point_data['node_id']
-        n_nodes = len(points)
-        node_id = np.empty(n_nodes, dtype=int)
-        for _orig_id, _idx in point_ids.items():
-            node_id[_idx] = _orig_id
+    points, node_id = _read_nodes_bulk(f, nnode, sgdim)
+    if len(node_id) > 0:
         point_data['node_id'] = node_id
 
     # Read elements
-    cells, elem_ids, elem_id_to_cell_id = _read_elements(f, nelem, point_ids)
+    cells, elem_ids = _read_elements_bulk(f, nelem, node_id)
     cell_data['element_id'] = elem_ids
 
     # Read local coordinate system for sectional properties
     cell_prop_id, cell_csys = _read_property_id_ref_csys(
-        f, nelem, cells, elem_id_to_cell_id, format_flag)
+        f, nelem, elem_ids, format_flag)
     cell_data['property_id'] = cell_prop_id
     cell_data['property_ref_csys'] = cell_csys
 
@@ -149,12 +152,72 @@ def _read_elements(f, nelem:int, point_ids):
 
 
 
+def _read_elements_bulk(f, nelem:int, node_id):
+    """Read the element connectivity block in one pass.
 
+    Parameters
+    ----------
+    f : file
+        The file to read from.
+    nelem : int
+        The number of elements.
+    node_id : np.ndarray
+        Original node IDs of the mesh points, in point order.
+
+    Returns
+    -------
+    cells : list
+        The list of cells, ``(cell_type, connectivity)`` per block.
+    elem_ids : list
+        The element ids for each block.
+
+    Notes
+    -----
+    The block is parsed into a 2D integer array, rows are grouped by the
+    number of non-zero node slots, and node IDs are mapped to point indices
+    with a vectorized lookup. Blocks are ordered by first appearance, as in
+    :func:`_read_elements`, which is used as the fallback for blocks that
+    are not a regular integer table.
+    """
+    data, lines = _read_block_array(f, nelem, comment='!', dtype=int)
+
+    if data is None:
+        logger.debug('falling back to line-by-line element reader')
+        point_ids = dict(zip(np.asarray(node_id).tolist(), range(len(node_id))))
+        cells, elem_ids, _ = _read_elements(io.StringIO(''.join(lines)), nelem, point_ids)
+        return cells, [np.asarray(_b, dtype=int) for _b in elem_ids]
+
+    cells = []
+    elem_ids = []
+    if nelem == 0:
+        return cells, elem_ids
+
+    elem_id = data[:, 0]
+    conn = data[:, 1:]
+    mask = conn != 0
+    counts = mask.sum(axis=1)
+
+    # Cell blocks in order of first appearance
+    _counts, _first = np.unique(counts, return_index=True)
+    for nnode_cell in _counts[np.argsort(_first)]:
+        cell_type = vabs_to_meshio_type[int(nnode_cell)]
+        rows = np.flatnonzero(counts == nnode_cell)
+        _nids = conn[rows][mask[rows]].reshape(-1, nnode_cell)
+
+        cells.append((cell_type, _id_to_index(_nids, node_id)))
+        elem_ids.append(elem_id[rows])
+
+    return cells, elem_ids
 
 
 
 
-def _read_property_id_ref_csys(file, nelem, cells, elem_id_to_cell_id, format_flag):
+
+
+
+
+
+def _read_property_id_ref_csys(file, nelem, elem_ids, format_flag):
     """Read the data block of element property id and reference csys.
 
     Parameters
@@ -163,10 +226,8 @@ def _read_property_id_ref_csys(file, nelem, cells, elem_id_to_cell_id, format_fl
         The file to read from.
     nelem : int
         The number of elements.
-    cells : list
-        The list of cells.
-    elem_id_to_cell_id : dict
-        The dictionary of element id to cell id.
+    elem_ids : list
+        The element ids for each cell block.
     format_flag : int
         The format flag. 0 for old format, 1 for new format.
 
@@ -176,39 +237,25 @@ def _read_property_id_ref_csys(file, nelem, cells, elem_id_to_cell_id, format_fl
         The list of property ids.
     cell_csys : list
         The list of reference csys.
-    """
-
-    cell_prop_id = []
-    cell_csys = []
-    # print(cells)
-    # print(cell_ids)
-
-    counter = 0
-    while counter < nelem:
-        line = file.readline()
-        line = line.split('!')[0].strip()
-        if line == "": continue
-
-        line = line.split()
 
-        elem_id = int(line[0])
-        prop_id = int(line[1])
-        elem_csys = sutl.fortran_float(line[2])
-
-        cell_block_id, cell_id = elem_id_to_cell_id[elem_id]
-
-        if cell_block_id > len(cell_csys) - 1:
-            _ncell = len(cells[cell_block_id][1])
-            # print('_ncell =', _ncell)
-            cell_prop_id.append(np.zeros(_ncell, dtype=int))
-            cell_csys.append(np.zeros(_ncell))
+    Notes
+    -----
+    The block is parsed in one pass and scattered into the cell blocks
+    through an element id lookup. Lines that cannot be parsed in bulk
+    (e.g. rows with trailing text) are parsed line by line.
+    """
 
-        # print(cell_csys[cell_block_id][cell_id])
+    data, lines = _read_block_array(file, nelem, comment='!', dtype=float)
 
-        cell_prop_id[cell_block_id][cell_id] = prop_id
-        cell_csys[cell_block_id][cell_id] = elem_csys
+    if data is None or data.shape[1] < 3:
+        data = np.zeros((len(lines), 3))
+        for i, line in enumerate(lines):
+            line = line.split('!')[0].split()
+            data[i] = [int(line[0]), int(line[1]), sutl.fortran_float(line[2])]
 
-        counter += 1
+    elem_id = data[:, 0].astype(int)
+    cell_prop_id = _scatter_to_cell_blocks(elem_id, data[:, 1].astype(int), elem_ids)
+    cell_csys = _scatter_to_cell_blocks(elem_id, data[:, 2], elem_ids)
 
     return cell_prop_id, cell_csys
 
@@ -240,7 +287,7 @@ def write(
 
 def write_buffer(
     file, mesh, sgdim, model_space='', prop_ref_y='x',
-    int_fmt='8d', float_fmt="20.9e"
+    int_fmt='8d', float_fmt="20.9e", chunk_rows=WRITE_CHUNK_ROWS
     ):
     """Write mesh data to VABS format buffer.
 
@@ -266,6 +313,10 @@ def write_buffer(
         Format string for integer output, by default '8d'.
     float_fmt : str, optional
         Format string for float output, by default "20.9e".
+    chunk_rows : int, optional
+        Number of nodes/elements converted and written at a time,
+        by default ``WRITE_CHUNK_ROWS``. Bounds the temporary memory used
+        for formatting, independent of the mesh size.
 
     Returns
     -------
@@ -306,7 +357,7 @@ def write_buffer(
     _write_nodes(
         file, mesh.points, sgdim, node_id=_node_id,
         model_space=model_space,
-        int_fmt=int_fmt, float_fmt=float_fmt
+        int_fmt=int_fmt, float_fmt=float_fmt, chunk_rows=chunk_rows
     )
 
     # IDs are always ensured above; keep a defensive fallback.
@@ -314,7 +365,7 @@ def write_buffer(
         mesh.cell_data['element_id'] = []
     _write_elements(
         file, mesh.cells, mesh.cell_data['element_id'], _node_id,
-        int_fmt=int_fmt
+        int_fmt=int_fmt, chunk_rows=chunk_rows
         )
 
     try:
@@ -338,7 +389,8 @@ def write_buffer(
         model_space=model_space,
         ref_y=prop_ref_y,
         int_fmt=int_fmt,
-        float_fmt=float_fmt
+        float_fmt=float_fmt,
+        chunk_rows=chunk_rows
     )
 
 
@@ -346,7 +398,7 @@ def write_buffer(
 
 def _write_elements(
     f, cells, elem_id, node_id,
-    int_fmt:str='8d'
+    int_fmt:str='8d', chunk_rows:int=WRITE_CHUNK_ROWS
     ):
     """Write element connectivity data to VABS format file.
 
@@ -359,86 +411,138 @@ def _write_elements(
     elem_id : list
         List of element IDs for each cell block. If empty, IDs are auto-generated.
     node_id : list
-        List of node IDs for renumbering (currently unused).
+        List of node IDs, one per mesh point, used to map point indices
+        to the node IDs written in the file.
     int_fmt : str, optional
         Format string for integer output, by default '8d'.
+    chunk_rows : int, optional
+        Number of elements converted and written at a time,
+        by default ``WRITE_CHUNK_ROWS``.
 
     Returns
     -------
     None
         Modifies elem_id list in-place if auto-generating element IDs.
-    """
-    if len(elem_id) == 0:
-        generate_eid = True
-    else:
-        generate_eid = False
-    # elem_ids = []
 
-    # if len(node_id) > 0:
-    #     _node_id = node_id.tolist()
-
-    sfi = '{:' + int_fmt + '}'
+    Notes
+    -----
+    Each chunk of a cell block is stacked into one integer matrix
+    ``[eid, n1, ..., n9]`` and written with a single row format.
+    """
+    generate_eid = len(elem_id) == 0
 
     consecutive_index = 0
     for k, cell_block in enumerate(cells):
-        cell_type = cell_block.type
-        node_idcs = _meshio_to_sg_order(
-            cell_type, cell_block.data,
-            node_id=node_id)
-
-        # print(f'cell_block.data = {cell_block.data}')
-        # print(f'node_idcs = {node_idcs}')
+        nelem = len(cell_block.data)
 
-        # _cid_to_eid = []
         if generate_eid:
-            elem_id.append([])
+            _eids = np.arange(consecutive_index + 1, consecutive_index + nelem + 1)
+            elem_id.append(_eids.tolist())
+        else:
+            _eids = np.asarray(elem_id[k], dtype=int)
+
+        for i in range(0, nelem, chunk_rows):
+            node_idcs = _meshio_to_sg_order(
+                cell_block.type, cell_block.data[i:i + chunk_rows],
+                node_id=node_id)
+            block = np.column_stack([_eids[i:i + chunk_rows], node_idcs])
+            _write_int_rows(
+                f, block, int_fmt,
+                comment='  ! element connectivity' if k == 0 and i == 0 else '',
+                chunk_rows=chunk_rows)
+
+        consecutive_index += nelem
 
-        for i, c in enumerate(node_idcs):
+    f.write('\n')
+    return
 
-            if generate_eid:
-                _eid = consecutive_index + i + 1
-                elem_id[k].append(_eid)
-            else:
-                _eid = int(elem_id[k][i])
 
-            _nums = [_eid, ]  # Element id
 
-            # if renumber_nodes:
-            #     # Get the index of node id in node_id
-            #     # print(f'c = {c.tolist()}')
-            #     logger.debug(f'c = {c.tolist()}')
-            #     _nids = [_node_id.index(_i) + 1 for _i in c.tolist() if _i != 0]
-            #     # print(f'_nids = {_nids}')
-            #     logger.debug(f'_nids = {_nids}')
-            #     _nums.extend(_nids)
-            # else:
-            # Ensure node ids are integers
-            _nums.extend([int(x) for x in c.tolist()])  # Node ids
 
-            # Write the numbers
-            fmt = ''.join([sfi,]*len(_nums))
-            f.write(fmt.format(*_nums))
-            # logger.debug('sfi = {}'.format(sfi))
-            # sui.writeFormatIntegers(f, _nums, fmt=sfi, newline=False)
-            if k == 0 and i == 0:  f.write('  ! element connectivity')
-            f.write('\n')
+def _theta_1_from_csys(csys, model_space:str=''):
+    """Compute theta_1 (in degrees) of one element from its reference csys.
 
-            # _cid_to_eid.append(_eid)
+    Parameters
+    ----------
+    csys : float or array-like or None
+        Either theta_1 itself (float) or the reference csys, whose first
+        three components are the reference y-axis.
+    model_space : str
+        The plane of the cross-section ('xy', 'yz' or 'zx').
 
-        # elem_ids.append(_cid_to_eid)
+    Returns
+    -------
+    float
+    """
+    if isinstance(csys, float):
+        return csys
 
-        consecutive_index += len(node_idcs)
+    try:
+        _vy2 = np.array(csys[:3])
+    except TypeError:
+        return 0
 
-    f.write('\n')
-    return
+    try:
+        _c0, _c1 = NODE_COORDINATE_COLUMNS[2][model_space]
+    except KeyError:
+        raise ValueError(f'Invalid model space: {model_space}')
 
+    return np.rad2deg(np.arctan2(_vy2[_c1], _vy2[_c0]))
 
 
+def _theta_1_from_csys_block(block, nelem:int, model_space:str='') -> np.ndarray:
+    """Compute theta_1 (in degrees) of all elements in a cell block.
+
+    Parameters
+    ----------
+    block : array-like or None
+        Either theta_1 of each element, shape (nelem,), or the reference
+        csys of each element, shape (nelem, ncomps) with ncomps >= 3.
+    nelem : int
+        Number of elements in the block.
+    model_space : str
+        The plane of the cross-section ('xy', 'yz' or 'zx').
+
+    Returns
+    -------
+    np.ndarray
+        theta_1 of each element, shape (nelem,).
+        Zero for elements without a reference csys.
+
+    Notes
+    -----
+    Regular blocks are converted with a single ``arctan2`` over the
+    model space columns; irregular blocks (e.g. lists mixing angles and
+    csys) are converted element by element.
+    """
+    if block is None:
+        return np.zeros(nelem)
+
+    try:
+        _csys = np.asarray(block, dtype=float)
+    except (TypeError, ValueError):
+        _csys = None
+
+    if _csys is not None and len(_csys) == nelem:
+        if _csys.ndim == 1:
+            return _csys
+
+        if _csys.ndim == 2 and _csys.shape[1] >= 3:
+            try:
+                _c0, _c1 = NODE_COORDINATE_COLUMNS[2][model_space]
+            except KeyError:
+                raise ValueError(f'Invalid model space: {model_space}')
+            return np.rad2deg(np.arctan2(_csys[:, _c1], _csys[:, _c0]))
+
+    return np.array(
+        [_theta_1_from_csys(block[j], model_space) for j in range(nelem)],
+        dtype=float)
+
 
 def _write_property_id_ref_csys(
     file, cell_prop_id, cell_csys, elem_ids,
     model_space='', ref_y='x',
-    int_fmt:str='8d', float_fmt:str='20.12e'
+    int_fmt:str='8d', float_fmt:str='20.12e', chunk_rows:int=WRITE_CHUNK_ROWS
     ):
     """Write the property id and reference csys (theta_1) to the file.
 
@@ -450,22 +554,27 @@ def _write_property_id_ref_csys(
         The property id for each cell.
     cell_csys : list of lists
         The reference csys for each cell.
+        Each block is either theta_1 of each cell, shape (n,),
+        or the reference csys of each cell, shape (n, 9).
     elem_ids : list of lists
         The element id for each cell.
+    model_space : str
+        The plane of the cross-section ('xy', 'yz' or 'zx'),
+        used to compute theta_1 from a reference csys.
     ref_y : str
         The reference y-axis for the reference csys.
     int_fmt : str
         The format string for the integer.
     float_fmt : str
         The format string for the float.
+    chunk_rows : int
+        The number of elements converted and written at a time.
 
     Returns
     -------
     None
     """
 
-    # sfi = '{:' + int_fmt + '}'
-    # sff = ''.join(['{:' + float_fmt + '}', ]*9)
     sfmt = ''.join([
         '{:' + int_fmt + '}',
         '{:' + int_fmt + '}',
@@ -474,48 +583,19 @@ def _write_property_id_ref_csys(
 
     for i, block_data in enumerate(cell_prop_id):
         # i-th cell/element block
-
-        for j, prop_id in enumerate(block_data):
-            # j-th cell/element in the i-th cell/element block
-            # Ensure integer types for elem_id and prop_id
-            prop_id = int(prop_id)
-            elem_id = int(elem_ids[i][j])
-
-            try:
-                theta_1 = cell_csys[i][j]
-                if not isinstance(theta_1, float):
-                    # Calculate theta_1 from the csys
-                    _csys = theta_1
-                    # _vx2 = np.array([1, 0, 0])
-
-                    _vy2 = np.array(_csys[:3])
-                    # logger.debug(f'_vy2 = {_vy2}')
-
-                    # Method 1
-                    # _cos_theta_1 = np.dot(_vx2, _vy2) / (np.linalg.norm(_vx2) * np.linalg.norm(_vy2))
-                    # print(f'_cos_theta_1 = {_cos_theta_1}')
-                    # theta_1 = np.rad2deg(np.arccos(_cos_theta_1))
-                    # print(f'theta_1 = {theta_1}')
-
-                    # Method 2
-                    if model_space == 'xy':
-                        theta_1 = np.rad2deg(np.arctan2(_vy2[1], _vy2[0]))
-                    elif model_space == 'yz':
-                        theta_1 = np.rad2deg(np.arctan2(_vy2[2], _vy2[1]))
-                    elif model_space == 'zx':
-                        theta_1 = np.rad2deg(np.arctan2(_vy2[0], _vy2[2]))
-                    else:
-                        raise ValueError(f'Invalid model space: {model_space}')
-                    # print(f'theta_1 = {theta_1}')
-
-            except TypeError:
-                theta_1 = 0
-
-            _nums = [elem_id, prop_id, theta_1]
-            # print(_nums)
-
-            file.write(sfmt.format(*_nums))
-            file.write('\n')
+        prop_id = np.asarray(block_data, dtype=int)
+        elem_id = np.asarray(elem_ids[i], dtype=int)
+        csys = None if cell_csys is None else cell_csys[i]
+
+        for j in range(0, len(prop_id), chunk_rows):
+            _prop_id = prop_id[j:j + chunk_rows]
+            theta_1 = _theta_1_from_csys_block(
+                None if csys is None else csys[j:j + chunk_rows],
+                len(_prop_id), model_space)
+
+            _write_rows(
+                file, sfmt, [elem_id[j:j + chunk_rows], _prop_id, theta_1],
+                chunk_rows=chunk_rows)
 
     file.write('\n')
     return
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 # import sgio._global as GLOBAL
 import sgio.utils as sutl
 import sgio.model as smdl
+import sgio.iofunc._sections as _sections
+from sgio.iofunc._meshio import _read_block_array, _read_id_value_block
 
 logger = logging.getLogger(__name__)
 
@@ -27,116 +31,57 @@ def _readOutputH(file, model_type='BM1', **kwargs):
 
 
 
+# Sections of the VABS .K file, in order of priority
+_BEAM_INERTIAL_SECTIONS = [
+    ('Geometric Center', ('xg2', 'xg3'), _sections._point),
+    ('Area =', 'area', _sections._last_value),
+    (_sections._title_line('The 6X6 Mass Matrix'), 'mass', _sections._matrix(6, 6)),
+    ('6X6 Mass Matrix at the Mass Center', 'mass_mc', _sections._matrix(6, 6)),
+    ('Mass Center of the Cross', ('xm2', 'xm3'), _sections._point),
+    ('Mass per unit span', 'mu', _sections._last_value),
+    ('inertia i11', 'i11', _sections._last_value),
+    ('inertia i22', 'i22', _sections._last_value),
+    ('inertia i33', 'i33', _sections._last_value),
+    ('principal inertial axes rotated', 'phi_pia', _sections._angle(wrap=True)),
+    ('mass-weighted radius of gyration', 'rg', _sections._last_value),
+]
+
+_BEAM_CLASSICAL_SECTIONS = [
+    ('Tension Center of the Cross', ('xt2', 'xt3'), _sections._point),
+    ('extension stiffness EA', 'ea', _sections._last_value),
+    ('torsional stiffness GJ', 'gj', _sections._last_value),
+    ('Principal bending stiffness EI22', 'ei22', _sections._last_value),
+    ('Principal bending stiffness EI33', 'ei33', _sections._last_value),
+    ('principal bending axes rotated', 'phi_pba', _sections._angle(wrap=True)),
+]
+
+EULER_BERNOULLI_BEAM_SECTIONS = _BEAM_INERTIAL_SECTIONS + [
+    ('Classical Stiffness Matrix', 'stff', _sections._matrix(4, 4)),
+    ('Classical Compliance Matrix', 'cmpl', _sections._matrix(4, 4)),
+] + _BEAM_CLASSICAL_SECTIONS
+
+TIMOSHENKO_BEAM_SECTIONS = _BEAM_INERTIAL_SECTIONS + [
+    ('Classical Stiffness Matrix', 'stff_c', _sections._matrix(4, 4)),
+    ('Classical Compliance Matrix', 'cmpl_c', _sections._matrix(4, 4)),
+] + _BEAM_CLASSICAL_SECTIONS + [
+    ('Timoshenko Stiffness Matrix', 'stff', _sections._matrix(6, 6)),
+    ('Timoshenko Compliance Matrix', 'cmpl', _sections._matrix(6, 6)),
+    ('Shear Center', ('xs2', 'xs3'), _sections._point),
+    ('Principal shear stiffness GA22', 'ga22', _sections._last_value),
+    ('Principal shear stiffness GA33', 'ga33', _sections._last_value),
+    ('principal shear axes rotated', 'phi_psa', _sections._angle(wrap=True)),
+]
+
+
 def _readEulerBernoulliBeamModel(file, model=None):
-    """
+    """Read VABS homogenization output for Euler-Bernoulli beam model.
     """
     if model is None:
         model = smdl.EulerBernoulliBeamModel()
 
-    block = ''
-    line = file.readline()
-
-    while True:
-        if not line:  # EOF
-            break
-
-        line = line.strip()
-
-        if len(line) == 0:
-            line = file.readline()
-            continue
-        elif line.startswith('--') or line.startswith('=='):
-            line = file.readline()
-            continue
-
-        # line = line.lower()
-        # line = line.replace('-', ' ')
-
-        elif 'Geometric Center' in line:
-            for _ in range(3): line = file.readline()
-            model.xg2, model.xg3 = list(map(float, line.split()))
-        elif 'Area =' in line:
-            model.area = float(line.split()[-1])
-
-
-        # Inertial properties
-        # -------------------
-
-        elif line == 'The 6X6 Mass Matrix':
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float
-                )
-            model.mass = _matrix
-        elif '6X6 Mass Matrix at the Mass Center' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float
-                )
-            model.mass_mc = _matrix
-        elif 'Mass Center of the Cross' in line:
-            for _ in range(3): line = file.readline()
-            model.xm2, model.xm3 = list(map(float, line.split()))
-        elif 'Mass per unit span' in line:
-            model.mu = float(line.split()[-1])
-        elif 'inertia i11' in line:
-            model.i11 = float(line.split()[-1])
-        elif 'inertia i22' in line:
-            model.i22 = float(line.split()[-1])
-        elif 'inertia i33' in line:
-            model.i33 = float(line.split()[-1])
-        elif 'principal inertial axes rotated' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-            except ValueError:
-                line = file.readline().split()
-                tmp_id = line.index('degrees')
-            model.phi_pia = float(line[tmp_id - 1])
-        elif 'mass-weighted radius of gyration' in line:
-            model.rg = float(line.split()[-1])
-
-
-        # Structural properties
-        # ---------------------
-
-        elif 'Classical Stiffness Matrix' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4, number_type=float
-                )
-            model.stff = _matrix
-        elif 'Classical Compliance Matrix' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4, number_type=float
-                )
-            model.cmpl = _matrix
-
-        elif 'Tension Center of the Cross' in line:
-            for _ in range(3): line = file.readline()
-            model.xt2, model.xt3 = list(map(float, line.split()))
-        elif 'extension stiffness EA' in line:
-            model.ea = float(line.split()[-1])
-        elif 'torsional stiffness GJ' in line:
-            model.gj = float(line.split()[-1])
-        elif 'Principal bending stiffness EI22' in line:
-            model.ei22 = float(line.split()[-1])
-        elif 'Principal bending stiffness EI33' in line:
-            model.ei33 = float(line.split()[-1])
-        elif 'principal bending axes rotated' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-            except ValueError:
-                # If not find the value, read the next line
-                line = file.readline().split()
-                tmp_id = line.index('degrees')
-            model.phi_pba = float(line[tmp_id - 1])
-
-        line = file.readline()
+    _sections._set_attributes(
+        model, _sections._parse_sections(file.read(), EULER_BERNOULLI_BEAM_SECTIONS)
+    )
 
     return model
 
@@ -144,144 +89,15 @@ def _readEulerBernoulliBeamModel(file, model=None):
 
 
 def _readTimoshenkoBeamModel(file, model=None):
-    """
+    """Read VABS homogenization output for Timoshenko beam model.
     """
 
     if model is None:
         model = smdl.TimoshenkoBeamModel()
 
-    block = ''
-    line = file.readline()
-
-    while True:
-        if not line:  # EOF
-            break
-
-        line = line.strip()
-
-        if len(line) == 0:
-            line = file.readline()
-            continue
-        elif line.startswith('--') or line.startswith('=='):
-            line = file.readline()
-            continue
-
-        # line = line.lower()
-        # line = line.replace('-', ' ')
-
-        elif 'Geometric Center' in line:
-            for _ in range(3): line = file.readline()
-            model.xg2, model.xg3 = list(map(float, line.split()))
-        elif 'Area =' in line:
-            model.area = float(line.split()[-1])
-
-
-        # Inertial properties
-        # -------------------
-
-        elif line == 'The 6X6 Mass Matrix':
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float
-                )
-            model.mass = _matrix
-        elif '6X6 Mass Matrix at the Mass Center' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6,
-                number_type=float
-                )
-            model.mass_mc = _matrix
-        elif 'Mass Center of the Cross' in line:
-            for _ in range(3): line = file.readline()
-            model.xm2, model.xm3 = list(map(float, line.split()))
-        elif 'Mass per unit span' in line:
-            model.mu = float(line.split()[-1])
-        elif 'inertia i11' in line:
-            model.i11 = float(line.split()[-1])
-        elif 'inertia i22' in line:
-            model.i22 = float(line.split()[-1])
-        elif 'inertia i33' in line:
-            model.i33 = float(line.split()[-1])
-        elif 'principal inertial axes rotated' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-            except ValueError:
-                line = file.readline().split()
-                tmp_id = line.index('degrees')
-            model.phi_pia = float(line[tmp_id - 1])
-        elif 'mass-weighted radius of gyration' in line:
-            model.rg = float(line.split()[-1])
-
-
-        # Structural properties
-        # ---------------------
-
-        elif 'Classical Stiffness Matrix' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4, number_type=float
-                )
-            model.stff_c = _matrix
-        elif 'Classical Compliance Matrix' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=4, ncols=4, number_type=float
-                )
-            model.cmpl_c = _matrix
-
-        elif 'Tension Center of the Cross' in line:
-            for _ in range(3): line = file.readline()
-            model.xt2, model.xt3 = list(map(float, line.split()))
-        elif 'extension stiffness EA' in line:
-            model.ea = float(line.split()[-1])
-        elif 'torsional stiffness GJ' in line:
-            model.gj = float(line.split()[-1])
-        elif 'Principal bending stiffness EI22' in line:
-            model.ei22 = float(line.split()[-1])
-        elif 'Principal bending stiffness EI33' in line:
-            model.ei33 = float(line.split()[-1])
-        elif 'principal bending axes rotated' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-            except ValueError:
-                line = file.readline().split()
-                tmp_id = line.index('degrees')
-            model.phi_pba = float(line[tmp_id - 1])
-
-        elif 'Timoshenko Stiffness Matrix' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6, number_type=float
-                )
-            model.stff = _matrix
-        elif 'Timoshenko Compliance Matrix' in line:
-            for _ in range(3): line = file.readline()
-            _matrix, line = sutl.readMatrix(
-                file, line, nrows=6, ncols=6, number_type=float
-                )
-            model.cmpl = _matrix
-
-        elif 'Shear Center' in line:
-            for _ in range(3): line = file.readline()
-            model.xs2, model.xs3 = list(map(float, line.split()))
-        elif 'Principal shear stiffness GA22' in line:
-            model.ga22 = float(line.split()[-1])
-        elif 'Principal shear stiffness GA33' in line:
-            model.ga33 = float(line.split()[-1])
-        elif 'principal shear axes rotated' in line:
-            line = line.split()
-            try:
-                tmp_id = line.index('degrees')
-            except ValueError:
-                line = file.readline().split()
-                tmp_id = line.index('degrees')
-            model.phi_psa = float(line[tmp_id - 1])
-
-        line = file.readline()
+    _sections._set_attributes(
+        model, _sections._parse_sections(file.read(), TIMOSHENKO_BEAM_SECTIONS)
+    )
 
     return model
 
@@ -461,6 +277,68 @@ def _readTimoshenkoBeamModel(file, model=None):
 # Read dehomogenization output
 
 
+# Columns of the VABS .U file: node id, x2, x3, u1, u2, u3
+NODE_DISPLACEMENT_COLUMNS = [3, 4, 5]
+
+
+def _readOutputNodeDisplacementArray(file, nnode=None, node_ids=None):
+    """Read VABS output displacement on nodes as arrays.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nnode: int, optional
+        Number of nodes. Default reads until the end of the file.
+    node_ids: array-like of int, optional
+        Only read the displacement of these nodes.
+
+    Returns
+    -------
+    np.ndarray:
+        Node IDs, shape (n,), in file order.
+    np.ndarray:
+        Displacements [u1, u2, u3], shape (n, 3).
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``nnode`` lines are read or a line is incomplete.
+    """
+    return _read_id_value_block(
+        file, nnode, NODE_DISPLACEMENT_COLUMNS, ids=node_ids, comment='!'
+    )
+
+
+def _readOutputNodeDisplacementState(file, nnode=None, node_ids=None):
+    """Read VABS output displacement on nodes as a State.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nnode: int, optional
+        Number of nodes. Default reads until the end of the file.
+    node_ids: array-like of int, optional
+        Only read the displacement of these nodes.
+
+    Returns
+    -------
+    State:
+        State 'u' on nodes, sorted by node ID.
+    """
+    node_id, u = _readOutputNodeDisplacementArray(file, nnode, node_ids)
+
+    if np.any(node_id[1:] < node_id[:-1]):
+        order = np.argsort(node_id, kind='stable')
+        node_id, u = node_id[order], u[order]
+
+    return smdl.State(
+        name='u', data=u, label=['u1', 'u2', 'u3'], location='node',
+        entity_ids=node_id
+    )
+
+
 def _readOutputNodeDisplacement(file):
     """Read VABS output displacement on nodes.
 
@@ -472,24 +350,129 @@ def _readOutputNodeDisplacement(file):
     Returns
     -------
     dict[int, list[float]]:
-        Averaged 3D strains in the beam coordinate system.
+        Displacement of all nodes.
+    """
+
+    node_id, u = _readOutputNodeDisplacementArray(file)
+
+    return dict(zip(node_id.tolist(), u.tolist()))
+
+
+
+
+def _readOutputCaseHeader(file):
+    """Read the header line of a load case in VABS output (version > 4).
+
+    Blank lines before the header are skipped.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+
+    Returns
+    -------
+    str:
+        The header line, stripped. Empty string at the end of the file.
     """
+    line = file.readline()
+    while line and line.strip() == '':
+        line = file.readline()
+    return line.strip()
 
-    u = {}
-    for i, line in enumerate(file):
-        line = line.strip()
-        if line == '':
-            continue
 
-        line = line.split()
-        _nid = int(line[0])
-        _ui = list(map(float, line[3:6]))
+# Element states in the VABS .ELE file, in column order
+# (name, component labels)
+ELEMENT_STRAIN_STRESS_STATES = (
+    ('ee', ['e11', '2e12', '2e13', 'e22', '2e23', 'e33']),
+    ('es', ['s11', 's12', 's13', 's22', 's23', 's33']),
+    ('eem', ['em11', '2em12', '2em13', 'em22', '2em23', 'em33']),
+    ('esm', ['sm11', 'sm12', 'sm13', 'sm22', 'sm23', 'sm33']),
+)
 
-        u[_nid] = _ui
+# Number of values per element in the VABS .ELE file
+ELEMENT_STRAIN_STRESS_NCOLS = 6 * len(ELEMENT_STRAIN_STRESS_STATES)
 
-    return u
 
+def _readOutputElementStrainStressArray(file, nelem):
+    """Read VABS output averaged strains and stresses on elements as arrays.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nelem: int
+        Number of elements.
 
+    Returns
+    -------
+    np.ndarray:
+        Element IDs, shape (nelem,).
+    np.ndarray:
+        Strains and stresses, shape (nelem, 24). Columns are the strains
+        and stresses in the beam coordinate system, followed by the strains
+        and stresses in the material coordinate system, 6 components each.
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``nelem`` lines are read or a line is incomplete.
+    """
+    ncols = ELEMENT_STRAIN_STRESS_NCOLS
+
+    data, lines = _read_block_array(file, nelem, comment='!', dtype=float)
+
+    if data is None or data.shape[1] < ncols + 1:
+        if len(lines) < nelem:
+            raise ValueError(
+                f'expected {nelem} elements in VABS element output, read {len(lines)}'
+            )
+        data = np.zeros((nelem, ncols + 1))
+        for i, line in enumerate(lines):
+            line = line.split('!')[0].split()
+            if len(line) < ncols + 1:
+                raise ValueError(f'incomplete VABS element output line: {lines[i]!r}')
+            data[i, 0] = int(line[0])
+            data[i, 1:] = sutl.fortran_floats(line[1:ncols + 1])
+
+    elem_id = data[:, 0].astype(int)
+    values = data[:, 1:ncols + 1]
+
+    # Keep States sorted by element ID, as built from dicts
+    if np.any(elem_id[1:] < elem_id[:-1]):
+        order = np.argsort(elem_id, kind='stable')
+        elem_id = elem_id[order]
+        values = values[order]
+
+    return elem_id, values
+
+
+def _buildElementStrainStressStates(elem_id, values):
+    """Build the VABS element strain and stress states from arrays.
+
+    Each State holds a column slice (a view) of ``values``, so no data
+    is copied.
+
+    Parameters
+    ----------
+    elem_id: np.ndarray
+        Element IDs, shape (nelem,).
+    values: np.ndarray
+        Strains and stresses, shape (nelem, 24), as returned by
+        :func:`_readOutputElementStrainStressArray`.
+
+    Returns
+    -------
+    dict[str, State]:
+        States 'ee', 'es', 'eem' and 'esm'.
+    """
+    states = {}
+    for i, (name, label) in enumerate(ELEMENT_STRAIN_STRESS_STATES):
+        states[name] = smdl.State(
+            name=name, data=values[:, 6 * i:6 * (i + 1)], label=list(label),
+            location='element', entity_ids=elem_id
+        )
+    return states
 
 
 def _readOutputElementStrainStressCase(file, nelem):
@@ -514,27 +497,13 @@ def _readOutputElementStrainStressCase(file, nelem):
         Averaged 3D stressess in the material coordinate system.
     """
 
-    e, s, em, sm = {}, {}, {}, {}
-    i = 0
-    # for i, line in enumerate(file):
-    while i < nelem:
-        line = file.readline().strip()
-        if line == '':
-            continue
-
-        line = line.split()
-        _eid = int(line[0])
-        _ei = list(map(float, line[1:7]))
-        _si = list(map(float, line[7:13]))
-        _emi = list(map(float, line[13:19]))
-        _smi = list(map(float, line[19:]))
-
-        e[_eid] = _ei
-        s[_eid] = _si
-        em[_eid] = _emi
-        sm[_eid] = _smi
+    elem_id, values = _readOutputElementStrainStressArray(file, nelem)
 
-        i += 1
+    elem_id = elem_id.tolist()
+    e, s, em, sm = (
+        dict(zip(elem_id, values[:, 6 * i:6 * (i + 1)].tolist()))
+        for i in range(len(ELEMENT_STRAIN_STRESS_STATES))
+    )
 
     return e, s, em, sm
 
@@ -544,6 +513,53 @@ def _readOutputElementStrainStressCase(file, nelem):
 # Read failure analysis output
 
 
+def _readOutputFailureIndexArray(file, nelem):
+    """Read VABS output initial failure indices and strength ratios as arrays.
+
+    Parameters
+    ----------
+    file:
+        File object of the output file.
+    nelem: int
+        Number of elements.
+
+    Returns
+    -------
+    np.ndarray:
+        Element IDs, shape (nelem,), in file order.
+    np.ndarray:
+        Initial failure indices, shape (nelem,).
+    np.ndarray:
+        Strength ratios, shape (nelem,).
+    list[int]:
+        ID of elements having the lowest strength ratio, as reported by
+        VABS after the element lines.
+
+    Raises
+    ------
+    ValueError
+        If fewer than ``nelem`` lines are read or a line is incomplete.
+    """
+    elem_id, values = _read_id_value_block(file, nelem, [1, 2], comment='!')
+    fi, sr = values[:, 0], values[:, 1]
+
+    # Last line: 'The sectional strength ratio is ... existing for element <eid>'
+    # The element ID may be wrapped to the next line
+    eids_sr_min = []
+    line = file.readline()
+    while line and line.strip() == '':
+        line = file.readline()
+    if line:
+        try:
+            eids_sr_min.append(int(line.split()[-1]))
+        except ValueError:
+            eids_sr_min.append(int(file.readline().split()[0]))
+    elif sr.size > 0:
+        eids_sr_min.append(int(elem_id[np.argmin(sr)]))
+
+    return elem_id, fi, sr, eids_sr_min
+
+
 def _readOutputFailureIndexCase(file, nelem):
     """Read VABS output initial failure indices and strength ratios for elements.
 
@@ -560,55 +576,10 @@ def _readOutputFailureIndexCase(file, nelem):
         ID of elemnets having the lowest strength ratio.
     """
 
-    fi = {}
-    sr = {}
-    eids_sr_min = []
+    elem_id, fi, sr, eids_sr_min = _readOutputFailureIndexArray(file, nelem)
 
-    i = 0
-    # for i, line in enumerate(file):
-    while i <= nelem:
-        line = file.readline().strip()
-        if line == '':
-            continue
-        # if line.startswith('Failure index'):
-        #     continue
-
-        # Read the initial failure indices and strength ratios
-        if i < nelem:
-            line = line.split()
-            if len(line) == 3:
-                # lines.append(line)
-                fi[int(line[0])] = float(line[1])
-                sr[int(line[0])] = float(line[2])
-
-        # Read the last line of sectional strength ratio
-        # if (line.startswith('The sectional strength ratio is')):
-        elif i == nelem:
-            # line = file.readline().strip()
-            line = line.split()
-            # _loc = line.index('existing')
-            # _sr_min = float(line[tmp_id - 1])
-            try:
-                _eid = int(line[-1])
-            except ValueError:
-                line = file.readline().split()
-                _eid = int(line[0])
-
-            eids_sr_min.append(_eid)
-            # lines.pop()
-            # continue
-
-        i += 1
-
-    # result = []
-    # # fis = []
-    # # srs = []
-    # for line in lines:
-    #     # line = line.strip().split()
-    #     result.append([int(line[0]), float(line[1]), float(line[2])])
-    #     # fis.append(float(line[1]))
-    #     # srs.append(float(line[2]))
+    elem_id = elem_id.tolist()
+    fi = dict(zip(elem_id, fi.tolist()))
+    sr = dict(zip(elem_id, sr.tolist()))
 
     return fi, sr, eids_sr_min
-
-
@@ -4,6 +4,7 @@ import logging
 
 # from sgio.iofunc._meshio import read_sgmesh_buffer, write_sgmesh_buffer
 from ._input import (
+    WRITE_CHUNK_ROWS,
     _readHeader,
     _readMesh,
     _readMaterialRotationCombinations,
@@ -17,6 +18,7 @@ from ._input import (
 # from ._mesh import *
 from ._output import (
     _readOutputH,
+    _readOutputCaseHeader,
     _readOutputNodeDisplacement,
     _readOutputElementStrainStressCase,
     _readOutputFailureIndexCase,
@@ -124,6 +126,8 @@ def read_output_buffer(
         Tool version.
     ncase: int, optional
         Number of load cases. Default is 1.
+        If greater than 1, the element strain/stress and failure index
+        outputs are returned as a list with one item per load case.
     nelem: int, optional
         Number of elements.
 
@@ -157,8 +161,12 @@ def read_output_buffer(
                     line = file.readline()  # skip the first line
                 return _readOutputElementStrainStressCase(file, nelem)
             else:
-                #TODO
-                pass
+                cases = []
+                for _ in range(ncase):
+                    if float(tool_version) > 4:
+                        _readOutputCaseHeader(file)
+                    cases.append(_readOutputElementStrainStressCase(file, nelem))
+                return cases
 
     elif analysis == 'f' or analysis == 3:
         # return readSCOutFailure(file, analysis)
@@ -177,8 +185,12 @@ def read_output_buffer(
                 line = file.readline()  # skip the first line
             return _readOutputFailureIndexCase(file, nelem)
         else:
-            #TODO
-            pass
+            cases = []
+            for _ in range(ncase):
+                if float(tool_version) > 4:
+                    _readOutputCaseHeader(file)
+                cases.append(_readOutputFailureIndexCase(file, nelem))
+            return cases
 
         # output = {}
         # _fi, _sr, _eids_sr_min = _readOutputFailureIndex(file)
@@ -207,6 +219,7 @@ def write_buffer(
     model_space='', prop_ref_y='x',
     macro_responses:list[smdl.StateCase]=[],
     sfi:str='8d', sff:str='20.12e', version=None,
+    chunk_rows:int=WRITE_CHUNK_ROWS,
     **kwargs
     ):
     """Write analysis input.
@@ -235,6 +248,9 @@ def write_buffer(
         Float format string, by default '20.12e'.
     version : optional
         Format version.
+    chunk_rows : int, optional
+        Number of nodes/elements converted and written at a time,
+        by default ``WRITE_CHUNK_ROWS``.
     """
 
     if sg is None:
@@ -260,7 +276,7 @@ def write_buffer(
             timoshenko_flag, vlasov_flag, trapeze_flag, thermal_flag,
             model_space=model_space, prop_ref_y=prop_ref_y,
             sg_fmt=sg_fmt,
-            sfi=sfi, sff=sff, version=version)
+            sfi=sfi, sff=sff, version=version, chunk_rows=chunk_rows)
 
     elif (analysis == 'd') or (analysis == 'l') or (analysis.startswith('f')):
         if sg is None:
@@ -288,7 +304,8 @@ def writeInputBuffer(
     timoshenko_flag, vlasov_flag, trapeze_flag, thermal_flag,
     model_space='', prop_ref_y='x',
     sg_fmt:int=1,
-    sfi:str='8d', sff:str='20.12e', version=None):
+    sfi:str='8d', sff:str='20.12e', version=None,
+    chunk_rows:int=WRITE_CHUNK_ROWS):
     """
     """
 
@@ -337,7 +354,7 @@ def writeInputBuffer(
     _writeMesh(
         sg.mesh, file,
         model_space=model_space, prop_ref_y=prop_ref_y,
-        int_fmt=sfi, float_fmt=sff)
+        int_fmt=sfi, float_fmt=sff, chunk_rows=chunk_rows)
 
     # if not mesh_only:
     # Get material ID mapping for export
@@ -14,4 +14,8 @@ from .beam import (
     TimoshenkoBeamModel,
     # BeamModel, BeamProperty
     )
+from .table import (
+    ModelTable,
+    MODEL_TABLE_FIELDS,
+    )
 
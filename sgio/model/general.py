@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Protocol, Iterable, Optional, Union
+import itertools
+import operator
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Protocol, Iterable, Iterator, Optional, Union
 from numbers import Number
 from enum import Enum
 import numpy as np
@@ -53,6 +56,101 @@ def getModelDim(model:str) -> int:
 
 
 
+def _is_increasing(ids: np.ndarray) -> bool:
+    """Check in O(n) that IDs are in strictly ascending order."""
+    return bool((ids[1:] > ids[:-1]).all())
+
+
+class _StateDataItems(ItemsView):
+    def __iter__(self):
+        yield from zip(self._mapping._entity_ids.tolist(), self._mapping._data.tolist())
+
+
+class _StateDataValues(ValuesView):
+    def __iter__(self):
+        yield from self._mapping._data.tolist()
+
+
+class StateData(Mapping):
+    """Read-only ``{entity_id: values}`` view of the field data of a State.
+
+    Values are looked up in the data array by a binary search of the
+    sorted entity IDs, so that ``data[eid]`` is O(log n) without building
+    a dict of the whole state. Use ``dict(state.data)`` to get a mutable
+    copy.
+
+    Parameters
+    ----------
+    entity_ids : np.ndarray
+        Entity ID of each row of the data. IDs are expected to be unique;
+        for a repeated ID, the last row is used.
+    data : np.ndarray
+        Data array, with one row per entity.
+    """
+
+    def __init__(self, entity_ids: np.ndarray, data: np.ndarray):
+        self._entity_ids = entity_ids
+        self._data = data
+        self._sorted_ids: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+
+    @property
+    def entity_ids(self) -> np.ndarray:
+        """Entity IDs, in the order of the data rows."""
+        return self._entity_ids
+
+    @property
+    def data_array(self) -> np.ndarray:
+        """Data array, with one row per entity."""
+        return self._data
+
+    def _build_index(self) -> None:
+        ids = np.asarray(self._entity_ids)
+        if len(ids) > 1 and (ids[1:] < ids[:-1]).any():
+            self._order = np.argsort(ids, kind='stable')
+            self._sorted_ids = ids[self._order]
+        else:
+            self._sorted_ids = ids
+
+    def _row(self, eid) -> int:
+        """Row of the data of an entity ID. Raises KeyError if not found."""
+        try:
+            key = operator.index(eid)
+        except TypeError:
+            if isinstance(eid, float) and eid.is_integer():
+                key = int(eid)
+            else:
+                raise KeyError(eid) from None
+
+        if self._sorted_ids is None:
+            self._build_index()
+        i = int(np.searchsorted(self._sorted_ids, key, side='right')) - 1
+        if i < 0 or self._sorted_ids[i] != key:
+            raise KeyError(eid)
+        return i if self._order is None else int(self._order[i])
+
+    def __getitem__(self, eid) -> Union[list, float]:
+        return self._data[self._row(eid)].tolist()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entity_ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self._entity_ids)
+
+    def items(self) -> ItemsView:
+        return _StateDataItems(self)
+
+    def values(self) -> ValuesView:
+        return _StateDataValues(self)
+
+    def __repr__(self) -> str:
+        items = [f'{_eid}: {_values}' for _eid, _values in itertools.islice(self.items(), 5)]
+        if len(self) > 5:
+            items.append('...')
+        return f"StateData({{{', '.join(items)}}})"
+
+
 class State():
     """
     A class to represent a state with associated data, labels, and location.
@@ -122,6 +220,7 @@ class State():
         """
         self.name: str = name
         self.label: list[str] = label if label is not None else []
+        self._data_view: Optional[StateData] = None
 
         # Validate location
         if location and location not in ('node', 'element', 'element_node'):
@@ -137,7 +236,7 @@ class State():
             # Empty field data (backward compatible with old default {})
             self._data: np.ndarray = np.array([]).reshape(0, 0)
             self._entity_ids: Optional[np.ndarray] = np.array([], dtype=int)
-        elif isinstance(data, dict):
+        elif isinstance(data, Mapping):
             # Field data: {entity_id: [values], ...}
             self._from_dict(data)
         elif isinstance(data, list):
@@ -166,13 +265,22 @@ class State():
         For backward compatibility, this returns dict/list format.
         Use `data_array` to get the NumPy array directly.
 
+        The field data is returned as a read-only :class:`StateData`
+        mapping, cached until the data or the entity IDs are replaced.
+
         Returns
         -------
-        dict or list
-            - dict: {entity_id: [values], ...} for field data
+        StateData or list
+            - StateData: {entity_id: [values], ...} for field data
             - list: [values, ...] for point data
         """
-        return self._to_dict()
+        if self._entity_ids is None:
+            return self._data.tolist()
+
+        view = self._data_view
+        if view is None or view._data is not self._data or view._entity_ids is not self._entity_ids:
+            view = self._data_view = StateData(self._entity_ids, self._data)
+        return view
 
     @data.setter
     def data(self, value: Union[dict, list, np.ndarray]) -> None:
@@ -183,7 +291,7 @@ class State():
         value : dict, list, or np.ndarray
             Data to set
         """
-        if isinstance(value, dict):
+        if isinstance(value, Mapping):
             self._from_dict(value)
         elif isinstance(value, list):
             self._data = np.array(value)
@@ -236,18 +344,137 @@ class State():
         data : dict
             Field data in format {entity_id: [values], ...}
         """
+        if isinstance(data, StateData):
+            data = dict(data.items())
+
         if not data:
             self._data = np.array([]).reshape(0, 0)
             self._entity_ids = np.array([], dtype=int)
             return
 
-        # Sort by entity ID for consistent ordering
-        sorted_items = sorted(data.items())
-        entity_ids = [item[0] for item in sorted_items]
-        values = [item[1] for item in sorted_items]
+        entity_ids = np.fromiter(data.keys(), dtype=int, count=len(data))
+        values = np.array(list(data.values()))
+
+        # Sort by entity ID for consistent ordering, unless already sorted
+        if not _is_increasing(entity_ids):
+            order = np.argsort(entity_ids, kind='stable')
+            entity_ids = entity_ids[order]
+            values = values[order]
+
+        self._entity_ids = entity_ids
+        self._data = values
+
+    @classmethod
+    def from_arrays(
+        cls,
+        entity_ids: Iterable[int],
+        data: np.ndarray,
+        name: str = '',
+        label: Optional[list[str]] = None,
+        location: str = '',
+    ) -> 'State':
+        """Construct a field data State from arrays.
+
+        Unlike a dict, the arrays are used as they are if the entity IDs
+        are in ascending order, which is checked in O(n). Otherwise, the
+        rows are sorted by entity ID.
 
-        self._entity_ids = np.array(entity_ids, dtype=int)
-        self._data = np.array(values)
+        Parameters
+        ----------
+        entity_ids : Iterable[int]
+            Entity ID of each row of the data.
+        data : np.ndarray
+            Data array, with one row per entity.
+        name : str, optional
+            The name of the state.
+        label : list of str, optional
+            The labels associated with the state components.
+        location : str, optional
+            The location type: 'node', 'element', or 'element_node'.
+
+        Returns
+        -------
+        State
+
+        Raises
+        ------
+        ValueError
+            If the IDs are not 1D, the numbers of IDs and rows differ, or an
+            ID is repeated.
+        """
+        entity_ids = np.asarray(entity_ids, dtype=int)
+        data = np.asarray(data)
+        if entity_ids.ndim != 1:
+            raise ValueError(f"Entity IDs must be 1D, got shape {entity_ids.shape}")
+        if len(entity_ids) != len(data):
+            raise ValueError(
+                f"Got {len(entity_ids)} entity IDs for {len(data)} data rows"
+            )
+
+        if not _is_increasing(entity_ids):
+            order = np.argsort(entity_ids, kind='stable')
+            entity_ids = entity_ids[order]
+            data = data[order]
+            if not _is_increasing(entity_ids):
+                raise ValueError(f"Repeated entity IDs in state '{name}'")
+
+        return cls(
+            name=name, data=data, label=label, location=location,
+            entity_ids=entity_ids
+        )
+
+    @classmethod
+    def concat(cls, states: Iterable['State'], name: Optional[str] = None) -> 'State':
+        """Concatenate the field data of several states, e.g. one per cell block.
+
+        Parameters
+        ----------
+        states : Iterable[State]
+            Field data states with the same location and number of
+            components, and no entity ID in common.
+        name : str, optional
+            Name of the new state. Default is the name of the first state.
+
+        Returns
+        -------
+        State
+            State of the rows of all the states, sorted by entity ID.
+
+        Raises
+        ------
+        ValueError
+            If no state is given, the states are not all field data, their
+            locations or data shapes differ, or an ID is repeated.
+        """
+        states = list(states)
+        if not states:
+            raise ValueError("No state to concatenate")
+
+        first = states[0]
+        for state in states:
+            if not state.is_field_data():
+                raise ValueError(f"State '{state.name}' is not field data")
+            if state.location != first.location:
+                raise ValueError(
+                    f"Cannot concatenate {first.location} and {state.location} states"
+                )
+
+        nonempty = [_state for _state in states if len(_state._data) > 0]
+        if not nonempty:
+            data = np.array([]).reshape(0, 0)
+        else:
+            shapes = {_state._data.shape[1:] for _state in nonempty}
+            if len(shapes) > 1:
+                raise ValueError(f"Cannot concatenate data of shapes {sorted(shapes)}")
+            data = np.concatenate([_state._data for _state in nonempty])
+
+        return cls.from_arrays(
+            np.concatenate([_state._entity_ids for _state in nonempty]) if nonempty else [],
+            data,
+            name=first.name if name is None else name,
+            label=list(first.label),
+            location=first.location,
+        )
 
     def _to_dict(self) -> Union[dict, list]:
         """Convert NumPy arrays to dict/list format for backward compatibility.
@@ -574,11 +801,12 @@ class StateCase():
         elif data is not None:
             if isinstance(data, list):
                 self._states[name].data = data
-            elif isinstance(data, dict):
+            elif isinstance(data, Mapping):
                 # Merge dict data with existing data
                 current_data = self._states[name].data
-                if isinstance(current_data, dict):
-                    merged_data = {**current_data, **data}
+                if isinstance(current_data, Mapping):
+                    merged_data = dict(current_data.items())
+                    merged_data.update(data)
                     self._states[name].data = merged_data
                 else:
                     # If current data is not dict, replace it
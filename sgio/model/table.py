@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import csv
+from typing import Iterable, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from .beam import EulerBernoulliBeamModel, TimoshenkoBeamModel
+from .shell import KirchhoffLovePlateShellModel
+
+
+_BEAM_SCALARS = [
+    'xg2', 'xg3', 'area', 'xm2', 'xm3', 'mu', 'i11', 'i22', 'i33', 'phi_pia', 'rg',
+    'xt2', 'xt3', 'ea', 'gj', 'ei22', 'ei33', 'phi_pba',
+]
+
+#: Matrix and scalar attributes stored in a :class:`ModelTable`, by model class.
+MODEL_TABLE_FIELDS = {
+    EulerBernoulliBeamModel: (
+        ['mass', 'mass_mc', 'stff', 'cmpl'],
+        _BEAM_SCALARS,
+    ),
+    TimoshenkoBeamModel: (
+        ['mass', 'mass_mc', 'stff_c', 'cmpl_c', 'stff', 'cmpl'],
+        _BEAM_SCALARS + ['xs2', 'xs3', 'ga22', 'ga33', 'phi_psa'],
+    ),
+    KirchhoffLovePlateShellModel: (
+        ['mass', 'stff', 'cmpl', 'geo_correction_stff', 'stff_geo'],
+        ['xm3', 'i11', 'i22']
+        + KirchhoffLovePlateShellModel.constant_name_inplane
+        + KirchhoffLovePlateShellModel.constant_name_flexural
+        + ['n11_t', 'n22_t', 'n12_t', 'm11_t', 'm22_t', 'm12_t'],
+    ),
+}
+
+
+def _model_class(label: str) -> type:
+    """Get the model class of a model label, e.g. 'bm2'."""
+    for model_class in MODEL_TABLE_FIELDS:
+        if _model_label(model_class) == label:
+            return model_class
+    raise ValueError(f"Unknown model label: {label}")
+
+
+def _model_label(model_class: type) -> str:
+    return getattr(model_class, 'label', None) or model_class.__name__
+
+
+def _stack_matrices(models: list, name: str) -> Optional[np.ndarray]:
+    """Stack a matrix attribute of the models into a (nmodel, nrow, ncol) array.
+
+    Models that are None or lack the matrix get rows of NaN. Returns None
+    if no model has the matrix.
+    """
+    matrices = [getattr(_model, name, None) for _model in models]
+    shape = next((np.shape(_m) for _m in matrices if _m is not None and len(_m) > 0), None)
+    if shape is None:
+        return None
+
+    stacked = np.full((len(models),) + shape, np.nan)
+    for i, matrix in enumerate(matrices):
+        if matrix is not None and np.shape(matrix) == shape:
+            stacked[i] = matrix
+    return stacked
+
+
+def _stack_scalars(models: list, name: str) -> np.ndarray:
+    """Stack a scalar attribute of the models, with NaN for missing values."""
+    values = [getattr(_model, name, None) for _model in models]
+    return np.array([np.nan if _v is None else _v for _v in values], dtype=float)
+
+
+class ModelTable():
+    """Constitutive models of one type stored as stacked arrays.
+
+    The N models of a table, e.g. the beam properties of the spanwise
+    stations of a blade, are stored as one array per property: (N, nrow,
+    ncol) for the matrices (``stff``, ``mass``, ...) and (N,) for the
+    scalars (``ea``, ``gj``, ``xm2``, ...). Missing values are NaN.
+
+    Parameters
+    ----------
+    model_class : type
+        Class of the models, one of the keys of :data:`MODEL_TABLE_FIELDS`.
+    data : dict[str, np.ndarray]
+        Array of each property, by attribute name. All arrays have the
+        same first dimension N.
+    names : list[str], optional
+        Name of each model. Default is empty names.
+
+    Examples
+    --------
+    ..  code-block:: python
+
+        table = ModelTable.from_models(models)
+        ea = table['ea']          # (N,)
+        k11 = table.get('stff11')  # (N,)
+        table.to_csv('blade_props.csv')
+    """
+
+    def __init__(
+        self, model_class: type, data: dict[str, np.ndarray],
+        names: Optional[list[str]] = None
+    ):
+        if model_class not in MODEL_TABLE_FIELDS:
+            raise TypeError(f"Unsupported model class: {model_class.__name__}")
+
+        self.model_class = model_class
+        self.data = {_name: np.asarray(_value, dtype=float) for _name, _value in data.items()}
+
+        sizes = {len(_value) for _value in self.data.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Properties have different numbers of models: {sorted(sizes)}")
+        size = sizes.pop() if sizes else len(names or [])
+
+        self.names = list(names) if names is not None else [''] * size
+        if len(self.names) != size:
+            raise ValueError(f"Expected {size} names, got {len(self.names)}")
+
+    @classmethod
+    def from_models(
+        cls, models: Iterable, model_class: Optional[type] = None
+    ) -> ModelTable:
+        """Build a table from a list of models.
+
+        Parameters
+        ----------
+        models : Iterable
+            Models of one class. None entries, e.g. the files that could
+            not be read by :func:`sgio.read_output_models`, give rows of NaN.
+        model_class : type, optional
+            Class of the models. Default is the class of the first model.
+
+        Returns
+        -------
+        ModelTable
+        """
+        models = list(models)
+        classes = {type(_model) for _model in models if _model is not None}
+        if model_class is None:
+            if not classes:
+                raise ValueError("Cannot infer the model class from an empty list of models")
+            model_class = type(next(_model for _model in models if _model is not None))
+        if classes - {model_class}:
+            raise TypeError(
+                f"Models must all be {model_class.__name__}, got "
+                f"{sorted(_c.__name__ for _c in classes)}"
+            )
+        if model_class not in MODEL_TABLE_FIELDS:
+            raise TypeError(f"Unsupported model class: {model_class.__name__}")
+
+        matrix_names, scalar_names = MODEL_TABLE_FIELDS[model_class]
+        data = {}
+        for name in matrix_names:
+            stacked = _stack_matrices(models, name)
+            if stacked is not None:
+                data[name] = stacked
+        for name in scalar_names:
+            data[name] = _stack_scalars(models, name)
+
+        names = [getattr(_model, 'name', '') if _model is not None else '' for _model in models]
+
+        return cls(model_class, data, names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.data
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.data[name]
+
+    def __repr__(self) -> str:
+        return (
+            f"ModelTable({self.model_class.__name__}, {len(self)} models, "
+            f"properties: {', '.join(self.data)})"
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the scalar columns, with one column per matrix entry.
+
+        A matrix entry is named after the matrix and its 1-based row and
+        column, e.g. 'stff11' or 'mass26'.
+        """
+        columns = []
+        for name, value in self.data.items():
+            if value.ndim == 1:
+                columns.append(name)
+            else:
+                columns.extend(
+                    f'{name}{i+1}{j+1}'
+                    for i in range(value.shape[1]) for j in range(value.shape[2])
+                )
+        return columns
+
+    def get(self, name: str) -> np.ndarray:
+        """Get a property of all the models.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name, e.g. 'ea' or 'stff', or a matrix entry named as
+            in :attr:`columns`, e.g. 'stff11'.
+
+        Returns
+        -------
+        np.ndarray
+            Values of the property, with one row per model.
+        """
+        if name in self.data:
+            return self.data[name]
+
+        matrix, ij = name[:-2], name[-2:]
+        if matrix in self.data and ij.isdigit() and self.data[matrix].ndim == 3:
+            i, j = int(ij[0]) - 1, int(ij[1]) - 1
+            nrow, ncol = self.data[matrix].shape[1:]
+            if 0 <= i < nrow and 0 <= j < ncol:
+                return self.data[matrix][:, i, j]
+
+        raise KeyError(f"Unknown property: {name}")
+
+    def to_array(self, columns: Optional[list[str]] = None) -> np.ndarray:
+        """Get the table as a 2D array, with one row per model.
+
+        Parameters
+        ----------
+        columns : list[str], optional
+            Names of the columns. Default is :attr:`columns`.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (N, ncolumn).
+        """
+        if columns is None:
+            columns = self.columns
+        if not columns:
+            return np.empty((len(self), 0))
+        return np.column_stack([self.get(_name) for _name in columns])
+
+    def to_models(self) -> list:
+        """Rebuild the models of the table. NaN values give None attributes."""
+        models = []
+        for k, name in enumerate(self.names):
+            values = {'name': name}
+            for attr, value in self.data.items():
+                row = value[k]
+                if np.isnan(row).all():
+                    values[attr] = None
+                elif value.ndim == 1:
+                    values[attr] = float(row)
+                else:
+                    values[attr] = row.tolist()
+
+            if issubclass(self.model_class, BaseModel):
+                model = self.model_class(**values)
+            else:
+                model = self.model_class()
+                for attr, value in values.items():
+                    setattr(model, attr, value)
+            models.append(model)
+        return models
+
+    def to_csv(self, filename: str, columns: Optional[list[str]] = None) -> None:
+        """Write the table to a CSV file, with one row per model.
+
+        The first column holds the model names.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the CSV file.
+        columns : list[str], optional
+            Names of the columns. Default is :attr:`columns`.
+        """
+        if columns is None:
+            columns = self.columns
+        array = self.to_array(columns)
+
+        with open(filename, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['name'] + list(columns))
+            for name, row in zip(self.names, array):
+                writer.writerow([name] + [repr(float(_v)) for _v in row])
+
+    def to_npz(self, filename: str, compressed: bool = True) -> None:
+        """Write the table arrays to a NumPy .npz file.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the .npz file.
+        compressed : bool
+            Use :func:`numpy.savez_compressed`. Default is True.
+        """
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            filename,
+            model_label=np.array(_model_label(self.model_class)),
+            names=np.array(self.names, dtype=str),
+            **self.data
+        )
+
+    @classmethod
+    def from_npz(cls, filename: str) -> ModelTable:
+        """Read a table written by :meth:`to_npz`."""
+        with np.load(filename) as npz:
+            model_class = _model_class(str(npz['model_label']))
+            names = npz['names'].tolist()
+            data = {
+                _name: npz[_name] for _name in npz.files
+                if _name not in ('model_label', 'names')
+            }
+        return cls(model_class, data, names)
@@ -1,7 +1,14 @@
-from typing import Iterable
+from typing import Iterable, Optional, Union
 import pprint
 import xml.etree.ElementTree as et
 
+import numpy as np
+
+
+# Translation tables mapping Fortran 'd'/'D' exponent markers to 'e'/'E'
+FORTRAN_EXPONENT_TABLE = str.maketrans('dD', 'eE')
+_FORTRAN_EXPONENT_TABLE_BYTES = bytes.maketrans(b'dD', b'eE')
+
 def convertToPrettyString(v):
     return pprint.pformat(v)
 
@@ -18,7 +25,72 @@ def fortran_float(s: str) -> float:
     -------
     float
     """
-    return float(s.replace('d', 'e').replace('D', 'E'))
+    return float(s.translate(FORTRAN_EXPONENT_TABLE))
+
+
+def translate_fortran_exponents(text: Union[str, bytes]) -> Union[str, bytes]:
+    """Replace Fortran-style 'd'/'D' exponent markers by 'e'/'E'.
+
+    The whole text is translated in one call, so a numeric block of any
+    size can be made readable by :func:`numpy.loadtxt` or :func:`float`.
+
+    Parameters
+    ----------
+    text : str or bytes
+        Numeric text, e.g. a block of lines of an SG file.
+
+    Returns
+    -------
+    str or bytes
+        Translated text, of the same type as ``text``.
+    """
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        return bytes(text).translate(_FORTRAN_EXPONENT_TABLE_BYTES)
+    # str.replace is much faster than str.translate on long text
+    if 'd' in text or 'D' in text:
+        text = text.replace('d', 'e').replace('D', 'E')
+    return text
+
+
+def fortran_floats(
+    text: Union[str, bytes, Iterable[str]], comment: Optional[str] = None
+    ) -> np.ndarray:
+    """Convert a block of numbers to a 1D float array in one pass.
+
+    Handles Fortran-style 'd'/'D' exponent notation. Numbers may be
+    separated by any whitespace, including newlines.
+
+    Parameters
+    ----------
+    text : str, bytes or iterable of str
+        Numeric text, or lines of numeric text.
+    comment : str, optional
+        Comment character. Text following it on each line is ignored.
+
+    Returns
+    -------
+    np.ndarray
+        1D array of all the numbers, in reading order.
+
+    Raises
+    ------
+    ValueError
+        If a token is not a number.
+
+    Examples
+    --------
+    >>> fortran_floats('1.0d0 2.5D-1 3')
+    array([1.  , 0.25, 3.  ])
+    """
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        text = bytes(text).decode()
+    elif not isinstance(text, str):
+        text = '\n'.join(text)
+
+    if comment and comment in text:
+        text = '\n'.join(_line.split(comment, 1)[0] for _line in text.splitlines())
+
+    return np.array(translate_fortran_exponents(text).split(), dtype=float)
 
 
 def readNextNonEmptyLine(file):
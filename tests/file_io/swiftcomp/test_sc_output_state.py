@@ -6,18 +6,31 @@ This module tests:
 3. Writing mesh with state data to output files
 """
 
+import numpy as np
 import pytest
+from io import StringIO
 from pathlib import Path
 import yaml
 
 from sgio import (
     read,
     read_output_state,
+    iter_output_states,
     add_cell_dict_data_to_mesh,
     write,
     logger,
 )
-from sgio.iofunc.swiftcomp._output import _read_output_node_strain_stress_case_global_gmsh
+from sgio.iofunc.swiftcomp._output import (
+    _read_output_node_disp_case,
+    _read_output_node_disp_case_state,
+    _read_output_node_strain_stress_case_global_gmsh,
+    _read_output_node_strain_stress_case_arrays,
+    _add_element_node_groups_to_mesh,
+    _build_element_node_strain_stress_states,
+    _read_output_failure_index_array,
+    _readOutputFailureIndex,
+)
+from sgio.core.mesh import SGMesh
 from sgio.core.sg import StructureGene
 
 
@@ -269,3 +282,165 @@ def test_read_output_node_strain_stress_gmsh_format(test_data_dir):
     logger.info(f"✓ Each node has 6 strain and 6 stress components")
     logger.info(f"✓ Data structure matches specification")
 
+
+
+@pytest.mark.io
+@pytest.mark.swiftcomp
+def test_sc_iter_output_states(test_data_dir):
+    """Streaming load cases matches reading all of them at once."""
+    fn_in = str(test_data_dir / 'swiftcomp' / 'sg31t_hex20_sc21.sg')
+    sg = read(fn_in, 'sc', sgdim=3, model_type='bm2')
+    extension = ['u', 'sn', 'snm']
+
+    expected, = read_output_state(fn_in, 'sc', 'd', sg=sg, extension=extension)
+    state_case, = list(iter_output_states(fn_in, 'sc', 'd', sg=sg, extension=extension))
+
+    for name in ('u', 'e', 's', 'em', 'sm'):
+        assert state_case.getState(name).label == expected.getState(name).label
+        assert state_case.getState(name).data == expected.getState(name).data
+    assert state_case.getState('sm').label[0] == 's11m'
+
+
+def _element_node_output(blocks):
+    """Format 12 component blocks of element node output.
+
+    ``blocks`` is a list of 12 lists of (eid, values) pairs.
+    """
+    lines = []
+    for block in blocks:
+        for eid, values in block:
+            lines.append(f'{eid:11d}{len(values):10d}' + ''.join(f'{_v:20.7E}' for _v in values))
+        lines.append('')
+    return StringIO('\n'.join(lines) + '\n')
+
+
+@pytest.mark.io
+@pytest.mark.swiftcomp
+def test_read_output_node_strain_stress_arrays(test_data_dir):
+    """The array reader matches a plain per-line parse of the 12 blocks."""
+    test_file = test_data_dir / "swiftcomp" / "sg31t_hex20_sc21.sg.sn"
+    nelem = 100
+
+    with open(test_file) as file:
+        rows = [_line.split() for _line in file if _line.strip()]
+    expected = np.array([list(map(float, _r[2:])) for _r in rows]).reshape(12, nelem, 20)
+
+    with open(test_file) as file:
+        strains, stresses = _read_output_node_strain_stress_case_arrays(file, nelem)
+
+    assert list(strains) == [20]
+    elem_id, e = strains[20]
+    _, s = stresses[20]
+    np.testing.assert_array_equal(elem_id, np.arange(1, nelem + 1))
+    assert e.shape == s.shape == (nelem, 20, 6)
+    np.testing.assert_array_equal(e, expected[:6].transpose(1, 2, 0))
+    np.testing.assert_array_equal(s, expected[6:].transpose(1, 2, 0))
+
+    states = _build_element_node_strain_stress_states(strains, stresses, suffix='m')
+    assert states['em'].label == NAME_EM
+    assert states['sm'].label == NAME_SM
+    assert states['sm'].location == 'element_node'
+    np.testing.assert_array_equal(states['sm'].data_array, s)
+
+
+@pytest.mark.io
+@pytest.mark.swiftcomp
+def test_read_output_node_strain_stress_arrays_mixed_elements():
+    """Mixed element types are grouped by their number of nodes."""
+    tri = {1: [1.0, 2.0, 3.0], 3: [4.0, 5.0, 6.0]}
+    quad = {2: [7.0, 8.0, 9.0, 10.0]}
+    blocks = []
+    for k in range(12):
+        block = [(1, tri[1]), (2, quad[2]), (3, tri[3])]
+        if k == 5:
+            block = block[::-1]  # element order differs between blocks
+        blocks.append([(_eid, [_v + 100 * k for _v in _vals]) for _eid, _vals in block])
+
+    strains, stresses = _read_output_node_strain_stress_case_arrays(
+        _element_node_output(blocks), 3)
+
+    assert sorted(strains) == [3, 4]
+    elem_id, e = strains[3]
+    np.testing.assert_array_equal(elem_id, [1, 3])
+    np.testing.assert_array_equal(e[1, :, 5], [504.0, 505.0, 506.0])
+    np.testing.assert_array_equal(stresses[4][1][0, :, 0], [607.0, 608.0, 609.0, 610.0])
+
+    # Dict output is unchanged
+    strain_dict, _ = _read_output_node_strain_stress_case_global_gmsh(
+        _element_node_output(blocks), 3, None)
+    assert strain_dict[2][0] == [7.0 + 100 * k for k in range(6)]
+
+    # Element node arrays go to the cell blocks of the mesh
+    mesh = SGMesh(
+        np.zeros((7, 3)),
+        [('quad', np.array([[0, 1, 2, 3]])), ('triangle', np.array([[0, 1, 4], [4, 5, 6]]))],
+        cell_data={'element_id': [np.array([2]), np.array([3, 1])]},
+    )
+    _add_element_node_groups_to_mesh('e', strains, mesh)
+    _add_element_node_groups_to_mesh(NAME_S, stresses, mesh)
+
+    assert mesh.cell_point_data['e'][0].shape == (1, 4, 6)
+    np.testing.assert_array_equal(mesh.cell_point_data['e'][1][:, :, 0], [[4.0, 5.0, 6.0], [1.0, 2.0, 3.0]])
+    np.testing.assert_array_equal(mesh.cell_point_data['s11'][0], [[607.0, 608.0, 609.0, 610.0]])
+
+
+@pytest.mark.io
+@pytest.mark.swiftcomp
+def test_read_output_node_strain_stress_arrays_errors():
+    """Incomplete blocks raise."""
+    blocks = [[(1, [1.0, 2.0, 3.0])] for _ in range(12)]
+    with pytest.raises(ValueError):
+        _read_output_node_strain_stress_case_arrays(_element_node_output(blocks), 2)
+
+    blocks[3] = [(2, [1.0, 2.0, 3.0])]
+    with pytest.raises(ValueError):
+        _read_output_node_strain_stress_case_arrays(_element_node_output(blocks), 1)
+
+
+@pytest.mark.io
+@pytest.mark.swiftcomp
+def test_read_output_node_disp_state(test_data_dir):
+    """The .u reader returns a node State, for all nodes or a subset."""
+    fn = test_data_dir / 'swiftcomp' / 'sg31t_hex20_sc21.sg.u'
+    with open(fn) as file:
+        rows = [_line.split() for _line in file if _line.strip()]
+    expected = {int(_r[0]): list(map(float, _r[1:4])) for _r in rows}
+
+    with open(fn) as file:
+        state = _read_output_node_disp_case_state(file, len(rows))
+    assert state.location == 'node'
+    assert state.label == ['u1', 'u2', 'u3']
+    assert state.data == expected
+
+    with open(fn) as file:
+        assert _read_output_node_disp_case(file, len(rows)) == expected
+
+    with open(fn) as file:
+        state = _read_output_node_disp_case_state(file, len(rows), node_ids=np.array([5, 2]))
+    np.testing.assert_array_equal(state.entity_ids, [2, 5])
+    assert state.data == {2: expected[2], 5: expected[5]}
+
+
+@pytest.mark.io
+@pytest.mark.swiftcomp
+def test_read_output_failure_index_array():
+    """The .fi array reader parses Fortran exponents and finds the minimum."""
+    text = """
+  Failure index and strength ratio
+      1   2.0D-01   5.0D+00
+      2   5.0D-01   2.0D+00
+      3   4.0D-01   2.5D+00
+"""
+    elem_id, fi, sr, eids_sr_min = _read_output_failure_index_array(StringIO(text))
+    np.testing.assert_array_equal(elem_id, [1, 2, 3])
+    np.testing.assert_allclose(fi, [0.2, 0.5, 0.4])
+    np.testing.assert_allclose(sr, [5.0, 2.0, 2.5])
+    assert eids_sr_min == [2]
+
+    fi_dict, sr_dict, eids = _readOutputFailureIndex(StringIO(
+        text + " The sectional strength ratio is 2.0 existing for element 3\n"))
+    assert fi_dict == {1: 0.2, 2: 0.5, 3: 0.4}
+    assert sr_dict == {1: 5.0, 2: 2.0, 3: 2.5}
+    assert eids == [3]
+
+    assert _read_output_failure_index_array(StringIO(''))[3] == [0]
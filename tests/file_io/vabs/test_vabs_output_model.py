@@ -9,7 +9,10 @@ import os
 from pathlib import Path
 import pytest
 
-from sgio import read_output_model, logger, configure_logging
+import numpy as np
+
+from sgio import read_output_model, read_output_models, logger, configure_logging
+from sgio.iofunc import _sections
 
 configure_logging(cout_level='info')
 
@@ -141,3 +144,77 @@ def test_vabs_output_model_properties_access(test_data_dir):
     
     logger.info("✓ All property access methods work correctly")
 
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+@pytest.mark.parametrize("workers", [1, 2])
+def test_vabs_read_output_models_batch(workers, test_data_dir, tmp_path):
+    """Test reading a batch of VABS output files.
+
+    Results are in input order, a missing file is reported without
+    stopping the batch, and the matrices are stacked with NaN rows for it.
+    """
+    fn_in = str(test_data_dir / "vabs" / "version_4_0" / "sg21t_tri3_vabs40.sg.K")
+    fn_missing = str(tmp_path / "missing.sg.K")
+    filenames = [fn_in, fn_missing, fn_in]
+
+    result = read_output_models(
+        filenames, 'vabs', model_type='BM2', workers=workers, stack=True,
+        table=True
+    )
+
+    model = read_output_model(fn_in, 'vabs', model_type='BM2')
+    assert result['models'][1] is None
+    assert result['models'][0].ea == model.ea
+    assert result['models'][2].ga22 == model.ga22
+    assert list(result['errors']) == [1]
+    assert 'missing.sg.K' in result['errors'][1]
+
+    assert result['stff'].shape == (3, 6, 6)
+    assert result['mass'].shape == (3, 6, 6)
+    assert np.array_equal(result['stff'][0], model.stff)
+    assert np.isnan(result['stff'][1]).all()
+    assert np.array_equal(result['table']['stff'], result['stff'], equal_nan=True)
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_read_output_models_unsupported_format(test_data_dir):
+    """An unsupported file format is reported as an error of each file."""
+    fn_in = str(test_data_dir / "vabs" / "version_4_0" / "sg21t_tri3_vabs40.sg.K")
+
+    result = read_output_models([fn_in], 'gmsh', workers=1)
+
+    assert result['models'] == [None]
+    assert result['errors'] == {0: "ValueError: Unsupported file format: gmsh"}
+
+
+@pytest.mark.unit
+def test_parse_sections_priority_and_last_title():
+    """A line with several titles is read by the first table row only,
+    and a repeated title is read from its last line."""
+    text = '\n'.join([
+        ' Mass per unit span  1.0',
+        ' The 6X6 Mass Matrix at the Mass Center',
+        ' ------------',
+        '   2.0D+00  3.0d+00',
+        ' The 6X6 Mass Matrix',
+        ' ============',
+        '',
+        '   4.0E+00  5.0E+00',
+        ' Mass per unit span  6.0',
+    ])
+    table = [
+        ('Mass per unit span', 'mass_per_span', _sections._last_value),
+        (_sections._title_line('The 6X6 Mass Matrix'), 'mass', _sections._matrix(1, 2)),
+        ('6X6 Mass Matrix', 'mass_mc', _sections._matrix(1, 2)),
+    ]
+
+    values = _sections._parse_sections(text, table)
+
+    assert values == {
+        'mass_mc': [[2.0, 3.0]],
+        'mass': [[4.0, 5.0]],
+        'mass_per_span': 6.0,
+    }
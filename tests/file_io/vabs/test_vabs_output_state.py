@@ -6,19 +6,32 @@ This module tests reading VABS output state data including:
 - Multiple load cases
 """
 import os
+from io import StringIO
 from pathlib import Path
+import numpy as np
 import pytest
 import yaml
 
 from sgio import (
     read,
     read_output_state,
+    iter_output_states,
+    read_output_failure_summary,
     add_cell_dict_data_to_mesh,
     write,
     configure_logging,
     logger,
 )
 
+from sgio.iofunc.vabs._output import (
+    _readOutputNodeDisplacement,
+    _readOutputNodeDisplacementState,
+    _readOutputElementStrainStressArray,
+    _readOutputElementStrainStressCase,
+    _readOutputFailureIndexArray,
+    _readOutputFailureIndexCase,
+)
+
 configure_logging(cout_level='info')
 
 # Component labels for visualization
@@ -210,3 +223,238 @@ def test_vabs_output_state_failure(fn_test_cases, test_data_dir, tmp_path):
             assert os.path.exists(fn_out), f"Output file was not created: {fn_out}"
             assert os.path.getsize(fn_out) > 0, f"Output file is empty: {fn_out}"
 
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_element_strain_stress_array(test_data_dir):
+    """The columnar .ELE reader matches a plain per-line parse."""
+    fn = test_data_dir / 'vabs' / 'version_4_1' / 'cas1.sg.ELE'
+    with open(fn) as file:
+        file.readline()  # case header
+        rows = [_line.split() for _line in file if _line.strip()]
+    nelem = len(rows)
+
+    with open(fn) as file:
+        file.readline()
+        elem_id, values = _readOutputElementStrainStressArray(file, nelem)
+
+    assert values.shape == (nelem, 24)
+    np.testing.assert_array_equal(elem_id, [int(_r[0]) for _r in rows])
+    np.testing.assert_array_equal(values, [list(map(float, _r[1:])) for _r in rows])
+
+    with open(fn) as file:
+        file.readline()
+        e, s, em, sm = _readOutputElementStrainStressCase(file, nelem)
+    assert sm[int(rows[-1][0])] == list(map(float, rows[-1][19:25]))
+    assert len(e) == len(s) == len(em) == nelem
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_element_strain_stress_array_errors():
+    """Unsorted IDs are sorted, short blocks raise."""
+    row = ' '.join(['1.0d0'] * 24)
+    elem_id, values = _readOutputElementStrainStressArray(
+        StringIO(f'2 {row}\n1 {row}\n'), 2)
+    np.testing.assert_array_equal(elem_id, [1, 2])
+    assert values.shape == (2, 24)
+
+    with pytest.raises(ValueError):
+        _readOutputElementStrainStressArray(StringIO(f'1 {row}\n'), 2)
+    with pytest.raises(ValueError):
+        _readOutputElementStrainStressArray(StringIO('1 1.0 2.0\n'), 1)
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_element_states_are_column_views(test_data_dir):
+    """Element states share one array and carry the element IDs."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'cas1.sg')
+    sg = read(fn_in, 'vabs')
+
+    state_case = read_output_state(fn_in, 'vabs', 'd', sg=sg, tool_version='4.1')[0]
+
+    ee = state_case.getState('ee')
+    esm = state_case.getState('esm')
+    assert ee.location == 'element'
+    assert ee.label == ['e11', '2e12', '2e13', 'e22', '2e23', 'e33']
+    assert ee.data_array.shape == (sg.nelems, 6)
+    assert ee.data_array.base is not None
+    assert ee.data_array.base is esm.data_array.base
+    np.testing.assert_array_equal(ee.entity_ids, np.sort(ee.entity_ids))
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+@pytest.mark.parametrize('fn_in, analysis, names', [
+    ('sg2_i_simple_eo1.dat', 'd', ['ee', 'es', 'eem', 'esm']),
+    ('sg2_i_simple_eo1_fi.dat', 'fi', ['fi', 'sr', 'sr_min']),
+])
+def test_vabs_iter_output_states(fn_in, analysis, names, test_data_dir):
+    """Streaming load cases matches reading all of them at once."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / fn_in)
+    sg = read(fn_in, 'vabs')
+
+    state_cases = read_output_state(
+        fn_in, 'vabs', analysis, sg=sg, tool_version='4.1', num_cases=3)
+    states_iter = iter_output_states(
+        fn_in, 'vabs', analysis, sg=sg, tool_version='4.1', num_cases=3)
+
+    assert not isinstance(states_iter, list)
+    n = 0
+    for state_case, expected in zip(states_iter, state_cases):
+        for name in names:
+            np.testing.assert_array_equal(
+                state_case.getState(name).data_array,
+                expected.getState(name).data_array)
+        n += 1
+    assert n == 3
+
+    # Load cases differ from each other
+    first, last = state_cases[0].getState(names[0]), state_cases[-1].getState(names[0])
+    assert not np.array_equal(first.data_array, last.data_array)
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_iter_output_states_incomplete(test_data_dir):
+    """Reading past the last load case raises."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'sg2_i_simple_eo1.dat')
+    sg = read(fn_in, 'vabs')
+
+    states_iter = iter_output_states(
+        fn_in, 'vabs', 'd', sg=sg, tool_version='4.1', num_cases=4)
+    for _ in range(3):
+        next(states_iter)
+    with pytest.raises(ValueError):
+        next(states_iter)
+
+    assert read_output_state(
+        fn_in, 'vabs', 'd', sg=sg, tool_version='4.1', num_cases=4) is None
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_iter_output_states_unknown_num_elements(test_data_dir):
+    """Element outputs need the SG or the number of elements."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'sg2_i_simple_eo1_fi.dat')
+
+    with pytest.raises(ValueError, match='Unknown number of elements'):
+        list(iter_output_states(fn_in, 'vabs', 'fi', tool_version='4.1'))
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_node_displacement_state(test_data_dir):
+    """The .U reader returns a node State, for all nodes or a subset."""
+    fn = test_data_dir / 'vabs' / 'version_4_1' / 'cas1.sg.U'
+    with open(fn) as file:
+        rows = [_line.split() for _line in file if _line.strip()]
+    expected = {int(_r[0]): list(map(float, _r[3:6])) for _r in rows}
+
+    with open(fn) as file:
+        state = _readOutputNodeDisplacementState(file, len(rows))
+    assert state.name == 'u'
+    assert state.location == 'node'
+    assert state.data_array.shape == (len(rows), 3)
+    assert state.data == expected
+
+    with open(fn) as file:
+        assert _readOutputNodeDisplacement(file) == expected
+
+    node_ids = [int(rows[-1][0]), int(rows[0][0])]
+    with open(fn) as file:
+        state = _readOutputNodeDisplacementState(file, len(rows), node_ids=node_ids)
+    assert state.data == {_nid: expected[_nid] for _nid in sorted(node_ids)}
+
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'cas1.sg')
+    sg = read(fn_in, 'vabs')
+    state_case, = read_output_state(
+        fn_in, 'vabs', 'd', sg=sg, extension=['u'], tool_version='4.1', node_ids=node_ids)
+    np.testing.assert_array_equal(state_case.getState('u').entity_ids, sorted(node_ids))
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_failure_index_array(test_data_dir):
+    """The .fi array reader matches the dict reader, with the sectional element."""
+    fn = test_data_dir / 'vabs' / 'version_4_0' / 'uh60a.sg.fi'
+    with open(fn) as file:
+        rows = [_line.split() for _line in file if len(_line.split()) == 3]
+    nelem = len(rows)
+
+    with open(fn) as file:
+        elem_id, fi, sr, eids_sr_min = _readOutputFailureIndexArray(file, nelem)
+    assert elem_id.shape == fi.shape == sr.shape == (nelem,)
+    np.testing.assert_array_equal(elem_id, [int(_r[0]) for _r in rows])
+    np.testing.assert_array_equal(sr, [float(_r[2]) for _r in rows])
+    assert eids_sr_min == [67973]
+
+    with open(fn) as file:
+        fi_dict, sr_dict, eids = _readOutputFailureIndexCase(file, nelem)
+    assert fi_dict == dict(zip(elem_id.tolist(), fi.tolist()))
+    assert sr_dict == dict(zip(elem_id.tolist(), sr.tolist()))
+    assert eids == eids_sr_min
+
+    # Without the sectional line, the element of the lowest strength ratio
+    text = ''.join(f'{_r[0]} {_r[1]} {_r[2]}\n' for _r in rows[:10])
+    elem_id, fi, sr, eids_sr_min = _readOutputFailureIndexArray(StringIO(text), 10)
+    assert eids_sr_min == [int(elem_id[np.argmin(sr)])]
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_read_output_failure_summary(test_data_dir):
+    """The failure summary matches the states of each load case."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'sg2_i_simple_eo1_fi.dat')
+    sg = read(fn_in, 'vabs')
+
+    summary = read_output_failure_summary(
+        fn_in, 'vabs', sg=sg, tool_version='4.1', num_cases=3, top_k=4)
+    state_cases = read_output_state(
+        fn_in, 'vabs', 'fi', sg=sg, tool_version='4.1', num_cases=3)
+
+    assert summary['critical_eids'].shape == (3, 4)
+    for i, state_case in enumerate(state_cases):
+        fi = state_case.getState('fi')
+        sr = state_case.getState('sr')
+        order = np.lexsort((np.arange(len(sr.data_array)), sr.data_array))[:4]
+        assert summary['fi_max'][i] == fi.data_array.max()
+        assert summary['sr_min'][i] == sr.data_array.min()
+        assert [summary['eid_sr_min'][i]] == list(state_case.getState('sr_min').data)
+        np.testing.assert_array_equal(summary['critical_sr'][i], sr.data_array[order])
+        np.testing.assert_array_equal(summary['critical_eids'][i], sr.entity_ids[order])
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_read_output_failure_summary_unknown_num_elements(test_data_dir):
+    """VABS failure output needs the SG or the number of elements."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'sg2_i_simple_eo1_fi.dat')
+
+    with pytest.raises(ValueError, match='Unknown number of elements'):
+        read_output_failure_summary(fn_in, 'vabs', tool_version='4.1')
+
+    sg = read(fn_in, 'vabs')
+    summary = read_output_failure_summary(
+        fn_in, 'vabs', tool_version='4.1', num_elements=sg.nelems)
+    assert summary['critical_eids'].shape == (1, 1)
+
+
+@pytest.mark.io
+@pytest.mark.vabs
+def test_vabs_read_output_failure_summary_edge_cases(test_data_dir):
+    """No load case gives empty (0, top_k) arrays, and top_k < 1 raises."""
+    fn_in = str(test_data_dir / 'vabs' / 'version_4_1' / 'sg2_i_simple_eo1_fi.dat')
+    sg = read(fn_in, 'vabs')
+
+    summary = read_output_failure_summary(
+        fn_in, 'vabs', sg=sg, tool_version='4.1', num_cases=0, top_k=4)
+    assert summary['fi_max'].shape == (0,)
+    assert summary['critical_eids'].shape == (0, 4)
+    assert summary['critical_sr'].shape == (0, 4)
+
+    with pytest.raises(ValueError, match='top_k'):
+        read_output_failure_summary(
+            fn_in, 'vabs', sg=sg, tool_version='4.1', num_cases=1, top_k=0)
@@ -0,0 +1,54 @@
+"""Time to check the node ordering of a mixed 3D mesh."""
+import time
+
+import numpy as np
+import pytest
+
+from sgio.core.mesh import SGMesh, _signed_measure, check_cell_ordering, fix_cell_ordering
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_check_cell_ordering_mixed_cells():
+    """The ordering of hexahedra, tetras and wedges is fixed faster than cell by cell."""
+    n = 16
+    x, y, z = np.meshgrid(*[np.arange(n + 1.0)] * 3, indexing='ij')
+    points = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    index = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)
+
+    def corner(i, j, k):
+        return index[i:n + i, j:n + j, k:n + k].ravel()
+
+    hexahedra = np.column_stack([
+        corner(0, 0, 0), corner(1, 0, 0), corner(1, 1, 0), corner(0, 1, 0),
+        corner(0, 0, 1), corner(1, 0, 1), corner(1, 1, 1), corner(0, 1, 1),
+    ])
+    tetras = np.column_stack([corner(0, 0, 0), corner(1, 0, 0), corner(0, 1, 0), corner(0, 0, 1)])
+    wedges = np.column_stack([
+        corner(0, 0, 0), corner(1, 0, 0), corner(0, 1, 0),
+        corner(0, 0, 1), corner(1, 0, 1), corner(0, 1, 1),
+    ])
+    # Invert every other tetra
+    tetras[::2, :2] = tetras[::2, 1::-1]
+    blocks = [('hexahedron', hexahedra), ('tetra', tetras), ('wedge', wedges)]
+    mesh = SGMesh(points, [(_type, _cells.copy()) for _type, _cells in blocks])
+
+    start = time.perf_counter()
+    fixed = fix_cell_ordering(mesh)
+    invalid = check_cell_ordering(mesh)
+    ordering_time = time.perf_counter() - start
+
+    # Reference: the signed measure of one cell at a time
+    start = time.perf_counter()
+    inverted = []
+    for cell_type, cells in blocks:
+        measure = [_signed_measure(points, _cell[None], cell_type)[0] for _cell in cells]
+        inverted.append(np.flatnonzero(np.array(measure) < 0).tolist())
+    loop_time = time.perf_counter() - start
+
+    assert list(fixed) == [(1, 'tetra')]
+    assert len(fixed[(1, 'tetra')]) == n ** 3 // 2
+    assert inverted[1] == fixed[(1, 'tetra')].tolist()
+    assert inverted[0] == inverted[2] == []
+    assert invalid == {}
+    assert ordering_time < loop_time
@@ -0,0 +1,50 @@
+"""Time to attach element results to a large mesh.
+
+Results read as arrays (or as a State) are aligned to the element IDs of
+the mesh with one sorted-index join instead of a lookup per element.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from sgio.core.mesh import SGMesh
+from sgio.iofunc._meshio import add_cell_array_data_to_mesh, add_cell_dict_data_to_mesh
+
+
+NELEM = 200_000
+
+
+def _triangle_mesh(elem_ids):
+    return SGMesh(
+        np.zeros((3, 3)),
+        [('triangle', np.zeros((len(elem_ids), 3), dtype=int))],
+        cell_data={'element_id': [elem_ids]},
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_add_cell_array_data_vs_dict_data():
+    """Six strain components are attached faster as arrays than as a dict."""
+    rng = np.random.default_rng(0)
+    elem_ids = np.arange(1, NELEM + 1)
+    ids = rng.permutation(elem_ids)
+    values = rng.random((NELEM, 6))
+    names = [f'e{_k}' for _k in range(6)]
+    dict_data = dict(zip(ids.tolist(), values.tolist()))
+
+    array_mesh = _triangle_mesh(elem_ids)
+    start = time.perf_counter()
+    add_cell_array_data_to_mesh(names, ids, values, array_mesh)
+    array_time = time.perf_counter() - start
+
+    dict_mesh = _triangle_mesh(elem_ids)
+    start = time.perf_counter()
+    add_cell_dict_data_to_mesh(names, dict_data, dict_mesh)
+    dict_time = time.perf_counter() - start
+
+    np.testing.assert_array_equal(array_mesh.cell_data['e3'][0][ids - 1], values[:, 3])
+    for name in names:
+        np.testing.assert_array_equal(array_mesh.cell_data[name][0], dict_mesh.cell_data[name][0])
+    assert array_time < dict_time
@@ -0,0 +1,40 @@
+"""Time to compute the quality of a cross-section mesh."""
+import time
+
+import numpy as np
+import pytest
+
+from sgio.core.mesh import SGMesh
+from sgio.core.quality import QUALITY_METRICS, cell_quality, mesh_quality, quality_summary
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_mesh_quality_quads():
+    """All the metrics of a quad cross-section are computed faster than cell by cell."""
+    n = 40
+    y, z = np.meshgrid(np.arange(n + 1.0), np.arange(n + 1.0))
+    points = np.column_stack([np.zeros(y.size), y.ravel(), z.ravel()])
+    index = np.arange((n + 1) ** 2).reshape(n + 1, n + 1)
+    quads = np.column_stack([
+        index[:-1, :-1].ravel(), index[:-1, 1:].ravel(),
+        index[1:, 1:].ravel(), index[1:, :-1].ravel(),
+    ])
+    mesh = SGMesh(points, [('quad', quads)])
+
+    start = time.perf_counter()
+    quality = mesh_quality(mesh)
+    summary = quality_summary(quality)
+    mesh_time = time.perf_counter() - start
+
+    # Reference: the quality of one cell at a time
+    start = time.perf_counter()
+    loop = [cell_quality(points, _cell[None], 'quad', model_space='yz') for _cell in quads]
+    loop_time = time.perf_counter() - start
+
+    assert summary['min_jacobian']['count'] == n ** 2
+    assert summary['min_jacobian']['min'] == pytest.approx(1.0)
+    assert summary['skewness']['max'] == pytest.approx(0.0, abs=1e-12)
+    for name in QUALITY_METRICS:
+        np.testing.assert_allclose(quality[name][0], [_q[name][0] for _q in loop])
+    assert mesh_time < loop_time
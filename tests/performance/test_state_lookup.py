@@ -0,0 +1,39 @@
+"""Lookup time of the field data of a large State.
+
+``State.data`` used to build a ``{eid: values}`` dict of the whole state
+on every access. It is now a cached view searched by entity ID, so that
+repeated lookups on a 1M-entity state do not depend on its size.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from sgio.model.general import State
+
+
+NENTITY = 1_000_000
+NLOOKUP = 1_000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_state_data_lookup_1m_entities():
+    """1000 ``state.data[eid]`` lookups take less than one dict build."""
+    rng = np.random.default_rng(0)
+    state = State(
+        'e', rng.random((NENTITY, 6)), location='element',
+        entity_ids=rng.permutation(NENTITY) + 1
+    )
+    eids = rng.integers(1, NENTITY + 1, NLOOKUP).tolist()
+
+    start = time.perf_counter()
+    values = [state.data[_eid] for _eid in eids]
+    lookup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    as_dict = state._to_dict()
+    dict_time = time.perf_counter() - start
+
+    assert values == [as_dict[_eid] for _eid in eids]
+    assert lookup_time < dict_time
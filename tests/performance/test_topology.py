@@ -0,0 +1,43 @@
+"""Time to find the boundary of a large cross-section mesh."""
+import time
+
+import numpy as np
+import pytest
+
+from sgio.core.mesh import SGMesh
+
+
+def _boundary_edges_loop(cells):
+    """Boundary edges counted one cell at a time, as sorted node pairs."""
+    counts = {}
+    for cell in cells.tolist():
+        for k in range(len(cell)):
+            edge = tuple(sorted((cell[k], cell[(k + 1) % len(cell)])))
+            counts[edge] = counts.get(edge, 0) + 1
+    return {_edge for _edge, _count in counts.items() if _count == 1}
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_boundary_edges_structured_triangles():
+    """The boundary of a 180k-triangle mesh is found faster than with a loop over the cells."""
+    n = 300
+    x, y = np.meshgrid(np.arange(n + 1.0), np.arange(n + 1.0))
+    points = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+    index = np.arange((n + 1) ** 2).reshape(n + 1, n + 1)
+    a, b = index[:-1, :-1].ravel(), index[:-1, 1:].ravel()
+    c, d = index[1:, 1:].ravel(), index[1:, :-1].ravel()
+    triangles = np.vstack([np.column_stack([a, b, c]), np.column_stack([a, c, d])])
+    mesh = SGMesh(points, [('triangle', triangles)])
+
+    start = time.perf_counter()
+    boundary = mesh.topology.boundary_edges()
+    topology_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = _boundary_edges_loop(triangles)
+    loop_time = time.perf_counter() - start
+
+    assert len(boundary) == 4 * n
+    assert set(map(tuple, np.sort(mesh.topology.edges[boundary], axis=1).tolist())) == expected
+    assert topology_time < loop_time
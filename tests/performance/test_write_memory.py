@@ -0,0 +1,81 @@
+"""Memory ceiling of the chunked VABS/SwiftComp mesh writers.
+
+The writers format nodes and elements ``chunk_rows`` at a time, so the
+memory allocated while writing is bounded by the chunk size and must not
+grow with the mesh.
+"""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from sgio.core.mesh import SGMesh
+from sgio.iofunc.swiftcomp._mesh import write_buffer as sc_write_buffer
+from sgio.iofunc.vabs._mesh import write_buffer as vabs_write_buffer
+
+
+NELEMS = (50_000, 500_000)
+CHUNK_ROWS = 2048
+# Mesh size giving the reference peak, a few chunks
+NELEM_REFERENCE = 10 * CHUNK_ROWS
+
+
+def _synthetic_mesh(cell_type, nnodes_per_cell, nelem):
+    rng = np.random.default_rng(0)
+    nnode = nelem // 2
+    return SGMesh(
+        rng.random((nnode, 3)),
+        [(cell_type, rng.integers(0, nnode, (nelem, nnodes_per_cell)))],
+        point_data={'node_id': np.arange(1, nnode + 1)},
+        cell_data={
+            'element_id': [np.arange(1, nelem + 1)],
+            'property_id': [np.ones(nelem, dtype=int)],
+            'property_ref_csys': [np.zeros(nelem)],
+        },
+    )
+
+
+def _peak_write_memory(write, mesh, path, **kwargs):
+    with open(path, 'w', buffering=1 << 16) as file:
+        tracemalloc.start()
+        try:
+            write(file, mesh, chunk_rows=CHUNK_ROWS, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.swiftcomp
+@pytest.mark.parametrize('nelem', NELEMS)
+def test_swiftcomp_write_memory_ceiling(tmp_path, nelem):
+    """Writing a 3D SwiftComp mesh allocates as much as writing a few chunks."""
+    peaks = []
+    for size in (NELEM_REFERENCE, nelem):
+        mesh = _synthetic_mesh('tetra', 4, size)
+        del mesh.cell_data['property_ref_csys']
+        path = tmp_path / f'big_sc_{size}.sg'
+        peaks.append(_peak_write_memory(sc_write_buffer, mesh, path, sgdim=3, model_space=''))
+
+    assert peaks[1] < 1.5 * peaks[0]
+    with open(path) as file:
+        assert sum(1 for _ in file) == len(mesh.points) + nelem + 2
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.vabs
+@pytest.mark.parametrize('nelem', NELEMS)
+def test_vabs_write_memory_ceiling(tmp_path, nelem):
+    """Writing a VABS mesh allocates as much as writing a few chunks."""
+    peaks = []
+    for size in (NELEM_REFERENCE, nelem):
+        mesh = _synthetic_mesh('triangle', 3, size)
+        path = tmp_path / f'big_vabs_{size}.sg'
+        peaks.append(_peak_write_memory(vabs_write_buffer, mesh, path, sgdim=2, model_space='yz'))
+
+    assert peaks[1] < 1.5 * peaks[0]
+    with open(path) as file:
+        assert sum(1 for _ in file) == len(mesh.points) + 2 * nelem + 3
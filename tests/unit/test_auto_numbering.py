@@ -155,6 +155,23 @@ class TestAutoRenumberVabs:
             # Should not raise — no warnings emitted for compliant mesh
             auto_renumber_for_format(mesh, format="vabs")
 
+    def test_checks_unordered_ids_across_chunks_and_blocks(self, monkeypatch):
+        monkeypatch.setattr("sgio.core.numbering.ID_CHECK_CHUNK_ROWS", 2)
+        points = np.zeros((3, 3))
+        cells = [("triangle", np.array([[0, 1, 2]] * 2)), ("triangle", np.array([[0, 1, 2]]))]
+        mesh = SGMesh(
+            points, cells,
+            point_data={"node_id": np.array([3, 1, 2])},
+            cell_data={"element_id": [np.array([3, 1]), np.array([2])]},
+        )
+        assert auto_renumber_for_format(mesh, format="vabs") == (False, False)
+
+        mesh.point_data["node_id"] = np.array([1, 1, 3])
+        mesh.cell_data["element_id"] = [np.array([1, 2]), np.array([2])]
+        with pytest.warns(UserWarning):
+            assert auto_renumber_for_format(mesh, format="vabs") == (True, True)
+        assert list(mesh.point_data["node_id"]) == [1, 2, 3]
+
 
 # ---------------------------------------------------------------------------
 # auto_renumber_for_format — swiftcomp
@@ -4,10 +4,18 @@ This module tests mesh operations like combining structure genes.
 """
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 import numpy as np
 
+from meshio._mesh import topological_dimension
+
 import sgio
-from sgio.core.mesh import check_cell_ordering, fix_cell_ordering, renumber_elements
+from sgio.core.mesh import (
+    CELL_REVERSE_PERMUTATION, MODEL_SPACE_AXES, check_cell_ordering,
+    check_isolated_nodes, fix_cell_ordering, get_invalid_cell_ordering_element_ids,
+    renumber_elements,
+)
+from sgio.core.topology import CELL_FAMILY_EDGES, cell_family
 
 
 @pytest.mark.unit
@@ -220,6 +228,133 @@ def test_fix_cell_ordering_tetra4_invalid():
     assert check_cell_ordering(mesh) == {}
 
 
+# Corner coordinates of a positively oriented cell of each family
+REFERENCE_CORNERS = {
+    'triangle': [[0, 0], [1, 0], [0, 1]],
+    'quad': [[0, 0], [1, 0], [1, 1], [0, 1]],
+    'tetra': [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    'pyramid': [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 1]],
+    'wedge': [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [0, 1, 1]],
+    'hexahedron': [
+        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+    ],
+}
+
+# Corner nodes of the faces with a center node, in the node order of meshio
+FACE_CENTER_NODES = {
+    'wedge18': [(0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)],
+    'hexahedron27': [
+        (0, 4, 7, 3), (1, 2, 6, 5), (0, 1, 5, 4),
+        (3, 2, 6, 7), (0, 1, 2, 3), (4, 5, 6, 7),
+    ],
+}
+
+
+def _reference_cell(cell_type, model_space='xy'):
+    """Points and connectivity of one positively oriented cell.
+
+    The mid-side nodes are placed at the middle of their edges, followed
+    by the face center and center nodes of the types that have them.
+    """
+    family = cell_family(cell_type)
+    corners = np.array(REFERENCE_CORNERS[family], dtype=float)
+    if corners.shape[1] == 2:
+        planar = np.zeros((len(corners), 3))
+        planar[:, list(MODEL_SPACE_AXES[model_space])] = corners
+        corners = planar
+    nnodes = len(CELL_REVERSE_PERMUTATION[cell_type])
+    points = [corners]
+    if nnodes > len(corners):
+        points.append(corners[np.array(CELL_FAMILY_EDGES[family])].mean(axis=1))
+    if cell_type in FACE_CENTER_NODES:
+        points.append(corners[np.array(FACE_CENTER_NODES[cell_type])].mean(axis=1))
+    points = np.vstack(points)
+    if nnodes > len(points):
+        points = np.vstack([points, corners.mean(axis=0)])
+    return points, np.arange(nnodes)[None, :]
+
+
+def _cell_mesh(points, cell_type, cells):
+    """Mesh of one cell block, also for the types that meshio cannot hold."""
+    if cell_type in topological_dimension:
+        return sgio.SGMesh(points, [(cell_type, cells)])
+    return SimpleNamespace(points=points, cells=[SimpleNamespace(type=cell_type, data=cells)])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('cell_type', sorted(CELL_REVERSE_PERMUTATION))
+def test_fix_cell_ordering_all_types(cell_type):
+    """Inverted cells of every type are detected and restored."""
+    points, cells = _reference_cell(cell_type)
+    # Mirrored about x = 0, the cell keeps its connectivity but is inverted
+    points[:, 0] *= -1.0
+    mesh = _cell_mesh(points, cell_type, cells.copy())
+
+    with pytest.raises(ValueError, match=f"block 0 '{cell_type}': 1 invalid"):
+        check_cell_ordering(mesh)
+
+    fixed = fix_cell_ordering(mesh)
+
+    assert np.array_equal(fixed[(0, cell_type)], np.array([0]))
+    assert check_cell_ordering(mesh) == {}
+
+    # The mid-side and face center nodes still belong to their edges and faces
+    x = points[mesh.cells[0].data[0]]
+    family = cell_family(cell_type)
+    ncorners = len(REFERENCE_CORNERS[family])
+    if len(x) > ncorners:
+        edges = np.array(CELL_FAMILY_EDGES[family])
+        np.testing.assert_allclose(x[ncorners:ncorners + len(edges)], x[edges].mean(axis=1))
+    if cell_type in FACE_CENTER_NODES:
+        faces = np.array(FACE_CENTER_NODES[cell_type])
+        start = ncorners + len(CELL_FAMILY_EDGES[family])
+        np.testing.assert_allclose(x[start:start + len(faces)], x[faces].mean(axis=1))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('model_space', ['xy', 'yz', 'zx'])
+def test_check_cell_ordering_model_space(model_space):
+    """2D cells are checked in the plane of the cross-section."""
+    points, cells = _reference_cell('quad8', model_space)
+    mesh = sgio.SGMesh(points, [('quad8', cells), ('quad8', cells[:, [0, 3, 2, 1, 7, 6, 5, 4]])])
+
+    # Model space inferred from the flat coordinate
+    with pytest.raises(ValueError, match="block 1 'quad8': 1 invalid"):
+        check_cell_ordering(mesh)
+
+    other = {'xy': 'yz', 'yz': 'zx', 'zx': 'xy'}[model_space]
+    with pytest.raises(ValueError, match="block 0 'quad8': 1 invalid"):
+        check_cell_ordering(mesh, model_space=other)
+
+    invalid = get_invalid_cell_ordering_element_ids(mesh, model_space=model_space)
+    assert list(invalid) == [(1, 'quad8')]
+    assert np.array_equal(invalid[(1, 'quad8')], np.array([2]))
+
+
+@pytest.mark.unit
+def test_check_cell_ordering_degenerate_cells():
+    """Zero-length lines and flat tetras are invalid but are not fixed."""
+    points = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [1.0, 1.0, 0.0],
+        ]
+    )
+    cells = [
+        ('line', np.array([[0, 1], [2, 2]])),
+        ('tetra', np.array([[0, 1, 2, 3]])),
+    ]
+    mesh = sgio.SGMesh(points, cells)
+
+    with pytest.raises(ValueError, match="block 0 'line': 1 invalid, block 1 'tetra': 1 invalid"):
+        check_cell_ordering(mesh)
+
+    assert fix_cell_ordering(mesh) == {}
+
+
 # ============================================================================
 # Test renumber_elements error handling
 # ============================================================================
@@ -324,3 +459,50 @@ def test_renumber_elements_integration_with_ensure():
     
     assert mesh.cell_data['element_id'][0].tolist() == [1, 2]
 
+
+@pytest.mark.unit
+def test_check_isolated_nodes():
+    """Cells of each node are listed in block and cell order."""
+    points = np.zeros((5, 3))
+    cells = [('triangle', np.array([[0, 1, 2], [2, 3, 4]])), ('line', np.array([[4, 0]]))]
+    mesh = sgio.SGMesh(points, cells)
+
+    node_cell_ids, nodes_in_cells = check_isolated_nodes(mesh)
+
+    assert node_cell_ids == [
+        [(0, 0), (1, 0)], [(0, 0)], [(0, 0), (0, 1)], [(0, 1)], [(0, 1), (1, 0)],
+    ]
+    assert nodes_in_cells == [0, 1, 2, 3, 4]
+
+    with pytest.raises(ValueError, match=r"Isolated nodes found: \[5\]"):
+        check_isolated_nodes(sgio.SGMesh(np.zeros((6, 3)), cells))
+
+
+@pytest.mark.unit
+def test_check_isolated_nodes_without_cells():
+    """A mesh without cells has no nodes in cells."""
+    node_cell_ids, nodes_in_cells = check_isolated_nodes(sgio.SGMesh(np.zeros((0, 3)), []))
+    assert node_cell_ids == []
+    assert nodes_in_cells == []
+
+    with pytest.raises(ValueError, match=r"Isolated nodes found: \[0, 1, 2\]"):
+        check_isolated_nodes(sgio.SGMesh(np.zeros((3, 3)), []))
+
+
+@pytest.mark.unit
+def test_node_cell_adjacency_cache():
+    """The CSR adjacency is cached until the connectivity is replaced."""
+    mesh = sgio.SGMesh(np.zeros((4, 3)), [('triangle', np.array([[0, 1, 2], [1, 3, 2]]))])
+
+    adjacency, _ = check_isolated_nodes(mesh, return_adjacency=True)
+
+    assert adjacency is mesh.get_node_cell_adjacency()
+    np.testing.assert_array_equal(adjacency.indptr, [0, 1, 3, 5, 6])
+    np.testing.assert_array_equal(adjacency.counts(), [1, 2, 2, 1])
+    block_id, indices = adjacency.cells(2)
+    np.testing.assert_array_equal(block_id, [0, 0])
+    np.testing.assert_array_equal(indices, [0, 1])
+
+    mesh.cells[0].data = np.array([[0, 1, 3]])
+    with pytest.raises(ValueError, match="Isolated"):
+        check_isolated_nodes(mesh)
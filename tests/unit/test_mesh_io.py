@@ -0,0 +1,751 @@
+"""Test the block readers and writers used for VABS/SwiftComp mesh data.
+
+The bulk (array-based) readers are checked against the original
+line-by-line readers on the VABS and SwiftComp fixtures.
+"""
+import pytest
+import numpy as np
+from io import StringIO
+
+from meshio import CellBlock
+
+import sgio
+from sgio.iofunc._mmap import MappedTextFile, open_mapped
+from sgio.core.mesh import SGMesh
+from sgio.model.general import State
+from sgio.iofunc._meshio import (
+    add_cell_array_data_to_mesh,
+    add_cell_dict_data_to_mesh,
+    add_point_array_data_to_mesh,
+    add_point_dict_data_to_mesh,
+    add_state_data_to_mesh,
+    _read_block_array,
+    _read_id_value_block,
+    _read_nodes,
+    _read_nodes_bulk,
+    _write_nodes,
+    _write_int_rows,
+    _format_int_rows,
+    _id_to_index,
+    _scatter_to_cell_blocks,
+    _meshio_to_sg_order,
+)
+from sgio.iofunc.vabs._mesh import (
+    _write_elements as vabs_write_elements,
+    _write_property_id_ref_csys as vabs_write_property_id_ref_csys,
+    _read_elements as vabs_read_elements,
+    _read_elements_bulk as vabs_read_elements_bulk,
+    _read_property_id_ref_csys as vabs_read_property_id_ref_csys,
+)
+from sgio.iofunc.swiftcomp._mesh import (
+    _write_elements as sc_write_elements,
+    _write_property_ref_csys as sc_write_property_ref_csys,
+    _read_elements as sc_read_elements,
+    _read_elements_bulk as sc_read_elements_bulk,
+    _read_property_ref_csys as sc_read_property_ref_csys,
+)
+from sgio.iofunc.vabs._input import _readHeader as vabs_read_header
+from sgio.iofunc.swiftcomp._input import _readHeader as sc_read_header
+from sgio.iofunc.common.material_readers import (
+    read_elastic_property,
+    read_material_rotation_combinations,
+)
+from sgio.utils.io import fortran_float, fortran_floats, translate_fortran_exponents
+
+
+VABS_FIXTURES = [
+    'vabs/uh60_blade_1_cs1.sg',
+    'vabs/version_4_0/sg21t_tri3_vabs40.sg',
+    'vabs/version_4_1/3cells.sg',
+    'vabs/version_4_1/cas1.sg',
+]
+
+SC_FIXTURES = [
+    # (file name, format version, smdim)
+    ('swiftcomp/sg12kl_line5_sc21.sg', '2.1', 2),
+    ('swiftcomp/sg21eb_tri6_sc21.sg', '2.1', 1),
+    ('swiftcomp/sg23_tri6_sc21.sg', '2.1', 3),
+    ('swiftcomp/sg31t_hex20_sc21.sg', '2.1', 1),
+]
+
+
+def _open_at_mesh(path, file_format, version='', smdim=3):
+    """Open an SG input file and skip the header; return (file, configs)."""
+    f = open(path, 'r')
+    if file_format == 'vabs':
+        configs = vabs_read_header(f)
+    else:
+        configs = sc_read_header(f, version, smdim)
+    return f, configs
+
+
+def _sc_params():
+    return [pytest.param(fn, 'swiftcomp', v, d, id=fn) for fn, v, d in SC_FIXTURES]
+
+
+def _vabs_params():
+    return [pytest.param(fn, 'vabs', '', 3, id=fn) for fn in VABS_FIXTURES]
+
+
+# ---------------------------------------------------------------------------
+# Nodes
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.io
+@pytest.mark.parametrize('fn, file_format, version, smdim', _vabs_params() + _sc_params())
+def test_read_nodes_bulk_matches_line_reader(test_data_dir, fn, file_format, version, smdim):
+    """Bulk node reader returns the same coordinates and IDs as the line reader."""
+    path = test_data_dir / fn
+
+    f1, configs = _open_at_mesh(path, file_format, version, smdim)
+    with f1:
+        points_ref, point_ids_ref, _ = _read_nodes(f1, configs['num_nodes'], configs['sgdim'])
+        next_ref = f1.readline()
+
+    f2, configs = _open_at_mesh(path, file_format, version, smdim)
+    with f2:
+        points, node_id = _read_nodes_bulk(f2, configs['num_nodes'], configs['sgdim'])
+        next_bulk = f2.readline()
+
+    np.testing.assert_array_equal(points, points_ref)
+    assert node_id.tolist() == list(point_ids_ref.keys())
+    # Both readers must leave the file at the same position
+    assert next_bulk == next_ref
+
+
+@pytest.mark.unit
+def test_read_nodes_bulk_comments_and_blank_lines():
+    """Comment-only and blank lines are skipped and trailing comments ignored."""
+    f = StringIO(
+        "\n"
+        "! node block\n"
+        "   1  0.0  1.0  ! nodal coordinates\n"
+        "\n"
+        "   5  2.0  3.0\n"
+        "   3  4.0  5.0\n"
+        "   1   2   3\n"
+    )
+    points, node_id = _read_nodes_bulk(f, 3, sgdim=2)
+
+    assert node_id.tolist() == [1, 5, 3]
+    np.testing.assert_array_equal(
+        points, [[0.0, 0.0, 1.0], [0.0, 2.0, 3.0], [0.0, 4.0, 5.0]])
+    assert f.readline() == "   1   2   3\n"
+
+
+@pytest.mark.unit
+def test_read_nodes_bulk_falls_back_on_ragged_block():
+    """Ragged node blocks are handed to the line-by-line reader."""
+    f = StringIO(
+        "1  0.0  1.0\n"
+        "2  2.0\n"
+    )
+    with pytest.raises(ValueError):
+        _read_nodes_bulk(f, 2, sgdim=2)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('max_id', [10, 10**9])  # dense table / sorted search
+def test_id_to_index(max_id):
+    """Node IDs are mapped to point indices for dense and sparse numbering."""
+    node_id = np.array([3, 1, 2, max_id])
+    ids = np.array([[max_id, 3], [1, 2]])
+    np.testing.assert_array_equal(_id_to_index(ids, node_id), [[3, 0], [1, 2]])
+
+    with pytest.raises(KeyError):
+        _id_to_index([1, 7], node_id)
+
+
+# ---------------------------------------------------------------------------
+# Elements
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.io
+@pytest.mark.vabs
+@pytest.mark.parametrize('fn', VABS_FIXTURES)
+def test_vabs_read_elements_bulk_matches_line_reader(test_data_dir, fn):
+    """Bulk VABS element reader returns the same cell blocks as the line reader."""
+    path = test_data_dir / fn
+
+    f1, configs = _open_at_mesh(path, 'vabs')
+    with f1:
+        _, node_id = _read_nodes_bulk(f1, configs['num_nodes'], configs['sgdim'])
+        point_ids = dict(zip(node_id.tolist(), range(len(node_id))))
+        cells_ref, eids_ref, _ = vabs_read_elements(f1, configs['num_elements'], point_ids)
+        next_ref = f1.readline()
+
+    f2, configs = _open_at_mesh(path, 'vabs')
+    with f2:
+        _, node_id = _read_nodes_bulk(f2, configs['num_nodes'], configs['sgdim'])
+        cells, eids = vabs_read_elements_bulk(f2, configs['num_elements'], node_id)
+        next_bulk = f2.readline()
+
+    assert [c[0] for c in cells] == [c[0] for c in cells_ref]
+    for (_, data), (_, data_ref) in zip(cells, cells_ref):
+        np.testing.assert_array_equal(data, data_ref)
+    for block, block_ref in zip(eids, eids_ref):
+        np.testing.assert_array_equal(block, block_ref)
+    assert next_bulk == next_ref
+
+
+@pytest.mark.unit
+@pytest.mark.vabs
+def test_vabs_read_elements_bulk_mixed_types():
+    """Mixed triangle/quad blocks are grouped by first appearance."""
+    f = StringIO(
+        "  1  1  2  3  0  0  0  0  0  0  ! element connectivity\n"
+        "  2  2  4  5  3  0  0  0  0  0\n"
+        "  3  3  5  6  0  0  0  0  0  0\n"
+    )
+    node_id = np.array([1, 2, 3, 4, 5, 6])
+    cells, eids = vabs_read_elements_bulk(f, 3, node_id)
+
+    assert [c[0] for c in cells] == ['triangle', 'quad']
+    np.testing.assert_array_equal(cells[0][1], [[0, 1, 2], [2, 4, 5]])
+    np.testing.assert_array_equal(cells[1][1], [[1, 3, 4, 2]])
+    assert [e.tolist() for e in eids] == [[1, 3], [2]]
+
+
+@pytest.mark.unit
+@pytest.mark.io
+@pytest.mark.swiftcomp
+@pytest.mark.parametrize('fn, file_format, version, smdim', _sc_params())
+def test_sc_read_elements_bulk_matches_line_reader(test_data_dir, fn, file_format, version, smdim):
+    """Bulk SwiftComp element reader returns the same cell blocks as the line reader."""
+    path = test_data_dir / fn
+
+    f1, configs = _open_at_mesh(path, file_format, version, smdim)
+    with f1:
+        _, node_id = _read_nodes_bulk(f1, configs['num_nodes'], configs['sgdim'])
+        point_ids = dict(zip(node_id.tolist(), range(len(node_id))))
+        cells_ref, eids_ref, pids_ref, _, _ = sc_read_elements(
+            f1, configs['num_elements'], point_ids)
+        next_ref = f1.readline()
+
+    f2, configs = _open_at_mesh(path, file_format, version, smdim)
+    with f2:
+        _, node_id = _read_nodes_bulk(f2, configs['num_nodes'], configs['sgdim'])
+        cells, eids, pids = sc_read_elements_bulk(f2, configs['num_elements'], node_id)
+        next_bulk = f2.readline()
+
+    assert [c[0] for c in cells] == [c[0] for c in cells_ref]
+    for k, (cell_type, data) in enumerate(cells):
+        np.testing.assert_array_equal(data, cells_ref[k][1])
+        np.testing.assert_array_equal(eids[k], eids_ref[k])
+        np.testing.assert_array_equal(pids[k], pids_ref[cell_type])
+    assert next_bulk == next_ref
+
+
+@pytest.mark.unit
+@pytest.mark.swiftcomp
+def test_sc_read_elements_bulk_3d_zero_insertion():
+    """Element types are recovered from the zero slots written for 3D cells."""
+    blocks = {
+        'tetra': np.arange(4).reshape(1, 4),
+        'tetra10': np.arange(10).reshape(1, 10),
+        'wedge': np.arange(6).reshape(1, 6),
+        'wedge15': np.arange(15).reshape(1, 15),
+        'hexahedron': np.arange(8).reshape(1, 8),
+        'hexahedron20': np.arange(20).reshape(1, 20),
+    }
+    lines = []
+    for eid, (cell_type, idx) in enumerate(blocks.items(), start=1):
+        row = _meshio_to_sg_order(cell_type, idx)[0]
+        lines.append(' '.join(map(str, [eid, eid * 10] + row.tolist())))
+    f = StringIO('\n'.join(lines) + '\n')
+
+    cells, eids, pids = sc_read_elements_bulk(f, len(blocks), np.arange(1, 21))
+
+    assert [c[0] for c in cells] == list(blocks.keys())
+    for (_, data), idx in zip(cells, blocks.values()):
+        np.testing.assert_array_equal(data, idx)
+    assert [p.tolist() for p in pids] == [[10], [20], [30], [40], [50], [60]]
+
+
+@pytest.mark.unit
+@pytest.mark.swiftcomp
+def test_sc_read_elements_wedge15():
+    """A 15-node wedge block is read as 'wedge15' by both readers."""
+    lines = [
+        ' '.join(map(str, [eid, 1] + list(range(1, 7)) + [0, 0] + list(range(7, 16)) + [0, 0, 0]))
+        for eid in (1, 2)
+    ]
+    text = '\n'.join(lines) + '\n'
+    point_ids = {i: i - 1 for i in range(1, 16)}
+
+    cells, eids = sc_read_elements(StringIO(text), 2, point_ids)[:2]
+    assert [c[0] for c in cells] == ['wedge15']
+    assert cells[0][1] == [list(range(15))] * 2
+    assert eids == [[1, 2]]
+
+    cells = sc_read_elements_bulk(StringIO(text), 2, np.arange(1, 16))[0]
+    assert [c[0] for c in cells] == ['wedge15']
+    assert cells[0][1].shape == (2, 15)
+
+
+
+# ---------------------------------------------------------------------------
+# Element property / orientation blocks
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_scatter_to_cell_blocks():
+    """Values in file order are scattered to cell blocks by element ID."""
+    elem_ids = [np.array([4, 2]), np.array([7, 1, 3])]
+    blocks = _scatter_to_cell_blocks([1, 2, 3, 4], [10, 20, 30, 40], elem_ids)
+
+    assert [b.tolist() for b in blocks] == [[40, 20], [0, 10, 30]]
+
+    with pytest.raises(KeyError):
+        _scatter_to_cell_blocks([5], [50], elem_ids)
+
+
+@pytest.mark.unit
+@pytest.mark.vabs
+def test_vabs_read_property_id_ref_csys():
+    """Property IDs and theta_1 are scattered to their cell blocks."""
+    f = StringIO(
+        "\n"
+        "  3  2  4.5d1\n"
+        "  1  1  0.0\n"
+        "  2  1  -3.0D0\n"
+        "\n"
+    )
+    elem_ids = [np.array([1, 3]), np.array([2])]
+    cell_prop_id, cell_csys = vabs_read_property_id_ref_csys(f, 3, elem_ids, 1)
+
+    assert [b.tolist() for b in cell_prop_id] == [[1, 2], [1]]
+    assert [b.tolist() for b in cell_csys] == [[0.0, 45.0], [-3.0]]
+
+
+@pytest.mark.unit
+@pytest.mark.swiftcomp
+def test_sc_read_property_ref_csys():
+    """Local frames are scattered to their cell blocks by element ID."""
+    f = StringIO(
+        "  2  1 0 0  0 1 0  0 0 1\n"
+        "  1  0 1 0  1 0 0  0 0 1\n"
+    )
+    elem_ids = [np.array([1]), np.array([2])]
+    cell_csys = sc_read_property_ref_csys(f, 2, elem_ids)
+
+    np.testing.assert_array_equal(cell_csys[0], [[0, 1, 0, 1, 0, 0, 0, 0, 1]])
+    np.testing.assert_array_equal(cell_csys[1], [[1, 0, 0, 0, 1, 0, 0, 0, 1]])
+
+    with pytest.raises(ValueError, match='not found'):
+        sc_read_property_ref_csys(StringIO("9 1 0 0 0 1 0 0 0 1\n"), 1, elem_ids)
+
+
+def _assert_same_sg(sg1, sg2):
+    m1, m2 = sg1.mesh, sg2.mesh
+    np.testing.assert_array_equal(m1.points, m2.points)
+    assert [c.type for c in m1.cells] == [c.type for c in m2.cells]
+    for c1, c2 in zip(m1.cells, m2.cells):
+        np.testing.assert_array_equal(c1.data, c2.data)
+    assert m1.cell_data.keys() == m2.cell_data.keys()
+    for name in m1.cell_data:
+        for b1, b2 in zip(m1.cell_data[name], m2.cell_data[name]):
+            np.testing.assert_array_equal(b1, b2)
+    assert sg1.mocombos == sg2.mocombos
+    assert sorted(sg1.materials) == sorted(sg2.materials)
+
+
+@pytest.mark.unit
+@pytest.mark.io
+@pytest.mark.parametrize('fn, file_format, version, smdim', _vabs_params() + _sc_params())
+def test_read_mmap_matches_text_reader(test_data_dir, fn, file_format, version, smdim):
+    """``sgio.read(..., mmap=True)`` gives the same SG as the text reader."""
+    path = test_data_dir / fn
+    model_type = {1: 'BM1', 2: 'PL1', 3: 'SD1'}[smdim]
+    kwargs = dict(file_format=file_format, format_version=version, model_type=model_type)
+
+    sg_text = sgio.read(str(path), **kwargs)
+    sg_mmap = sgio.read(str(path), mmap=True, **kwargs)
+
+    _assert_same_sg(sg_mmap, sg_text)
+
+
+@pytest.mark.unit
+def test_mapped_text_file_lines(tmp_path):
+    """Line protocol and block reads of a memory-mapped file."""
+    path = tmp_path / 'block.txt'
+    path.write_bytes(
+        b"header line\n"
+        b"\n"
+        b"  ! comment\n"
+        b"   1  0.0  1.0\n"
+        b"\t\n"
+        b"   2  1.0  1.0  ! trailing\n"
+        b"   ! comment\n"
+        b"   3  2.0  1.0\n"
+        b"tail"
+    )
+
+    with MappedTextFile(path) as f:
+        assert f.readline() == 'header line\n'
+        data, lines = _read_block_array(f, 3, comment='!')
+        np.testing.assert_array_equal(data, [[1, 0, 1], [2, 1, 1], [3, 2, 1]])
+        assert len(lines) == 3
+        assert lines[1] == '   2  1.0  1.0  ! trailing\n'
+        assert f.readline() == 'tail'
+        assert f.readline() == ''
+    assert f.closed
+
+
+@pytest.mark.unit
+def test_mapped_text_file_block_fallback(tmp_path):
+    """Irregular or short blocks return None and the raw lines."""
+    path = tmp_path / 'block.txt'
+    path.write_text("1 2 3\n4 5\n")
+
+    with MappedTextFile(path) as f:
+        data, lines = _read_block_array(f, 2, comment='!')
+        assert data is None
+        assert list(lines) == ['1 2 3\n', '4 5\n']
+
+    with MappedTextFile(path) as f:
+        data, lines = _read_block_array(f, 5, comment='!')
+        assert data is None
+        assert len(lines) == 2
+
+
+@pytest.mark.unit
+def test_fortran_floats():
+    """Blocks with Fortran exponents convert to one float array."""
+    text = "1.0d0  2.5D-1 ! comment\n\n  -3.0E+2 4\n"
+    expected = [1.0, 0.25, -300.0, 4.0]
+
+    np.testing.assert_array_equal(fortran_floats(text, comment='!'), expected)
+    np.testing.assert_array_equal(fortran_floats(text.splitlines(), comment='!'), expected)
+    np.testing.assert_array_equal(fortran_floats(text.encode(), comment='!'), expected)
+    assert fortran_floats('').shape == (0,)
+    assert fortran_float('-1.5d-3') == -1.5e-3
+    assert translate_fortran_exponents(b'1d0 2D1') == b'1e0 2E1'
+
+    with pytest.raises(ValueError):
+        fortran_floats('1.0 abc')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('mapped', [False, True])
+def test_read_block_array_fortran_exponents(tmp_path, mapped):
+    """Float blocks with 'd' exponents are parsed in bulk."""
+    path = tmp_path / 'block.txt'
+    path.write_text("1  1  1.5d1\n! comment\n2  1 -2.0D-1 ! trailing\n")
+
+    f = MappedTextFile(path) if mapped else open(path)
+    with f:
+        data, _ = _read_block_array(f, 2, comment='!', dtype=float)
+    np.testing.assert_array_equal(data, [[1, 1, 15.0], [2, 1, -0.2]])
+
+    # Integer blocks are not translated
+    with open(path) as f:
+        data, lines = _read_block_array(f, 2, comment='!', dtype=int)
+    assert data is None
+    assert len(lines) == 2
+
+
+@pytest.mark.unit
+def test_read_material_blocks_fortran_exponents():
+    """Material combinations and constants accept Fortran exponents."""
+    f = StringIO(
+        "1 1 0.0\n"
+        "! comment\n"
+        "2 3 4.5d1 ! trailing\n"
+        "1.0d9 2.0D9 3.0d9\n"
+        "\n"
+        "0.3 0.3 0.3 ! nu\n"
+        "1d8 1d8 1d8\n"
+    )
+
+    combinations = read_material_rotation_combinations(f, 2)
+    assert combinations == {1: [1, 0.0], 2: [3, 45.0]}
+    assert all(isinstance(_v, int) for _v in (*combinations, combinations[2][0]))
+
+    constants = read_elastic_property(f, 1)
+    assert constants == [1e9, 2e9, 3e9, 0.3, 0.3, 0.3, 1e8, 1e8, 1e8]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('chunk_rows', [2, 1000])
+def test_read_id_value_block(chunk_rows):
+    """ID/value blocks are read whole, until EOF, or for a subset of IDs."""
+    text = (
+        "! header comment\n"
+        "3  0.0 0.0  1.0d0 2.0 3.0\n"
+        "1  0.0 0.0  4.0 5.0 6.0 ! trailing\n"
+        "\n"
+        "7  0.0 0.0  7.0 8.0 9.0\n"
+        "5  0.0 0.0  1.5 2.5 3.5\n"
+    )
+
+    ids, values = _read_id_value_block(StringIO(text), 4, [3, 4, 5])
+    np.testing.assert_array_equal(ids, [3, 1, 7, 5])
+    np.testing.assert_array_equal(values[:2], [[1, 2, 3], [4, 5, 6]])
+
+    ids, values = _read_id_value_block(StringIO(text), None, [5])
+    np.testing.assert_array_equal(ids, [3, 1, 7, 5])
+    np.testing.assert_array_equal(values[:, 0], [3, 6, 9, 3.5])
+
+    ids, values = _read_id_value_block(
+        StringIO(text), 4, [3, 4, 5], ids=np.array([5, 1, 99]), chunk_rows=chunk_rows)
+    np.testing.assert_array_equal(ids, [1, 5])
+    np.testing.assert_array_equal(values, [[4, 5, 6], [1.5, 2.5, 3.5]])
+
+    ids, values = _read_id_value_block(StringIO(text), 4, [3, 4, 5], ids=[99])
+    assert ids.shape == (0,)
+    assert values.shape == (0, 3)
+
+
+@pytest.mark.unit
+def test_read_id_value_block_errors():
+    """Short blocks and incomplete lines raise."""
+    with pytest.raises(ValueError):
+        _read_id_value_block(StringIO("1 2.0 3.0 4.0\n"), 2, [1, 2, 3])
+    with pytest.raises(ValueError):
+        _read_id_value_block(StringIO("1 2.0 3.0 4.0\n"), 2, [1, 2, 3], ids=[1])
+    with pytest.raises(ValueError):
+        _read_id_value_block(StringIO("1 2.0 3.0 4.0\n2 1.0\n"), 2, [1, 2, 3])
+
+
+@pytest.mark.unit
+def test_open_mapped_unmappable(tmp_path):
+    """Empty and missing files cannot be mapped."""
+    empty = tmp_path / 'empty.sg'
+    empty.write_text('')
+    assert open_mapped(empty) is None
+    assert open_mapped(tmp_path / 'missing.sg') is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('sgdim, model_space, columns', [
+    (1, 'y', [1]),
+    (2, 'xy', [0, 1]),
+    (2, 'yz', [1, 2]),
+    (2, 'zx', [2, 0]),
+    (3, '', [0, 1, 2]),
+])
+def test_write_nodes_matches_per_node_format(sgdim, model_space, columns):
+    """The block writer is byte-identical to formatting one node at a time."""
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(7, 3)) * 10.0 ** rng.integers(-5, 5, size=(7, 3))
+    node_id = [3, 5, 8, 13, 21, 34, 55]
+
+    f = StringIO()
+    _write_nodes(f, points, sgdim, node_id=node_id, model_space=model_space,
+                 int_fmt='8d', float_fmt='20.9e')
+
+    expected = ''
+    for i, (nid, coords) in enumerate(zip(node_id, points)):
+        expected += '{:8d}'.format(nid)
+        expected += ''.join('{:20.9e}'.format(coords[j]) for j in columns)
+        if i == 0:
+            expected += '  ! nodal coordinates'
+        expected += '\n'
+    expected += '\n'
+
+    assert f.getvalue() == expected
+
+
+@pytest.mark.unit
+def test_write_nodes_default_ids_and_errors():
+    """Nodes are numbered from 1 without IDs; bad model spaces raise."""
+    f = StringIO()
+    _write_nodes(f, np.zeros((2, 3)), 2, model_space='yz', int_fmt='4d', float_fmt='6.1f')
+    assert f.getvalue() == '   1   0.0   0.0  ! nodal coordinates\n   2   0.0   0.0\n\n'
+
+    with pytest.raises(ValueError, match='Invalid model space'):
+        _write_nodes(StringIO(), np.zeros((2, 3)), 2, model_space='x')
+
+    f = StringIO()
+    _write_nodes(f, np.zeros((0, 3)), 2, model_space='')
+    assert f.getvalue() == '\n'
+
+
+@pytest.mark.unit
+def test_format_int_rows_matches_str_format():
+    """Array formatting of integers equals ``str.format`` with a width."""
+    data = np.array([
+        [0, 1, -1, 9, 10, -10],
+        [99999999, -9999999, 123, 4567, -89, 100],
+    ])
+    expected = ''.join(('{:8d}' * 6 + '\n').format(*row) for row in data.tolist())
+    assert _format_int_rows(data, 8) == expected
+
+    # Values wider than the field are left to str.format
+    assert _format_int_rows(np.array([[123456789]]), 8) is None
+    assert _format_int_rows(np.array([[-99999999]]), 8) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('int_fmt', ['8d', '4d', '<6d'])
+def test_write_int_rows(int_fmt):
+    """Rows are written chunk by chunk with the comment on the first line."""
+    data = np.arange(-20, 40).reshape(20, 3) * 1000
+    f = StringIO()
+    _write_int_rows(f, data, int_fmt, comment='  ! block', chunk_rows=7)
+
+    sfi = '{:' + int_fmt + '}'
+    lines = [(sfi * 3).format(*row) for row in data.tolist()]
+    lines[0] += '  ! block'
+    assert f.getvalue() == '\n'.join(lines) + '\n'
+
+
+def _mixed_cells():
+    return [
+        CellBlock('triangle6', np.array([[0, 1, 2, 3, 4, 5], [2, 1, 6, 7, 8, 9]])),
+        CellBlock('quad', np.array([[0, 1, 6, 2]])),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.vabs
+def test_vabs_write_elements():
+    """VABS element rows are [eid, n1..n9] with generated element IDs."""
+    node_id = np.arange(101, 111)
+    elem_id = []
+    f = StringIO()
+    vabs_write_elements(f, _mixed_cells(), elem_id, node_id, int_fmt='5d')
+
+    assert [list(_b) for _b in elem_id] == [[1, 2], [3]]
+    assert f.getvalue().split('\n') == [
+        '    1  101  102  103    0  104  105  106    0    0  ! element connectivity',
+        '    2  103  102  107    0  108  109  110    0    0',
+        '    3  101  102  107  103    0    0    0    0    0',
+        '',
+        '',
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.swiftcomp
+def test_sc_write_elements():
+    """SwiftComp element rows are [eid, pid, n1..n9] with given element IDs."""
+    f = StringIO()
+    cell_eids = sc_write_elements(
+        f, _mixed_cells(), [[2, 1], [3]], [[7, 5], [4]], [], int_fmt='4d')
+
+    assert [_b.tolist() for _b in cell_eids] == [[7, 5], [4]]
+    assert f.getvalue().split('\n') == [
+        '   7   2   1   2   3   0   4   5   6   0   0  # element connectivity',
+        '   5   1   3   2   7   0   8   9  10   0   0',
+        '   4   3   1   2   7   3   0   0   0   0   0',
+        '',
+        '',
+    ]
+
+    with pytest.raises(ValueError, match='property IDs'):
+        sc_write_elements(StringIO(), _mixed_cells(), [[1], [1]], [[1, 2], [3]], [])
+
+
+@pytest.mark.unit
+@pytest.mark.vabs
+@pytest.mark.parametrize('model_space, c0, c1', [('xy', 0, 1), ('yz', 1, 2), ('zx', 2, 0)])
+def test_vabs_write_property_id_ref_csys(model_space, c0, c1):
+    """theta_1 is the angle of the reference y-axis in the model space."""
+    csys = np.zeros((2, 9))
+    csys[0, [c0, c1]] = [1.0, 1.0]
+    csys[1, [c0, c1]] = [0.0, -2.0]
+    cell_csys = [csys, np.array([12.5])]
+
+    f = StringIO()
+    vabs_write_property_id_ref_csys(
+        f, [[1, 2], [3]], cell_csys, [[10, 11], [12]],
+        model_space=model_space, int_fmt='4d', float_fmt='8.2f')
+
+    assert f.getvalue() == (
+        '  10   1   45.00\n'
+        '  11   2  -90.00\n'
+        '  12   3   12.50\n'
+        '\n'
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.vabs
+def test_vabs_write_property_id_ref_csys_without_csys():
+    """Missing reference csys gives theta_1 = 0; a bad model space raises."""
+    f = StringIO()
+    vabs_write_property_id_ref_csys(
+        f, [[1, 2]], None, [[1, 2]], int_fmt='2d', float_fmt='5.1f')
+    assert f.getvalue() == ' 1 1  0.0\n 2 2  0.0\n\n'
+
+    with pytest.raises(ValueError, match='Invalid model space'):
+        vabs_write_property_id_ref_csys(
+            StringIO(), [[1]], [np.ones((1, 9))], [[1]], model_space='')
+
+
+@pytest.mark.unit
+@pytest.mark.swiftcomp
+def test_sc_write_property_ref_csys():
+    """Local frames are written as [eid, a, b, c] rows per cell block."""
+    cell_csys = [
+        np.array([[1, 0, 0, 0, 1, 0, 0, 0, 1]]),
+        np.array([[0, 1, 0, -1, 0, 0]]),  # c axis omitted
+    ]
+    f = StringIO()
+    sc_write_property_ref_csys(f, cell_csys, [np.array([5]), [6]], int_fmt='2d', float_fmt='3.0f')
+
+    assert f.getvalue() == (
+        ' 5  1  0  0  0  1  0  0  0  1\n'
+        ' 6  0  1  0 -1  0  0  0  0  0\n'
+        '\n'
+    )
+
+    with pytest.raises(ValueError, match='Invalid coordinate system'):
+        sc_write_property_ref_csys(StringIO(), [np.ones((1, 3))], [[1]])
+
+
+def _two_block_mesh():
+    return SGMesh(
+        np.zeros((4, 3)),
+        [('line', np.array([[0, 1], [1, 2]])), ('triangle', np.array([[0, 1, 3]]))],
+        point_data={'node_id': np.arange(1, 5)},
+        cell_data={'element_id': [np.array([3, 1]), np.array([2])]},
+    )
+
+
+@pytest.mark.unit
+def test_add_array_data_matches_dict_data():
+    """Array inputs give the same mesh data as the equivalent dicts."""
+    ids = np.array([2, 3, 1])
+    values = np.array([[2.0, 20.0], [3.0, 30.0], [1.0, 10.0]])
+    as_dict = {int(_i): _v.tolist() for _i, _v in zip(ids, values)}
+
+    mesh_dict, mesh_array = _two_block_mesh(), _two_block_mesh()
+    add_cell_dict_data_to_mesh(['a', 'b'], as_dict, mesh_dict)
+    add_cell_array_data_to_mesh(['a', 'b'], ids, values, mesh_array)
+    for name in ('a', 'b'):
+        for _b1, _b2 in zip(mesh_dict.cell_data[name], mesh_array.cell_data[name]):
+            np.testing.assert_array_equal(_b1, _b2)
+    np.testing.assert_array_equal(mesh_array.cell_data['a'][0], [3.0, 1.0])
+
+    point_ids = np.array([4, 1, 3, 2])
+    point_values = np.arange(8.0).reshape(4, 2)
+    add_point_dict_data_to_mesh('u', {int(_i): _v.tolist() for _i, _v in zip(point_ids, point_values)}, mesh_dict)
+    add_point_array_data_to_mesh('u', point_ids, point_values, mesh_array)
+    np.testing.assert_array_equal(mesh_dict.point_data['u'], mesh_array.point_data['u'])
+
+    with pytest.raises(KeyError):
+        add_point_array_data_to_mesh('u', point_ids[:3], point_values[:3], mesh_array)
+
+
+@pytest.mark.unit
+def test_add_state_data_to_mesh():
+    """States are added to point, cell or cell point data by location."""
+    mesh = _two_block_mesh()
+
+    add_state_data_to_mesh(
+        State.from_arrays([1, 2, 3, 4], np.ones((4, 3)), name='u', location='node'), mesh)
+    add_state_data_to_mesh(
+        State.from_arrays([1, 2, 3], np.arange(3.0), name='sr', location='element'), mesh)
+    en_values = np.arange(18.0).reshape(3, 3, 2)
+    add_state_data_to_mesh(
+        State.from_arrays([1, 2, 3], en_values, name='e', location='element_node'),
+        mesh, name=['e11', 'e22'])
+
+    assert mesh.point_data['u'].shape == (4, 3)
+    np.testing.assert_array_equal(mesh.cell_data['sr'][0], [2.0, 0.0])
+    np.testing.assert_array_equal(mesh.cell_point_data['e22'][1], en_values[[1], :, 1])
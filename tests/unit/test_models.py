@@ -8,10 +8,12 @@ This module tests the Pydantic-based model classes for:
 
 import pytest
 import math
+import numpy as np
 from pydantic import ValidationError
 
-from sgio.model.beam import EulerBernoulliBeamModel
+from sgio.model.beam import EulerBernoulliBeamModel, TimoshenkoBeamModel
 from sgio.model.solid import CauchyContinuumModel
+from sgio.model.table import ModelTable
 
 
 @pytest.mark.unit
@@ -406,3 +408,64 @@ class TestCauchyContinuumModel:
         assert solid.get('alpha') == pytest.approx(1e-6)
 
 
+@pytest.mark.unit
+class TestModelTable:
+    """Test stacking beam models into a ModelTable."""
+
+    @staticmethod
+    def _timoshenko(k):
+        model = TimoshenkoBeamModel()
+        model.name = f'station_{k}'
+        model.ea = 1.0e6 * (k + 1)
+        model.xm2 = 0.1 * k
+        model.stff = (np.eye(6) * (k + 1)).tolist()
+        model.mass = np.full((6, 6), float(k)).tolist()
+        return model
+
+    def test_from_models(self):
+        """Matrices are stacked as (N, 6, 6) and scalars as (N,), NaN if missing."""
+        models = [self._timoshenko(0), None, self._timoshenko(2)]
+
+        table = ModelTable.from_models(models)
+
+        assert len(table) == 3
+        assert table.names == ['station_0', '', 'station_2']
+        assert table['stff'].shape == (3, 6, 6)
+        assert np.array_equal(table['ea'][[0, 2]], [1.0e6, 3.0e6])
+        assert np.isnan(table['ea'][1]) and np.isnan(table['mass'][1]).all()
+        assert np.isnan(table['ga22']).all()
+        assert 'cmpl' not in table
+        assert np.array_equal(table.get('stff22')[[0, 2]], [1.0, 3.0])
+        with pytest.raises(KeyError):
+            table.get('stff77')
+
+    def test_mixed_models(self):
+        """Models of different classes cannot share a table."""
+        with pytest.raises(TypeError):
+            ModelTable.from_models([self._timoshenko(0), EulerBernoulliBeamModel()])
+
+    def test_export_round_trip(self, tmp_path):
+        """Tables are written to CSV and NPZ, and rebuilt into models."""
+        ebm = EulerBernoulliBeamModel(
+            name='root', ea=2.0e9, gj=1.0e6, xm2=0.05,
+            stff=np.diag([2.0e9, 1.0e6, 3.0e6, 4.0e7]).tolist()
+        )
+        table = ModelTable.from_models([ebm, EulerBernoulliBeamModel(name='tip', ea=1.0e9)])
+
+        table.to_csv(tmp_path / 'table.csv')
+        with open(tmp_path / 'table.csv') as file:
+            header = file.readline().strip().split(',')
+            row = file.readline().strip().split(',')
+        assert header[:2] == ['name', 'stff11'] and 'ea' in header
+        assert row[0] == 'root'
+        assert float(row[header.index('ea')]) == 2.0e9
+
+        table.to_npz(tmp_path / 'table.npz')
+        loaded = ModelTable.from_npz(tmp_path / 'table.npz')
+        assert loaded.model_class is EulerBernoulliBeamModel
+        assert loaded.names == ['root', 'tip']
+        np.testing.assert_array_equal(loaded.to_array(), table.to_array())
+
+        root, tip = loaded.to_models()
+        assert root.stff == ebm.stff and root.xm2 == 0.05
+        assert tip.stff is None and tip.gj is None and tip.ea == 1.0e9
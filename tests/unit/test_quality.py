@@ -0,0 +1,198 @@
+"""Test the element quality metrics of SG meshes."""
+import numpy as np
+import pytest
+
+import sgio
+from sgio.core.quality import (
+    HIGHER_ORDER_FACE_CENTERS, QUALITY_METRICS, cell_quality, mesh_quality,
+    quality_summary,
+)
+from sgio.core.topology import CELL_FAMILY_EDGES, cell_family
+
+
+UNIT_CELLS = {
+    'triangle': [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+    'quad': [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+    'tetra': [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    'wedge': [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [0, 1, 1]],
+    'hexahedron': [
+        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+    ],
+}
+
+
+def _quadratic_cell(cell_type):
+    """Points of a unit cell, with the mid-side, face center and center nodes of its type."""
+    family = cell_family(cell_type)
+    corners = np.array(UNIT_CELLS[family], dtype=float)
+    edges = np.array(CELL_FAMILY_EDGES[family])
+    points = corners
+    if cell_type != family:
+        points = np.vstack([corners, corners[edges].mean(axis=1)])
+    if cell_type in HIGHER_ORDER_FACE_CENTERS:
+        faces = np.array(HIGHER_ORDER_FACE_CENTERS[cell_type])
+        points = np.vstack([points, corners[faces].mean(axis=1)])
+    if cell_type in ('quad9', 'hexahedron27'):
+        points = np.vstack([points, corners.mean(axis=0)])
+    return points, np.arange(len(points))[None, :]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'cell_type', ['quad', 'quad8', 'quad9', 'hexahedron', 'hexahedron20', 'hexahedron27']
+)
+def test_cell_quality_regular_cells(cell_type):
+    """Unit squares and cubes, with centered mid-side nodes, have the ideal quality."""
+    points, cells = _quadratic_cell(cell_type)
+
+    quality = cell_quality(points, cells, cell_type)
+
+    assert list(quality) == list(QUALITY_METRICS)
+    np.testing.assert_allclose(quality['aspect_ratio'], [1.0])
+    np.testing.assert_allclose(quality['skewness'], [0.0], atol=1e-12)
+    np.testing.assert_allclose(quality['min_jacobian'], [1.0])
+    np.testing.assert_allclose(quality['warping'], [0.0])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('cell_type', ['triangle6', 'tetra10', 'wedge15', 'wedge18'])
+def test_cell_quality_straight_quadratic_cells(cell_type):
+    """Quadratic cells with centered mid-side nodes have the Jacobian of their linear family."""
+    points, cells = _quadratic_cell(cell_type)
+    family = cell_family(cell_type)
+    linear = cell_quality(points, cells[:, :len(UNIT_CELLS[family])], family)
+
+    quality = cell_quality(points, cells, cell_type)
+
+    np.testing.assert_allclose(quality['min_jacobian'], linear['min_jacobian'])
+
+
+@pytest.mark.unit
+def test_cell_quality_misplaced_mid_side_node():
+    """A misplaced mid-side node lowers the Jacobian of a quad8 with square corners.
+
+    With node 4 moved from (0.5, 0) to (0.5, 0.9), det(J) is 0.025 at the
+    node, against 0.25 at the corners.
+    """
+    points, cells = _quadratic_cell('quad8')
+    points[4] = [0.5, 0.9, 0.0]
+
+    quality = cell_quality(points, cells, 'quad8')
+
+    np.testing.assert_allclose(quality['min_jacobian'], [0.1])
+    # The corners alone are a unit square
+    np.testing.assert_allclose(quality['aspect_ratio'], [1.0])
+    np.testing.assert_allclose(quality['skewness'], [0.0], atol=1e-12)
+
+    # Moved past the opposite side, the cell is inverted near node 4
+    points[4] = [0.5, 1.5, 0.0]
+    assert cell_quality(points, cells, 'quad8')['min_jacobian'][0] < 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('cell_type, node', [('wedge18', 15), ('hexahedron27', 20), ('hexahedron27', 26)])
+def test_cell_quality_misplaced_face_center_node(cell_type, node):
+    """A misplaced face center or center node lowers the Jacobian."""
+    points, cells = _quadratic_cell(cell_type)
+    corner = cell_quality(points, cells, cell_type)['min_jacobian'][0]
+
+    points[node] += 0.3
+
+    assert cell_quality(points, cells, cell_type)['min_jacobian'][0] < min(corner, 0)
+
+
+@pytest.mark.unit
+def test_cell_quality_higher_order_without_shape_functions():
+    """Higher-order types without shape functions get the Jacobian of their corners."""
+    points = np.array(UNIT_CELLS['hexahedron'], dtype=float)
+    cells = np.arange(24)[None, :] % len(points)
+
+    quality = cell_quality(points, cells, 'hexahedron24')
+
+    np.testing.assert_allclose(quality['min_jacobian'], [1.0])
+    np.testing.assert_allclose(quality['aspect_ratio'], [1.0])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('cell_type', ['triangle', 'tetra', 'wedge'])
+def test_cell_quality_right_angled_cells(cell_type):
+    """Right-angled simplices and wedges have positive Jacobians at every corner."""
+    points = np.array(UNIT_CELLS[cell_type], dtype=float)
+    cells = np.arange(len(points))[None, :]
+
+    quality = cell_quality(points, cells, cell_type)
+
+    np.testing.assert_allclose(quality['aspect_ratio'], [np.sqrt(2)])
+    np.testing.assert_allclose(quality['skewness'], [0.25])
+    assert quality['min_jacobian'][0] > 0
+    np.testing.assert_allclose(quality['warping'], [0.0])
+
+
+@pytest.mark.unit
+def test_cell_quality_distorted_cells():
+    """Inverted, skewed and warped cells are measured."""
+    points = np.array(UNIT_CELLS['quad'], dtype=float)
+    points = np.vstack([points, [[2.0, 0.0, 0.0], [3.0, 1.0, 0.0]]])
+    cells = np.array([[0, 3, 2, 1], [1, 4, 5, 2]])
+
+    quality = cell_quality(points, cells, 'quad')
+
+    # Inverted square
+    np.testing.assert_allclose(quality['min_jacobian'][0], -1.0)
+    # Parallelogram with 45 degree angles
+    np.testing.assert_allclose(quality['skewness'][1], 0.5)
+    np.testing.assert_allclose(quality['min_jacobian'][1], np.sqrt(0.5))
+
+    hexahedron = np.array(UNIT_CELLS['hexahedron'], dtype=float)
+    hexahedron[6, 2] = 1.5
+    quality = cell_quality(hexahedron, [np.arange(8)], 'hexahedron')
+    np.testing.assert_allclose(quality['warping'], [np.degrees(np.arctan(0.75))])
+
+
+@pytest.mark.unit
+def test_cell_quality_unsupported_cells():
+    """Unsupported and degenerate cells get NaN."""
+    points = np.array(UNIT_CELLS['triangle'], dtype=float)
+
+    quality = cell_quality(points, [[0, 1]], 'line', metrics=['skewness'])
+    assert list(quality) == ['skewness']
+    assert np.isnan(quality['skewness']).all()
+
+    quality = cell_quality(points, [[0, 0, 1]], 'triangle')
+    assert np.isnan(quality['aspect_ratio']).all()
+    assert np.isnan(quality['min_jacobian']).all()
+
+    with pytest.raises(ValueError, match='Unknown quality metrics'):
+        cell_quality(points, [[0, 1, 2]], 'triangle', metrics=['volume'])
+
+
+@pytest.mark.unit
+def test_mesh_quality_and_summary():
+    """Metrics are aligned with the cell blocks and summarized."""
+    # Cross-section in the yz plane, with one inverted triangle
+    points = np.array([
+        [0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 1.0], [0.0, 0.0, 1.0],
+        [0.0, 2.0, 0.0],
+    ])
+    cells = [
+        ('quad', np.array([[0, 1, 2, 3]])),
+        ('triangle', np.array([[1, 4, 2], [1, 2, 4]])),
+    ]
+    mesh = sgio.SGMesh(points, cells, cell_data={'element_id': [[1], [2, 3]]})
+
+    quality = mesh_quality(mesh, metrics=['min_jacobian', 'aspect_ratio'])
+
+    assert [len(_v) for _v in quality['min_jacobian']] == [1, 2]
+    np.testing.assert_allclose(quality['min_jacobian'][0], [1.0])
+    np.testing.assert_allclose(quality['min_jacobian'][1], [np.sqrt(0.5), -1.0])
+
+    summary = quality_summary(quality, bins=4)
+
+    assert summary['min_jacobian']['count'] == 3
+    np.testing.assert_allclose(summary['min_jacobian']['bin_edges'], [-1.0, -0.5, 0.0, 0.5, 1.0])
+    np.testing.assert_array_equal(summary['min_jacobian']['counts'], [1, 0, 0, 2])
+    np.testing.assert_allclose(summary['aspect_ratio']['max'], np.sqrt(2))
+
+    mesh.cell_data.update(quality)
+    assert len(mesh.cell_data['aspect_ratio']) == len(mesh.cells)
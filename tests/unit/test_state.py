@@ -0,0 +1,102 @@
+"""Test the field data view of State."""
+import numpy as np
+import pytest
+
+from sgio.model.general import State, StateCase, StateData
+
+
+@pytest.mark.unit
+def test_state_data_view_lookup():
+    """Lookups by entity ID match the dict of the data, in any ID order."""
+    data = np.arange(12.0).reshape(4, 3)
+    state = State('e', data, location='element', entity_ids=np.array([7, 2, 9, 4]))
+    expected = {7: [0.0, 1.0, 2.0], 2: [3.0, 4.0, 5.0], 9: [6.0, 7.0, 8.0], 4: [9.0, 10.0, 11.0]}
+
+    view = state.data
+
+    assert isinstance(view, StateData)
+    assert view == expected and expected == view
+    assert list(view) == [7, 2, 9, 4]
+    assert list(view.items()) == list(expected.items())
+    assert view[np.int64(9)] == [6.0, 7.0, 8.0]
+    assert view[4.0] == [9.0, 10.0, 11.0]
+    assert 3 not in view and 'a' not in view
+    assert view.get(3) is None
+    with pytest.raises(KeyError):
+        view[10]
+
+
+@pytest.mark.unit
+def test_state_data_view_cache():
+    """The view is reused until the data or the entity IDs are replaced."""
+    state = State('sr', {1: [0.5], 2: [0.25]}, location='element')
+    assert state.data is state.data
+    assert state.data[2] == [0.25]
+
+    state.addData([0.75], loc=3)
+    assert state.data == {1: [0.5], 2: [0.25], 3: [0.75]}
+
+    state.data = {5: 1.0}
+    assert dict(state.data) == {5: 1.0}
+
+    state.addData([1.0, 2.0])
+    assert state.data == [1.0, 2.0]
+
+
+@pytest.mark.unit
+def test_state_data_view_as_input():
+    """A view can be passed where field data dicts are accepted."""
+    state = State('e', {1: [1.0], 3: [3.0]}, location='element')
+
+    copied = State('e', state.data, location='element')
+    assert copied.data == {1: [1.0], 3: [3.0]}
+
+    state_case = StateCase()
+    state_case.addState('e', data={1: [1.0]}, loc_type='element')
+    state_case.addState('e', data=State('e', {2: [2.0]}).data)
+    assert state_case.getState('e').data == {1: [1.0], 2: [2.0]}
+
+
+@pytest.mark.unit
+def test_state_from_arrays():
+    """Sorted IDs are used as they are; unsorted IDs are sorted with their rows."""
+    ids = np.array([1, 4, 6])
+    values = np.arange(6.0).reshape(3, 2)
+    state = State.from_arrays(ids, values, name='u', location='node')
+    assert state.entity_ids is ids and state.data_array is values
+
+    state = State.from_arrays([6, 1, 4], values, name='u', location='node')
+    np.testing.assert_array_equal(state.entity_ids, [1, 4, 6])
+    np.testing.assert_array_equal(state.data_array, values[[1, 2, 0]])
+
+    with pytest.raises(ValueError, match='Repeated'):
+        State.from_arrays([1, 4, 1], values)
+    with pytest.raises(ValueError):
+        State.from_arrays([1, 4], values)
+
+
+@pytest.mark.unit
+def test_state_from_dict_order():
+    """Dict data is sorted by entity ID, whatever the key order."""
+    assert list(State('e', {3: [3.0], 1: [1.0], 2: [2.0]}).data) == [1, 2, 3]
+    assert list(State('e', {1: [1.0], 2: [2.0], 3: [3.0]}).data) == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_state_concat():
+    """States of cell blocks are merged into one state sorted by ID."""
+    block1 = State.from_arrays([2, 5], [[2.0, 20.0], [5.0, 50.0]], name='e', label=['e11', 'e22'], location='element')
+    block2 = State.from_arrays([1, 3], [[1.0, 10.0], [3.0, 30.0]], name='e', label=['e11', 'e22'], location='element')
+
+    state = State.concat([block1, block2])
+
+    assert state.name == 'e' and state.label == ['e11', 'e22'] and state.location == 'element'
+    np.testing.assert_array_equal(state.entity_ids, [1, 2, 3, 5])
+    assert state.data[3] == [3.0, 30.0]
+
+    with pytest.raises(ValueError, match='Repeated'):
+        State.concat([block1, block1])
+    with pytest.raises(ValueError):
+        State.concat([block1, State.from_arrays([7], [[1.0]], location='element')])
+    with pytest.raises(ValueError):
+        State.concat([block1, State.from_arrays([7], [[1.0, 2.0]], location='node')])
@@ -0,0 +1,119 @@
+"""Test the cached mesh topology (adjacency, edges, faces, boundary)."""
+import numpy as np
+import pytest
+
+import sgio
+from sgio.core.topology import MeshTopology, cell_family
+
+
+def _square_mesh(cell_type='triangle'):
+    """Unit square split into two triangles, or one quad8."""
+    points = np.array([
+        [0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0],
+        [0.5, 0.0, 0.0], [1.0, 0.5, 0.0], [0.5, 1.0, 0.0], [0.0, 0.5, 0.0],
+    ])
+    if cell_type == 'triangle':
+        cells = [('triangle', np.array([[0, 1, 2], [0, 2, 3]]))]
+    else:
+        cells = [('quad8', np.array([[0, 1, 2, 3, 4, 5, 6, 7]]))]
+    return sgio.SGMesh(points, cells)
+
+
+@pytest.mark.unit
+def test_cell_family():
+    assert cell_family('triangle6') == 'triangle'
+    assert cell_family('hexahedron20') == 'hexahedron'
+    assert cell_family('line3') == 'line'
+    with pytest.raises(ValueError, match='Unsupported'):
+        cell_family('polygon')
+
+
+@pytest.mark.unit
+def test_topology_2d_edges_and_boundary():
+    """Shared edges are found once and excluded from the boundary."""
+    topology = _square_mesh().topology
+
+    np.testing.assert_array_equal(
+        topology.edges, [[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]]
+    )
+    np.testing.assert_array_equal(topology.cell_edges(0), [[0, 3, 1], [1, 4, 2]])
+    np.testing.assert_array_equal(topology.boundary_edges(), [0, 2, 3, 4])
+    np.testing.assert_array_equal(topology.boundary_nodes(), [0, 1, 2, 3])
+    np.testing.assert_array_equal(topology.cell_neighbors.neighbors(0), [1])
+    np.testing.assert_array_equal(topology.cell_neighbors.neighbors(1), [0])
+
+    block_id, cell, local = topology.boundary_cells()
+    np.testing.assert_array_equal(cell, [0, 0, 1, 1])
+    np.testing.assert_array_equal(local, [0, 1, 1, 2])
+
+
+@pytest.mark.unit
+def test_topology_quadratic_cells_use_corner_nodes():
+    topology = _square_mesh('quad8').topology
+
+    np.testing.assert_array_equal(topology.edges, [[0, 1], [0, 3], [1, 2], [2, 3]])
+    np.testing.assert_array_equal(topology.boundary_nodes(), [0, 1, 2, 3])
+
+
+@pytest.mark.unit
+def test_topology_skips_unsupported_blocks():
+    """Blocks of unsupported cell types, e.g. Gmsh vertices, are left out."""
+    mesh = _square_mesh()
+    mesh = sgio.SGMesh(mesh.points, [('vertex', np.array([[0], [2]]))] + mesh.cells)
+    topology = mesh.topology
+
+    assert topology.families == [None, 'triangle']
+    np.testing.assert_array_equal(
+        topology.edges, [[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]]
+    )
+    np.testing.assert_array_equal(topology.boundary_edges(), [0, 2, 3, 4])
+    np.testing.assert_array_equal(topology.boundary_nodes(), [0, 1, 2, 3])
+    np.testing.assert_array_equal(topology.cell_neighbors.neighbors(0), [])
+    np.testing.assert_array_equal(topology.cell_neighbors.neighbors(2), [3])
+
+    vertices = sgio.SGMesh(mesh.points, [('vertex', np.array([[0], [2]]))]).topology
+    assert len(vertices.edges) == 0
+    assert len(vertices.boundary_nodes()) == 0
+
+
+@pytest.mark.unit
+def test_topology_3d_faces_and_boundary():
+    """Two hexahedra share one face; a tetra on top shares a triangle with neither."""
+    points = np.array(
+        [[x, y, z] for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0, 2.0)]
+        + [[0.5, 0.5, 2.0]]
+    )
+    # Node index: x + 3*y + 6*z
+    hexa = np.array([
+        [0, 1, 4, 3, 6, 7, 10, 9],
+        [1, 2, 5, 4, 7, 8, 11, 10],
+    ])
+    tetra = np.array([[6, 7, 9, 12]])
+    mesh = sgio.SGMesh(points, [('hexahedron', hexa), ('tetra', tetra)])
+    topology = mesh.topology
+
+    assert topology.ncells == 3
+    assert len(topology.faces) == 11 + 4
+    # 10 boundary hexahedron faces and 4 tetra faces
+    assert len(topology.boundary_faces()) == 14
+    np.testing.assert_array_equal(topology.cell_neighbors.neighbors(0), [1])
+    np.testing.assert_array_equal(topology.cell_neighbors.neighbors(2), [])
+    block_id, cell = topology.cell_index([0, 2])
+    np.testing.assert_array_equal(block_id, [0, 1])
+    np.testing.assert_array_equal(cell, [0, 0])
+    # Triangular faces are padded with -1
+    assert (topology.faces[topology.cell_faces(1)][..., 0] == -1).all()
+
+
+@pytest.mark.unit
+def test_topology_cache():
+    """The topology is rebuilt only when the connectivity is replaced."""
+    mesh = _square_mesh()
+    topology = mesh.topology
+
+    assert mesh.topology is topology
+    assert isinstance(topology, MeshTopology)
+
+    mesh.cells[0].data = np.array([[0, 1, 2]])
+    assert mesh.topology is not topology
+    assert len(mesh.topology.boundary_edges()) == 3